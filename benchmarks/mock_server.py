@@ -0,0 +1,340 @@
+"""
+Local stand-in for the external APIs used by the pipeline (NewsAPI, OpenWeatherMap,
+Eventbrite, Todoist, ZenQuotes and the OpenAI chat/responses endpoints).
+
+The server answers with synthetic but well-formed payloads, so the whole
+pipeline can be benchmarked offline. Latency, jitter, error rate and payload
+sizes are configurable via :class:`MockConfig`. Every service lives under its
+own path prefix (``/newsapi/v2/``, ``/openai/v1/``, ...); see :meth:`MockAPIServer.urls`.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+_VOCABULARY = (
+    "zurich innovation startup research climate energy quantum robotics health finance policy election "
+    "market chip software security privacy cloud model data network mobility transport housing culture "
+    "museum festival science university bank inflation trade vaccine satellite battery solar wind city "
+    "council budget court school football concert theatre design fashion food water forest mountain lake"
+).split()
+
+
+class MockConfig:
+    """
+    Behaviour of the mock server.
+
+    Args:
+        latency_ms: Base latency of every response.
+        jitter_ms: Uniform jitter added to (or subtracted from) the latency.
+        error_rate: Share of requests answered with ``503`` (retried by the HTTP clients).
+        article_count: Total results NewsAPI reports per query.
+        text_chars: Approximate length of descriptions, summaries and written articles.
+        events: Number of events returned by Eventbrite and the OpenAI event searches.
+        seed: Seed for payloads, jitter and errors (runs are reproducible).
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        article_count: int = 100,
+        text_chars: int = 400,
+        events: int = 5,
+        seed: int = 42,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.article_count = article_count
+        self.text_chars = text_chars
+        self.events = events
+        self.seed = seed
+
+
+def _text(rng: random.Random, chars: int) -> str:
+    words: List[str] = []
+    length = 0
+    while length < chars:
+        word = rng.choice(_VOCABULARY)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words).capitalize() + "."
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    # --- Infrastruktur ---
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _delay_or_fail(self) -> bool:
+        """Simulates latency; returns True if the request was answered with an error."""
+        config = self.server.config
+        with self.server.lock:
+            jitter = self.server.rng.uniform(-config.jitter_ms, config.jitter_ms) if config.jitter_ms else 0.0
+            failed = config.error_rate > 0 and self.server.rng.random() < config.error_rate
+            self.server.request_count += 1
+        delay = max(0.0, config.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+        if failed:
+            with self.server.lock:
+                self.server.error_count += 1
+            body = b'{"error": "simulated outage"}'
+            self.send_response(503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        return failed
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        if self._delay_or_fail():
+            return
+        path = parts.path
+        if path.startswith("/newsapi/"):
+            self._send_json(self._newsapi(path, query))
+        elif path.startswith("/openweathermap/"):
+            self._send_json(self._weather())
+        elif path.startswith("/eventbrite/"):
+            self._send_json({"events": self._eventbrite()})
+        elif path.startswith("/todoist/"):
+            self._send_json([{"id": i, "content": f"Aufgabe {i}"} for i in range(1, 6)])
+        elif path.startswith("/zenquotes/"):
+            self._send_json([{"q": "Simplicity is the soul of efficiency.", "a": "Austin Freeman"}])
+        else:
+            self._send_json({"error": f"unknown path {path}"}, status=404)
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path
+        payload = self._read_json()
+        if self._delay_or_fail():
+            return
+        if path.endswith("/chat/completions"):
+            self._send_json(self._chat_completion(payload))
+        elif path.endswith("/responses"):
+            self._send_json(self._response(payload))
+        else:
+            self._send_json({"error": f"unknown path {path}"}, status=404)
+
+    # --- Datenquellen ---
+
+    def _newsapi(self, path: str, query: Dict[str, str]) -> Dict[str, Any]:
+        config = self.server.config
+        page = int(query.get("page", 1))
+        page_size = int(query.get("pageSize", 20))
+        topic = query.get("q") or query.get("category") or path.rsplit("/", 1)[-1]
+        start = (page - 1) * page_size
+        count = max(0, min(page_size, config.article_count - start))
+        now = datetime.now(timezone.utc)
+        articles = []
+        for idx in range(start, start + count):
+            rng = random.Random(f"{config.seed}|{topic}|{idx}")
+            articles.append({
+                "source": {"id": None, "name": f"Mock Source {idx % 7}"},
+                "title": _text(rng, 60),
+                "description": _text(rng, config.text_chars),
+                "content": _text(rng, config.text_chars // 2),
+                "url": f"https://news.example.com/{abs(hash(topic)) % 10_000}/{idx}",
+                "urlToImage": None,
+                "publishedAt": (now - timedelta(minutes=idx)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            })
+        return {"status": "ok", "totalResults": config.article_count, "articles": articles}
+
+    def _weather(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        entries = []
+        for step in range(16):
+            ts = now + timedelta(hours=3 * step)
+            entries.append({
+                "dt_txt": ts.strftime("%Y-%m-%d %H:%M:%S"),
+                "main": {"temp": 12.5 + step % 5, "humidity": 60},
+                "weather": [{"description": "leichter Regen", "icon": "10d"}],
+                "wind": {"speed": 3.2},
+            })
+        return {"list": entries}
+
+    def _event_items(self, prefix: str) -> List[Tuple[str, datetime, str]]:
+        config = self.server.config
+        start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        return [
+            (f"{prefix} Event {idx}", start + timedelta(days=1 + idx % 10, hours=idx % 5), f"Venue {idx % 3}")
+            for idx in range(config.events)
+        ]
+
+    def _eventbrite(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": {"text": title},
+                "description": {"text": _text(random.Random(title), self.server.config.text_chars // 2)},
+                "start": {"utc": start.strftime("%Y-%m-%dT%H:%M:%SZ")},
+                "end": {"utc": (start + timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%SZ")},
+                "url": f"https://events.example.com/{idx}",
+                "venue": {"address": {"localized_address_display": venue}},
+            }
+            for idx, (title, start, venue) in enumerate(self._event_items("Meetup"))
+        ]
+
+    # --- OpenAI ---
+
+    def _chat_text(self, prompt: str) -> str:
+        """Answers the prompts of the LangChain agents in the format they expect."""
+        config = self.server.config
+        rng = random.Random(f"{config.seed}|{len(prompt)}|{prompt[-80:]}")
+        categories = re.findall(r"'([^']+)'", prompt.split("Vorgegebene Kategorien:", 1)[-1].split("]", 1)[0])
+        if "JSON-ANTWORT (nur das JSON-Array)" in prompt:
+            ids = [int(i) for i in re.findall(r"\[ID (\d+)\]", prompt)]
+            return json.dumps([
+                {"id": i, "category": rng.choice(categories or ["Sonstiges"]), "importance": rng.randint(1, 10)} for i in ids
+            ])
+        if "JSON-ANTWORT" in prompt:
+            return json.dumps({"category": rng.choice(categories or ["Sonstiges"]), "importance": rng.randint(1, 10)})
+        if '"index"' in prompt and "EVENTS:" in prompt:
+            indices = [int(i) for i in re.findall(r"^\[(\d+)\]$", prompt, flags=re.MULTILINE)]
+            return json.dumps([{"index": i, "score": rng.randint(1, 10)} for i in indices])
+        if "Return only the number" in prompt:
+            return str(rng.randint(1, 10))
+        return _text(rng, max(40, config.text_chars // 2))
+
+    def _chat_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        messages = payload.get("messages") or []
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        text = self._chat_text(prompt)
+        prompt_tokens, completion_tokens = _estimate_tokens(prompt), _estimate_tokens(text)
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "mock"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _response(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        prompt = payload.get("input") if isinstance(payload.get("input"), str) else json.dumps(payload.get("input"))
+        if "JSON list" in prompt:
+            text = json.dumps([
+                {"title": title, "start_time": start.isoformat(), "location": venue, "url": f"https://web.example.com/{idx}"}
+                for idx, (title, start, venue) in enumerate(self._event_items("Web"))
+            ])
+        else:
+            text = _text(random.Random(prompt[-80:]), self.server.config.text_chars * 3)
+        input_tokens, output_tokens = _estimate_tokens(prompt), _estimate_tokens(text)
+        return {
+            "id": "resp-mock",
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": payload.get("model", "mock"),
+            "status": "completed",
+            "output": [{
+                "id": "msg-mock",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens_details": {"reasoning_tokens": 0},
+            },
+        }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: MockConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.error_count = 0
+
+
+class MockAPIServer:
+    """Runs the mock APIs in a background thread (usable as context manager)."""
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self._server = _Server((host, port), self.config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self._server.request_count
+
+    @property
+    def error_count(self) -> int:
+        return self._server.error_count
+
+    def urls(self) -> Dict[str, str]:
+        """Base URLs of the individual services."""
+        return {
+            "newsapi": f"{self.base_url}/newsapi/v2/",
+            "openweathermap": f"{self.base_url}/openweathermap/data/2.5/forecast",
+            "eventbrite": f"{self.base_url}/eventbrite/v3/events/search/",
+            "todoist": f"{self.base_url}/todoist/rest/v2/tasks",
+            "zenquotes": f"{self.base_url}/zenquotes/api/today",
+            "openai": f"{self.base_url}/openai/v1",
+        }
+
+    def start(self) -> "MockAPIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
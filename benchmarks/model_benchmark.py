@@ -0,0 +1,314 @@
+"""
+Micro-benchmarks for the Pydantic models in ``src/models/data_models.py``.
+
+Covers the ingestion hot paths: ``ensure_timezone_aware`` on the timestamp
+shapes the sources deliver, ``HttpUrl`` validation, construction of
+``RawArticle`` (via the NewsAPI parser), ``ProcessedArticle`` and ``Event``
+from raw API JSON, and ``model_copy``/serialisation. Inputs cycle through a
+pool of distinct items (at most ``POOL_SIZE``), so 1M-item runs do not need
+1M input dicts in memory.
+
+Results are reported in microseconds per item (best of ``--repeats``) and can
+be stored as baseline and compared against it::
+
+    python -m benchmarks.model_benchmark --sizes 10000 100000 --save-baseline
+    python -m benchmarks.model_benchmark --sizes 10000 100000 1000000 --compare
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pydantic  # noqa: E402
+from pydantic import HttpUrl, TypeAdapter  # noqa: E402
+
+from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher  # noqa: E402
+from src.models.data_models import Event, ProcessedArticle, RawArticle, ensure_timezone_aware  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "model_benchmark.json")
+POOL_SIZE = 50_000
+
+_BASE_TIME = datetime(2025, 6, 4, 6, 0, tzinfo=timezone.utc)
+
+
+def _timestamp(idx: int) -> datetime:
+    # NewsAPI-Zeitstempel wiederholen sich innerhalb einer Antwort häufig (minutengenau)
+    return _BASE_TIME + timedelta(minutes=idx % 1440)
+
+
+def newsapi_items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "source": {"id": None if idx % 3 else "heise", "name": f"Quelle {idx % 40}"},
+            "title": f"Schlagzeile Nummer {idx} über Technologie und Politik",
+            "description": "Eine kurze Beschreibung des Artikels mit ein paar Sätzen Inhalt. " * 3,
+            "content": "Ausschnitt aus dem Artikeltext … [+1234 chars]",
+            "url": f"https://news.example.com/{idx % 97}/artikel-{idx}.html",
+            "urlToImage": f"https://img.example.com/{idx}.jpg" if idx % 2 else None,
+            "publishedAt": _timestamp(idx).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        for idx in range(count)
+    ]
+
+
+def eventbrite_items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": {"text": f"Meetup {idx}"},
+            "description": {"text": "Treffen der lokalen Community mit Vorträgen und Apéro."},
+            "start": {"utc": _timestamp(idx).strftime("%Y-%m-%dT%H:%M:%SZ")},
+            "end": {"utc": (_timestamp(idx) + timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%SZ")},
+            "url": f"https://www.eventbrite.com/e/{100000 + idx}",
+            "venue": {"address": {"localized_address_display": f"Strasse {idx % 50}, 8000 Zürich"}},
+        }
+        for idx in range(count)
+    ]
+
+
+def _cycle(items: List[Any], size: int) -> Callable[[Callable[[Any], Any]], Callable[[], None]]:
+    """Builds a timed loop applying ``func`` to ``size`` items drawn from the pool."""
+    pool_len = len(items)
+
+    def bind(func: Callable[[Any], Any]) -> Callable[[], None]:
+        def run() -> None:
+            for idx in range(size):
+                func(items[idx % pool_len])
+
+        return run
+
+    return bind
+
+
+def _newsapi_parser() -> NewsAPIFetcher:
+    # Nur der Parser wird gebraucht; kein API-Schlüssel notwendig
+    fetcher = object.__new__(NewsAPIFetcher)
+    fetcher.source_name = "Benchmark"
+    return fetcher
+
+
+def _timestamps(size: int, fmt: str) -> Callable[[], None]:
+    values = [_timestamp(idx).strftime(fmt) for idx in range(min(size, POOL_SIZE))]
+    return _cycle(values, size)(ensure_timezone_aware)
+
+
+def bench_parse_iso_z(size: int) -> Callable[[], None]:
+    return _timestamps(size, "%Y-%m-%dT%H:%M:%SZ")
+
+
+def bench_parse_iso_offset(size: int) -> Callable[[], None]:
+    return _timestamps(size, "%Y-%m-%dT%H:%M:%S+02:00")
+
+
+def bench_parse_space_separated(size: int) -> Callable[[], None]:
+    return _timestamps(size, "%Y-%m-%d %H:%M:%S")
+
+
+def bench_parse_invalid(size: int) -> Callable[[], None]:
+    values = [f"{idx % 28 + 1}. Juni 2025" for idx in range(min(size, POOL_SIZE))]
+    return _cycle(values, size)(ensure_timezone_aware)
+
+
+def bench_httpurl(size: int) -> Callable[[], None]:
+    adapter = TypeAdapter(HttpUrl)
+    urls = [item["url"] for item in newsapi_items(min(size, POOL_SIZE))]
+    return _cycle(urls, size)(adapter.validate_python)
+
+
+def bench_raw_article_newsapi(size: int) -> Callable[[], None]:
+    return _cycle(newsapi_items(min(size, POOL_SIZE)), size)(_newsapi_parser()._parse_article)
+
+
+def bench_raw_article_without_urls(size: int) -> Callable[[], None]:
+    def build(item: Dict[str, Any]) -> RawArticle:
+        return RawArticle(
+            title=item["title"],
+            description=item["description"],
+            content_snippet=item["content"],
+            published_at=item["publishedAt"],
+            source_name=item["source"]["name"],
+        )
+
+    return _cycle(newsapi_items(min(size, POOL_SIZE)), size)(build)
+
+
+def bench_processed_article(size: int) -> Callable[[], None]:
+    parser = _newsapi_parser()
+    raws = [parser._parse_article(item) for item in newsapi_items(min(size, POOL_SIZE))]
+
+    def build(raw: RawArticle) -> ProcessedArticle:
+        return ProcessedArticle(
+            title=raw.title,
+            url=raw.url,
+            summary=raw.description,
+            category="IT & AI",
+            relevance_score=7.0,
+            source_name=raw.source_name,
+            published_at=raw.published_at,
+            image_url=raw.image_url,
+        )
+
+    return _cycle(raws, size)(build)
+
+
+def bench_event_eventbrite(size: int) -> Callable[[], None]:
+    def build(item: Dict[str, Any]) -> Event:
+        return Event(
+            summary=item["name"]["text"],
+            start_time=item["start"]["utc"],
+            end_time=item["end"]["utc"],
+            location=item["venue"]["address"]["localized_address_display"],
+            description=item["description"]["text"],
+            url=item["url"],
+            source="Eventbrite",
+        )
+
+    return _cycle(eventbrite_items(min(size, POOL_SIZE)), size)(build)
+
+
+def _processed_pool(size: int) -> List[ProcessedArticle]:
+    parser = _newsapi_parser()
+    return [
+        ProcessedArticle(title=raw.title, url=raw.url, summary=raw.description, published_at=raw.published_at)
+        for raw in (parser._parse_article(item) for item in newsapi_items(min(size, POOL_SIZE)))
+    ]
+
+
+def bench_model_copy(size: int) -> Callable[[], None]:
+    return _cycle(_processed_pool(size), size)(lambda a: a.model_copy(update={"category": "Wirtschaft"}))
+
+
+def bench_model_dump_json(size: int) -> Callable[[], None]:
+    return _cycle(_processed_pool(size), size)(lambda a: a.model_dump_json())
+
+
+def bench_model_validate_json(size: int) -> Callable[[], None]:
+    payloads = [a.model_dump_json() for a in _processed_pool(size)]
+    return _cycle(payloads, size)(ProcessedArticle.model_validate_json)
+
+
+BENCHMARKS: Dict[str, Callable[[int], Callable[[], None]]] = {
+    "parse_iso_z": bench_parse_iso_z,
+    "parse_iso_offset": bench_parse_iso_offset,
+    "parse_space_separated": bench_parse_space_separated,
+    "parse_invalid": bench_parse_invalid,
+    "httpurl": bench_httpurl,
+    "raw_article_newsapi": bench_raw_article_newsapi,
+    "raw_article_without_urls": bench_raw_article_without_urls,
+    "processed_article": bench_processed_article,
+    "event_eventbrite": bench_event_eventbrite,
+    "model_copy": bench_model_copy,
+    "model_dump_json": bench_model_dump_json,
+    "model_validate_json": bench_model_validate_json,
+}
+
+
+def measure(run: Callable[[], None], repeats: int) -> float:
+    """Best wall time of ``repeats`` executions in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes: Sequence[int], repeats: int = 3, only: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Runs the selected benchmarks; results are microseconds per item keyed by name and size."""
+    results: Dict[str, Dict[str, float]] = {}
+    for name, setup in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        for size in sizes:
+            seconds = measure(setup(size), repeats)
+            results.setdefault(name, {})[str(size)] = round(seconds / size * 1_000_000, 3)
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.5) -> List[str]:
+    """Lists every benchmark/size that is more than ``tolerance`` slower than the baseline."""
+    regressions = []
+    for name, sizes in report["results"].items():
+        for size, value in sizes.items():
+            reference = baseline.get("results", {}).get(name, {}).get(size)
+            if reference and value > reference * (1 + tolerance):
+                regressions.append(f"{name} @ {size}: {value:.3f} µs/Item statt {reference:.3f} µs/Item (+{value / reference - 1:.0%})")
+    return regressions
+
+
+def format_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    sizes = sorted({int(size) for values in report["results"].values() for size in values})
+    header = f"{'Benchmark':<26}" + "".join(f"{f'{size:,} µs/Item':>18}" for size in sizes)
+    lines = [header, "-" * len(header)]
+    for name, values in report["results"].items():
+        cells = []
+        for size in sizes:
+            value = values.get(str(size))
+            reference = (baseline or {}).get("results", {}).get(name, {}).get(str(size))
+            cell = "" if value is None else f"{value:.3f}"
+            if value is not None and reference:
+                cell += f" ({value / reference - 1:+.0%})"
+            cells.append(f"{cell:>18}")
+        lines.append(f"{name:<26}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def _load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-Benchmarks der Datenmodelle")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="nur diese Benchmarks ausführen")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Pfad der Baseline-Datei")
+    parser.add_argument("--save-baseline", action="store_true", help="Ergebnisse als neue Baseline speichern")
+    parser.add_argument("--compare", action="store_true", help="Exit-Code 1 bei Regressionen gegenüber der Baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="erlaubte Verlangsamung (Anteil, Default 0.5)")
+    args = parser.parse_args(argv)
+
+    # Warnungen ungültiger Zeitstempel nicht ausgeben (das Formatieren der Meldung wird weiterhin gemessen)
+    logging.basicConfig(level=logging.ERROR)
+    report = run_benchmarks(args.sizes, args.repeats, args.only)
+    baseline = _load_baseline(args.baseline)
+    print(format_report(report, baseline))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Baseline gespeichert: {args.baseline}")
+    if args.compare:
+        if baseline is None:
+            print(f"Keine Baseline unter {args.baseline} gefunden.")
+            return 1
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
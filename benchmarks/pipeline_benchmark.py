@@ -0,0 +1,244 @@
+"""
+End-to-end benchmark of ``NewsletterOrchestrator.run_pipeline`` against the
+local mock APIs (see :mod:`benchmarks.mock_server`).
+
+Every run uses a fresh cache directory, so LLM and HTTP caches start cold;
+an uncounted warm-up run absorbs one-off import costs.
+Reported are the stage latencies of the stage graph, the total wall time
+(p50/p95 over the repetitions), the number of mock API requests and the
+peak Python heap measured with ``tracemalloc``.
+
+Example::
+
+    python -m benchmarks.pipeline_benchmark --sizes 10 100 1000 --repeats 3 --latency-ms 40 --jitter-ms 20
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.mock_server import MockAPIServer, MockConfig  # noqa: E402
+
+# Die drei NewsAPI-Abfragen des Orchestrators teilen sich die Artikelmenge
+NEWS_QUERIES = 3
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (exact for small samples)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextmanager
+def patched_environment(values: Dict[str, str]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@contextmanager
+def patched_base_urls(urls: Dict[str, str]) -> Iterator[None]:
+    """Points the fetcher classes at the mock server."""
+    from src.agents.data_fetchers.eventbrite_fetcher import EventbriteFetcher
+    from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
+    from src.agents.data_fetchers.openweathermap_fetcher import OpenWeatherMapFetcher
+    from src.agents.data_fetchers.todoist_fetcher import TodoistFetcher
+    from src.agents.data_fetchers.zenquotes_fetcher import ZenQuotesFetcher
+
+    targets = [
+        (NewsAPIFetcher, "BASE_URL", urls["newsapi"]),
+        (OpenWeatherMapFetcher, "BASE_URL", urls["openweathermap"]),
+        (EventbriteFetcher, "BASE_URL", urls["eventbrite"]),
+        (TodoistFetcher, "API_URL", urls["todoist"]),
+        (ZenQuotesFetcher, "BASE_URL", urls["zenquotes"]),
+    ]
+    previous = [(cls, attr, getattr(cls, attr)) for cls, attr, _ in targets]
+    for cls, attr, url in targets:
+        setattr(cls, attr, url)
+    try:
+        yield
+    finally:
+        for cls, attr, url in previous:
+            setattr(cls, attr, url)
+
+
+def benchmark_environment(server: MockAPIServer, articles: int, workdir: str) -> Dict[str, str]:
+    """Environment variables for one run with ``articles`` news articles in total."""
+    urls = server.urls()
+    return {
+        "OPENAI_API_KEY": "sk-benchmark",
+        "OPENAI_BASE_URL": urls["openai"],
+        "NEWSAPI_API_KEY": "benchmark",
+        "OPENWEATHER_API_KEY": "benchmark",
+        "EVENTBRITE_OAUTH_TOKEN": "benchmark",
+        "TODOIST_API_TOKEN": "benchmark",
+        "NEWSAPI_MAX_ARTICLES": str(math.ceil(articles / NEWS_QUERIES)),
+        "EVENT_LINKS": f"{server.base_url}/site/a,{server.base_url}/site/b",
+        "NEWSLETTER_OUTPUT_FORMAT": "txt",
+        "NEWSLETTER_CACHE_DIR": os.path.join(workdir, "cache"),
+        "PIPELINE_PROFILE_DIR": os.path.join(workdir, "profiles"),
+        "PIPELINE_CHECKPOINT_DIR": os.path.join(workdir, "checkpoints"),
+        "ARTICLE_WRITER_STREAM": "false",
+        "NEWS_INCREMENTAL": "false",
+    }
+
+
+def run_once(server: MockAPIServer, articles: int, trace_memory: bool = True) -> Dict[str, Any]:
+    """Runs the pipeline once and returns wall time, stage timings, requests and peak memory."""
+    from src.orchestrator import NewsletterOrchestrator
+
+    server.config.article_count = math.ceil(articles / NEWS_QUERIES)
+    requests_before = server.request_count
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="newsletter-bench-") as workdir:
+        os.makedirs(os.path.join(workdir, "tmp"))
+        os.chdir(workdir)  # Der Text-Newsletter wird relativ nach tmp/ geschrieben
+        try:
+            with patched_environment(benchmark_environment(server, articles, workdir)), patched_base_urls(server.urls()):
+                if trace_memory:
+                    tracemalloc.start()
+                start = time.perf_counter()
+                try:
+                    orchestrator = NewsletterOrchestrator()
+                    result = orchestrator.run_pipeline()
+                    wall = time.perf_counter() - start
+                    peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+                finally:
+                    if trace_memory:
+                        tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+    stage_graph = orchestrator.stage_graph
+    usage = orchestrator.usage_ledger.summary() if orchestrator.usage_ledger else {}
+    return {
+        "articles": articles,
+        "result": result,
+        "wall_seconds": wall,
+        "stages": dict(stage_graph.timings) if stage_graph else {},
+        "summarized": len(stage_graph.results.get("summarize") or []) if stage_graph else 0,
+        "requests": server.request_count - requests_before,
+        "llm_calls": usage.get("calls", 0),
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """p50/p95 of the total and of every stage over the repetitions of one size."""
+    stage_names: List[str] = []
+    for run in runs:
+        stage_names.extend(name for name in run["stages"] if name not in stage_names)
+    walls = [run["wall_seconds"] for run in runs]
+    return {
+        "articles": runs[0]["articles"],
+        "repeats": len(runs),
+        "summarized": runs[-1]["summarized"],
+        "requests": runs[-1]["requests"],
+        "llm_calls": runs[-1]["llm_calls"],
+        "wall_p50": percentile(walls, 50),
+        "wall_p95": percentile(walls, 95),
+        "peak_memory_mb": max(run["peak_memory_mb"] for run in runs),
+        "stages": {
+            name: {
+                "p50": percentile([run["stages"].get(name, 0.0) for run in runs], 50),
+                "p95": percentile([run["stages"].get(name, 0.0) for run in runs], 95),
+            }
+            for name in stage_names
+        },
+    }
+
+
+def run_benchmark(
+    sizes: Sequence[int],
+    repeats: int = 3,
+    config: Optional[MockConfig] = None,
+    trace_memory: bool = True,
+    warmup: bool = True,
+) -> Dict[str, Any]:
+    config = config or MockConfig()
+    results = []
+    with MockAPIServer(config) as server:
+        if warmup:
+            # Der erste Lauf zahlt für Modul-Importe und Client-Initialisierung
+            run_once(server, min(sizes), trace_memory=False)
+        for size in sizes:
+            runs = [run_once(server, size, trace_memory=trace_memory) for _ in range(repeats)]
+            results.append(summarize_runs(runs))
+        errors = server.error_count
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "mock": vars(config),
+        "mock_errors": errors,
+        "results": results,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = []
+    for entry in report["results"]:
+        lines.append(
+            f"{entry['articles']} Artikel ({entry['repeats']} Läufe): p50 {entry['wall_p50']:.2f}s, "
+            f"p95 {entry['wall_p95']:.2f}s, Peak {entry['peak_memory_mb']:.1f} MB, "
+            f"{entry['requests']} Requests, {entry['llm_calls']} LLM-Aufrufe, {entry['summarized']} zusammengefasst"
+        )
+        for name, stats in entry["stages"].items():
+            lines.append(f"    {name:<16} p50 {stats['p50']:>7.3f}s   p95 {stats['p95']:>7.3f}s")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Artikel pro Lauf")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil der Requests mit HTTP 503")
+    parser.add_argument("--text-chars", type=int, default=400, help="Länge der Beschreibungen und Zusammenfassungen")
+    parser.add_argument("--events", type=int, default=5, help="Events pro Event-Quelle")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc deaktivieren (geringerer Overhead)")
+    parser.add_argument("--no-warmup", action="store_true", help="keinen unbewerteten Aufwärmlauf ausführen")
+    parser.add_argument("--output", help="JSON-Bericht zusätzlich in diese Datei schreiben")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        text_chars=args.text_chars,
+        events=args.events,
+        seed=args.seed,
+    )
+    report = run_benchmark(args.sizes, args.repeats, config, trace_memory=not args.no_memory, warmup=not args.no_warmup)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Benchmark of the columnar snapshot format (``src/utils/snapshot.py``) against
+JSON via ``model_dump_json``/``model_validate_json``.
+
+For collections of ``ProcessedArticle``, ``Event`` and ``WeatherInfo`` it
+reports dump and load time in microseconds per item (best of ``--repeats``,
+garbage collection paused while timing, like ``timeit``) and the size in
+bytes per item::
+
+    python -m benchmarks.snapshot_benchmark --sizes 1000 100000
+
+Formats:
+
+- ``json_lines``: one ``model_dump_json`` document per item, loaded with
+  ``model_validate_json``
+- ``json_gzip``: the same, gzip-compressed (level 1)
+- ``snapshot``: ``snapshot.dumps``, loaded with validation
+- ``snapshot_trusted``: ``snapshot.dumps``, loaded with ``trusted=True``
+"""
+
+import argparse
+import gc
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from pydantic import BaseModel  # noqa: E402
+
+from benchmarks.model_benchmark import POOL_SIZE, _processed_pool, _timestamp, eventbrite_items  # noqa: E402
+from src.models.data_models import Event, ProcessedArticle, WeatherInfo  # noqa: E402
+from src.utils import snapshot  # noqa: E402
+
+CATEGORIES = ["IT & AI", "Welt und Politik", "Wirtschaft", "Zürich Inside", "Kultur und Inspiration"]
+
+
+def processed_articles(size: int) -> List[ProcessedArticle]:
+    pool = [
+        article.model_copy(update={
+            "category": CATEGORIES[idx % len(CATEGORIES)],
+            "relevance_score": float(idx % 11),
+            "source_name": f"Quelle {idx % 40}",
+            "llm_processing_details": {"model": "gpt-4o-mini"} if idx % 4 == 0 else {},
+            "related_sources": [f"Quelle {(idx + 1) % 40}"] if idx % 5 == 0 else [],
+        })
+        for idx, article in enumerate(_processed_pool(size))
+    ]
+    return [pool[idx % len(pool)] for idx in range(size)]
+
+
+def events(size: int) -> List[Event]:
+    pool = [
+        Event(
+            summary=item["name"]["text"],
+            start_time=item["start"]["utc"],
+            end_time=item["end"]["utc"],
+            location=item["venue"]["address"]["localized_address_display"],
+            description=item["description"]["text"],
+            url=item["url"],
+            source="Eventbrite",
+            sources=["Eventbrite"],
+        )
+        for item in eventbrite_items(min(size, POOL_SIZE))
+    ]
+    return [pool[idx % len(pool)] for idx in range(size)]
+
+
+def weather(size: int) -> List[WeatherInfo]:
+    pool = [
+        WeatherInfo(
+            location="Zürich",
+            temperature_celsius=round(-5 + (idx % 300) / 10, 1),
+            condition=["Sonnig", "Bewölkt", "Regen", "Nebel"][idx % 4],
+            humidity_percent=float(40 + idx % 50),
+            wind_speed_kmh=float(idx % 30),
+            icon_url=f"https://openweathermap.org/img/wn/{idx % 10:02d}d@2x.png",
+            forecast_snippet=f"Vorhersage {(_timestamp(idx) + timedelta(days=1)):%d.%m.}",
+        )
+        for idx in range(min(size, POOL_SIZE))
+    ]
+    return [pool[idx % len(pool)] for idx in range(size)]
+
+
+DATASETS: Dict[str, Tuple[Type[BaseModel], Callable[[int], List[BaseModel]]]] = {
+    "ProcessedArticle": (ProcessedArticle, processed_articles),
+    "Event": (Event, events),
+    "WeatherInfo": (WeatherInfo, weather),
+}
+
+
+def _json_formats(model: Type[BaseModel]) -> Dict[str, Tuple[Callable[[List[BaseModel]], bytes], Callable[[bytes], Any]]]:
+    def dump_lines(items: List[BaseModel]) -> bytes:
+        return "\n".join(item.model_dump_json() for item in items).encode("utf-8")
+
+    def load_lines(data: bytes) -> List[BaseModel]:
+        return [model.model_validate_json(line) for line in data.splitlines()]
+
+    return {
+        "json_lines": (dump_lines, load_lines),
+        "json_gzip": (lambda items: gzip.compress(dump_lines(items), 1), lambda data: load_lines(gzip.decompress(data))),
+        "snapshot": (snapshot.dumps, snapshot.loads),
+        "snapshot_trusted": (snapshot.dumps, lambda data: snapshot.loads(data, trusted=True)),
+    }
+
+
+def measure(run: Callable[[], Any], repeats: int) -> float:
+    """Best wall time of ``repeats`` executions in seconds (GC paused while timing)."""
+    best = float("inf")
+    for _ in range(repeats):
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return best
+
+
+def run_benchmark(sizes: Sequence[int], repeats: int = 3, only: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Results keyed by dataset, format and size: dump/load µs per item and bytes per item."""
+    results: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}
+    for name, (model, build) in DATASETS.items():
+        if only and name not in only:
+            continue
+        for size in sizes:
+            items = build(size)
+            for fmt, (dump, load) in _json_formats(model).items():
+                data = dump(items)
+                if load(data) != items:
+                    raise AssertionError(f"{fmt} liefert für {name} nicht dieselben Daten zurück.")
+                results.setdefault(name, {}).setdefault(fmt, {})[str(size)] = {
+                    "dump_us": round(measure(lambda: dump(items), repeats) / size * 1_000_000, 3),
+                    "load_us": round(measure(lambda: load(data), repeats) / size * 1_000_000, 3),
+                    "bytes": round(len(data) / size, 1),
+                }
+    return {"repeats": repeats, "results": results}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    header = f"{'Datensatz':<18}{'Format':<18}{'Items':>10}{'Dump µs/Item':>15}{'Load µs/Item':>15}{'Bytes/Item':>13}"
+    lines = [header, "-" * len(header)]
+    for name, formats in report["results"].items():
+        for fmt, sizes in formats.items():
+            for size, values in sizes.items():
+                lines.append(
+                    f"{name:<18}{fmt:<18}{int(size):>10,}{values['dump_us']:>15.3f}{values['load_us']:>15.3f}{values['bytes']:>13.1f}"
+                )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark des Snapshot-Formats gegen JSON")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="+", choices=sorted(DATASETS), help="nur diese Datensätze messen")
+    parser.add_argument("--output", help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    report = run_benchmark(args.sizes, args.repeats, args.only)
+    print(format_report(report))
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,18 @@
 # from src.orchestrator import NewsletterOrchestrator 
 from src.utils.logging_setup import setup_logging
 from src.utils.config_loader import load_env, get_env_variable
+import argparse
 import logging
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Erstellt den Newsletter.")
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Setzt einen früheren Lauf anhand seiner Checkpoints fort ('latest' = jüngster Lauf).",
+    )
+    args = parser.parse_args()
+
     # Lade Umgebungsvariablen ganz am Anfang
     load_env()
 
@@ -25,7 +34,7 @@ if __name__ == "__main__":
     try:
         from src.orchestrator import NewsletterOrchestrator # Import hier, um zirkuläre Abhängigkeiten zu vermeiden
         orchestrator = NewsletterOrchestrator() 
-        result = orchestrator.run_pipeline()
+        result = orchestrator.run_pipeline(resume_run_id=args.resume)
         
         if result:
             logger.info(f"Newsletter-Pipeline erfolgreich abgeschlossen. Ergebnis: {result}")
@@ -1,16 +1,6 @@
-"""Convenience imports for the data fetcher package."""
+"""Convenience imports for the data fetcher package (resolved lazily via :mod:`src.agents.registry`)."""
 
-from .base_fetcher import BaseDataFetcher
-from .newsapi_fetcher import NewsAPIFetcher
-from .openweathermap_fetcher import OpenWeatherMapFetcher
-from .google_calendar_fetcher import GoogleCalendarFetcher
-from .birthday_sheet_fetcher import BirthdaySheetFetcher
-from .todoist_fetcher import TodoistFetcher
-from .europeana_fetcher import EuropeanaFetcher
-from .zenquotes_fetcher import ZenQuotesFetcher
-from .eventbrite_fetcher import EventbriteFetcher
-from .openai_web_event_fetcher import OpenAIWebEventFetcher
-from .openai_link_event_fetcher import OpenAILinkEventFetcher
+from src.agents.registry import lazy_exports
 
 __all__ = [
     "BaseDataFetcher",
@@ -25,3 +15,5 @@ __all__ = [
     "OpenAIWebEventFetcher",
     "OpenAILinkEventFetcher",
 ]
+
+__getattr__ = lazy_exports(__name__, __all__)
@@ -2,15 +2,44 @@
 # Abstrakte Basisklasse für alle Datenbeschaffer-Agenten.
 
 from abc import ABC, abstractmethod
-from typing import List, Any # Any wird verwendet, da verschiedene Fetcher unterschiedliche Pydantic-Modelle zurückgeben können
+from typing import List, Any, Dict, Optional # Any wird verwendet, da verschiedene Fetcher unterschiedliche Pydantic-Modelle zurückgeben können
 import logging
 
+import requests
+
+from src.utils.http_cache import CachedResponse, get_http_cache
+from src.utils.http_client import get_http_session
+from src.utils.profiler import profiled
+
 logger = logging.getLogger(__name__)
 
 class BaseDataFetcher(ABC):
     """
     Abstrakte Basisklasse für Agenten, die Daten von externen Quellen abrufen.
+
+    HTTP-basierte Fetcher verwenden :meth:`http_get` bzw. :meth:`http_get_json`,
+    die über eine gemeinsame Session mit Connection-Pooling, Keep-Alive und
+    automatischen Wiederholungen (429/5xx, ``Retry-After``) laufen.
+
+    Fetcher mit ``http_cache_enabled = True`` legen Antworten zusätzlich im
+    HTTP-Cache ab: Mit ``ETag``/``Last-Modified`` wird per bedingtem Request
+    revalidiert, ohne Validatoren gilt die Frische aus :meth:`http_cache_ttl`.
+
+    ``fetch_data`` jeder Unterklasse wird automatisch im Laufprofil gemessen
+    (siehe :mod:`src.utils.profiler`).
     """
+    # Standard-Timeout (Sekunden) für HTTP-Anfragen dieses Fetchers
+    http_timeout: float = 20
+    # Antworten im HTTP-Cache ablegen (nur für Daten, die sich zwischen Läufen selten ändern)
+    http_cache_enabled: bool = False
+    # Frische gecachter Antworten in Sekunden (None = immer revalidieren)
+    http_cache_ttl_seconds: Optional[float] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "fetch_data" in cls.__dict__ and not getattr(cls.fetch_data, "__isabstractmethod__", False):
+            cls.fetch_data = profiled(category="fetcher")(cls.fetch_data)
+
     def __init__(self, source_name: str):
         """
         Initialisiert den Fetcher mit einem Namen für die Quelle.
@@ -34,5 +63,93 @@ class BaseDataFetcher(ABC):
         """
         pass
 
+    @property
+    def http_session(self) -> requests.Session:
+        """Die prozessweit geteilte HTTP-Session."""
+        return get_http_session()
+
+    def http_cache_ttl(self) -> Optional[float]:
+        """Wie lange eine Antwort ohne erneute Anfrage verwendet werden darf."""
+        return self.http_cache_ttl_seconds
+
+    def http_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """
+        Führt einen GET-Request über die gemeinsame Session aus (bei aktiviertem
+        HTTP-Cache ggf. bedingt oder direkt aus dem Cache).
+
+        Raises:
+            requests.exceptions.HTTPError: Bei 4xx/5xx-Antworten (nach allen Wiederholungen).
+            requests.exceptions.RequestException: Bei Netzwerkfehlern.
+        """
+        cache = get_http_cache() if self.http_cache_enabled else None
+        if cache is None or not cache.enabled:
+            return self._send_get(url, params, headers, timeout)
+
+        key = cache.make_key(url, params, headers)
+        cached = cache.get(key)
+        if cached is not None and cached.is_fresh():
+            logger.debug(f"{self.source_name}: GET {url} aus dem HTTP-Cache (frisch).")
+            cache.record_hit(cached, revalidated=False)
+            return self._cached_response(url, cached)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+        response = self._send_get(url, params, request_headers, timeout, raise_for_status=False)
+
+        if cached is not None and response.status_code == 304:
+            logger.debug(f"{self.source_name}: GET {url} -> 304, verwende gecachte Antwort.")
+            cache.refresh(key, self.http_cache_ttl())
+            cache.record_hit(cached, revalidated=True)
+            return self._cached_response(url, cached)
+
+        response.raise_for_status()
+        body = getattr(response, "content", None)
+        if response.status_code == 200 and isinstance(body, bytes):
+            cache.record_download(len(body))
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            ttl = self.http_cache_ttl()
+            if etag or last_modified or ttl:
+                cache.set(key, body, response.headers.get("Content-Type"), etag, last_modified, ttl)
+        return response
+
+    def _send_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        raise_for_status: bool = True,
+    ) -> requests.Response:
+        response = self.http_session.get(
+            url, params=params, headers=headers, timeout=timeout if timeout is not None else self.http_timeout
+        )
+        logger.debug(f"{self.source_name}: GET {url} -> {response.status_code}")
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _cached_response(url: str, cached: CachedResponse) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = cached.body
+        if cached.content_type:
+            response.headers["Content-Type"] = cached.content_type
+        response.encoding = "utf-8"
+        return response
+
+    def http_get_json(self, url: str, **kwargs: Any) -> Any:
+        """Wie :meth:`http_get`, liefert aber direkt den dekodierten JSON-Body."""
+        return self.http_get(url, **kwargs).json()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(source_name='{self.source_name}')>"
\ No newline at end of file
@@ -4,11 +4,9 @@ import logging
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
 from src.models.data_models import Birthday
+from src.utils.google_clients import build_service
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +17,7 @@ class BirthdaySheetFetcher(BaseDataFetcher):
     def __init__(self, credentials_path: str, sheet_id: str, range_name: str = "A2:B"):
         super().__init__(source_name="Google Sheets")
         scopes = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path, scopes=scopes
-        )
-        self.service = build("sheets", "v4", credentials=credentials)
+        self.service = build_service("sheets", "v4", credentials_path, scopes)
         self.sheet_id = sheet_id
         self.range_name = range_name
 
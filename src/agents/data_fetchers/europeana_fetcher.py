@@ -1,6 +1,5 @@
 import logging
 from typing import List
-import requests
 
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
 from src.models.data_models import Artwork
@@ -12,6 +11,8 @@ class EuropeanaFetcher(BaseDataFetcher):
     """Ruft Kunstwerke über die Europeana API ab."""
 
     BASE_URL = "https://api.europeana.eu/record/v2/search.json"
+    http_cache_enabled = True
+    http_cache_ttl_seconds = 24 * 3600
 
     def __init__(self, query: str, rows: int = 1, api_key_env: str = "EUROPEANA_API_KEY"):
         super().__init__(source_name="Europeana")
@@ -23,9 +24,7 @@ class EuropeanaFetcher(BaseDataFetcher):
         params = {"wskey": self.api_key, "query": self.query, "rows": self.rows}
         artworks: List[Artwork] = []
         try:
-            resp = requests.get(self.BASE_URL, params=params, timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self.http_get_json(self.BASE_URL, params=params)
             for item in data.get("items", []):
                 title = (item.get("title") or [None])[0]
                 artist = (item.get("dcCreator") or [None])[0]
@@ -1,11 +1,11 @@
 import logging
 from typing import List, Optional, Dict, Any
-import requests
 from datetime import datetime
 
 from .base_fetcher import BaseDataFetcher
 from src.models.data_models import Event
 from src.utils.config_loader import get_api_key
+from src.utils.datetime_utils import parse_datetimes
 
 logger = logging.getLogger(__name__)
 
@@ -45,15 +45,13 @@ class EventbriteFetcher(BaseDataFetcher):
         logger.info(f"Frage Eventbrite API ab: {params}")
         events: List[Event] = []
         try:
-            response = requests.get(self.BASE_URL, params=params, headers=headers, timeout=20)
-            logger.debug(f"Eventbrite Status Code: {response.status_code}")
-            response.raise_for_status()
-            data = response.json()
-            for item in data.get("events", []):
+            data = self.http_get_json(self.BASE_URL, params=params, headers=headers)
+            items = data.get("events", [])
+            starts = parse_datetimes([item.get("start", {}).get("utc") for item in items])
+            ends = parse_datetimes([item.get("end", {}).get("utc") for item in items])
+            for item, start, end in zip(items, starts, ends):
                 try:
                     venue = item.get("venue", {})
-                    start = item.get("start", {}).get("utc")
-                    end = item.get("end", {}).get("utc")
                     event = Event(
                         summary=item.get("name", {}).get("text"),
                         start_time=start,
@@ -2,11 +2,9 @@ import logging
 from datetime import datetime, timezone
 from typing import List
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
 from src.models.data_models import Event
+from src.utils.google_clients import build_service
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +18,7 @@ class GoogleCalendarFetcher(BaseDataFetcher):
         self.max_results = max_results
         scopes = ["https://www.googleapis.com/auth/calendar.readonly"]
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path, scopes=scopes
-            )
-            self.service = build("calendar", "v3", credentials=credentials)
+            self.service = build_service("calendar", "v3", credentials_path, scopes)
         except Exception as e:  # pragma: no cover - simple init wrapper
             logger.error(f"Fehler beim Initialisieren des Google Calendar Clients: {e}")
             raise
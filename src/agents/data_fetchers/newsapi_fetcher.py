@@ -3,13 +3,17 @@
 
 import requests # HTTP-Anfragen
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 from datetime import datetime, timedelta, timezone
 
 # Lokale Importe
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
 from src.models.data_models import RawArticle # Unser Pydantic-Modell für Rohartikel
 from src.utils.config_loader import get_api_key # Zum sicheren Laden des API-Schlüssels
+from src.utils.datetime_utils import parse_datetimes
+from src.utils.rate_limiter import RateLimiter
+from src.utils.state_store import FetchStateStore, article_key
 import json # Für das Parsen von Fehlermeldungen der API
 
 
@@ -33,7 +37,11 @@ class NewsAPIFetcher(BaseDataFetcher):
                  days_ago: int = 1, # Für 'everything' Endpunkt relevant (wie viele Tage zurück)
                  endpoint: str = "everything", # 'everything' oder 'top-headlines'
                  page_size: int = 20, # Anzahl der Artikel pro Anfrage (max. 100 für NewsAPI)
-                 source_name_override: Optional[str] = None): # Für spezifische Benennung im Logging etc.
+                 source_name_override: Optional[str] = None, # Für spezifische Benennung im Logging etc.
+                 max_articles: Optional[int] = None, # Obergrenze über alle Seiten (Default: eine Seite)
+                 time_budget: Optional[float] = None, # Sekunden, nach denen nicht weitergeblättert wird
+                 rate_limiter: Optional[RateLimiter] = None, # Kann von mehreren Fetchern geteilt werden
+                 state_store: Optional[FetchStateStore] = None): # Aktiviert inkrementelle Abrufe seit dem letzten Lauf
         
         effective_source_name = source_name_override if source_name_override else f"NewsAPI ({endpoint})"
         super().__init__(source_name=effective_source_name)
@@ -47,6 +55,12 @@ class NewsAPIFetcher(BaseDataFetcher):
         self.days_ago = days_ago # Wichtig für den 'from'-Parameter bei 'everything'
         self.endpoint = endpoint.lower()
         self.page_size = min(page_size, 100) # NewsAPI erlaubt max. 100
+        self.max_articles = max_articles if max_articles else self.page_size
+        self.time_budget = time_budget
+        self.rate_limiter = rate_limiter
+        self.state_store = state_store
+        # Im aktuellen Lauf gelieferte, aber noch nicht bestätigte Artikel mit Veröffentlichungsdatum (siehe commit_state)
+        self._pending: Dict[str, Optional[datetime]] = {}
 
         if self.endpoint not in ["everything", "top-headlines"]:
             logger.error(f"Ungültiger NewsAPI Endpunkt '{self.endpoint}' für Quelle '{self.source_name}'.")
@@ -56,18 +70,29 @@ class NewsAPIFetcher(BaseDataFetcher):
             logger.warning(f"NewsAPI: Für /top-headlines wird 'sources' verwendet, 'country'/'category' werden ignoriert für Quelle '{self.source_name}'.")
 
 
-    def _get_from_date_param(self) -> Optional[str]:
+    @property
+    def state_key(self) -> str:
+        """Identifiziert die Abfrage-Konfiguration im State-Store."""
+        return "|".join(
+            str(part or "") for part in
+            ("newsapi", self.endpoint, self.query, self.country, self.category, self.sources, self.language)
+        )
+
+    def _get_from_date_param(self, watermark: Optional[datetime] = None) -> Optional[str]:
         """Erstellt den Datumsstring für den 'from'-Parameter des 'everything'-Endpunkts."""
         if self.endpoint == "everything":
             # NewsAPI 'from' ist das Startdatum (inklusive). 
             # Um Artikel der letzten 24h zu bekommen, ist das Datum von gestern ein guter Start.
             # Genauere "letzte 24h"-Filterung müsste nach dem Abruf erfolgen, falls nötig.
             from_date = datetime.now(timezone.utc) - timedelta(days=self.days_ago)
+            if watermark is not None and watermark > from_date:
+                # Inkrementeller Lauf: nur Artikel ab dem neuesten bereits verarbeiteten anfragen
+                return watermark.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
             return from_date.strftime("%Y-%m-%d")
         return None
 
-    def fetch_data(self) -> List[RawArticle]:
-        """Ruft Nachrichten von NewsAPI ab und gibt sie als Liste von RawArticle-Objekten zurück."""
+    def _build_params(self, watermark: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """Stellt die Query-Parameter zusammen; None, wenn die Konfiguration keine Abfrage erlaubt."""
         params: Dict[str, Any] = { # Explizite Typisierung für Klarheit
             "apiKey": self.api_key,
             "language": self.language,
@@ -79,7 +104,7 @@ class NewsAPIFetcher(BaseDataFetcher):
                 logger.warning(f"Für den 'everything'-Endpunkt von '{self.source_name}' wird ein Suchbegriff ('query') dringend empfohlen, um relevante Ergebnisse zu erhalten.")
             params["q"] = self.query if self.query else "Aktuelles" # Fallback, falls kein Query
             
-            from_date = self._get_from_date_param()
+            from_date = self._get_from_date_param(watermark)
             if from_date:
                  params["from"] = from_date
             params["sortBy"] = "publishedAt" # oder "relevancy", "popularity"
@@ -100,62 +125,146 @@ class NewsAPIFetcher(BaseDataFetcher):
             
             if not (self.sources or self.country or self.category or self.query):
                 logger.error(f"Für NewsAPI /top-headlines muss mindestens einer der Parameter 'sources', 'country', 'category' oder 'q' gesetzt sein für Quelle '{self.source_name}'. Es werden keine Daten abgerufen.")
-                return []
+                return None
+        return params
+
+    def _parse_article(self, article_item: Dict[str, Any], published_at: Optional[datetime] = None) -> Optional[RawArticle]:
+        try:
+            # Ohne vorab geparstes Datum wird der String von `ensure_timezone_aware` im Pydantic-Modell geparst.
+            return RawArticle(
+                title=article_item.get("title"),
+                url=str(article_item.get("url")) if article_item.get("url") else None, # Pydantic HttpUrl braucht String
+                description=article_item.get("description"),
+                content_snippet=article_item.get("content"), # NewsAPI liefert oft nur einen Snippet hier
+                published_at=published_at or article_item.get("publishedAt"),
+                source_name=article_item.get("source", {}).get("name", self.source_name),
+                source_id=article_item.get("source", {}).get("id"),
+                image_url=article_item.get("urlToImage")
+            )
+        except Exception as e_article_parse: # Fängt Pydantic ValidationErrors oder andere Fehler ab
+            logger.warning(f"Überspringe Artikel von '{self.source_name}' aufgrund eines Parsing/Validierungs-Fehlers: '{article_item.get('title', 'Unbekannter Titel')}' - Fehler: {e_article_parse}", exc_info=False)
+            return None
+
+    def iter_articles(self, max_articles: Optional[int] = None, time_budget: Optional[float] = None) -> Iterator[RawArticle]:
+        """
+        Liefert Artikel seitenweise als Generator, sodass nachgelagerte Stufen schon
+        mit der ersten Seite arbeiten können.
+
+        Es wird so lange weitergeblättert, bis ``max_articles`` erreicht sind,
+        ``totalResults`` ausgeschöpft ist, die API keine weiteren Seiten liefert
+        oder ``time_budget`` Sekunden verstrichen sind. Vor jeder Seite wird das
+        (ggf. mit anderen Fetchern geteilte) Rate-Limit abgewartet. Fehler beenden
+        die Paginierung; bereits gelieferte Artikel bleiben gültig.
+        """
+        max_articles = max_articles if max_articles is not None else self.max_articles
+        time_budget = time_budget if time_budget is not None else self.time_budget
+        watermark: Optional[datetime] = None
+        seen: set = set()
+        if self.state_store is not None:
+            watermark = self.state_store.get_watermark(self.state_key)
+            seen = self.state_store.seen_keys(self.state_key)
+        params = self._build_params(watermark)
+        if params is None:
+            return
 
         url = f"{self.BASE_URL}{self.endpoint}"
-        
         # Logge Parameter ohne API-Key für Sicherheit
         params_to_log = {k: v for k, v in params.items() if k != 'apiKey'}
         logger.info(f"Frage NewsAPI ({self.source_name}) ab: {url} mit Parametern: {params_to_log}")
-        
-        fetched_articles: List[RawArticle] = []
-        try:
-            response = requests.get(url, params=params, timeout=20) # Timeout in Sekunden
-            
-            logger.debug(f"NewsAPI ({self.source_name}) Status Code: {response.status_code}")
-            response.raise_for_status() # Löst HTTPError bei 4xx/5xx Antworten aus
-            
-            data = response.json()
 
-            if data.get("status") == "error":
-                logger.error(f"NewsAPI Fehler ({self.source_name}): Code '{data.get('code')}', Message '{data.get('message')}'")
-                return [] # Leere Liste bei API-seitigem Fehler
+        deadline = time.monotonic() + time_budget if time_budget else None
+        yielded = skipped = 0
+        page = 1
+        while yielded < max_articles:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.info(f"Zeitbudget für '{self.source_name}' nach {page - 1} Seiten erschöpft.")
+                break
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                # Löst HTTPError bei 4xx/5xx Antworten aus (nach automatischen Wiederholungen bei 429/5xx)
+                data = self.http_get_json(url, params=dict(params, page=page))
 
-            articles_data = data.get("articles", [])
-            logger.info(f"NewsAPI ({self.source_name}) lieferte {data.get('totalResults', 0)} Gesamtartikel, {len(articles_data)} im aktuellen Batch.")
+                if data.get("status") == "error":
+                    logger.error(f"NewsAPI Fehler ({self.source_name}): Code '{data.get('code')}', Message '{data.get('message')}'")
+                    break # API-seitiger Fehler (z.B. 'maximumResultsReached'), bisherige Artikel bleiben erhalten
 
-            for article_item in articles_data:
+                articles_data = data.get("articles", [])
+                total_results = data.get("totalResults", 0)
+                logger.info(f"NewsAPI ({self.source_name}) lieferte {total_results} Gesamtartikel, {len(articles_data)} auf Seite {page}.")
+            except requests.exceptions.HTTPError as e_http:
+                error_message = f"HTTP-Fehler ({e_http.response.status_code if e_http.response is not None else 'N/A'}) beim Abrufen von '{self.source_name}'"
                 try:
-                    # `ensure_timezone_aware` wird vom Pydantic-Modell beim Parsen von published_at gehandhabt.
-                    raw_article = RawArticle(
-                        title=article_item.get("title"),
-                        url=str(article_item.get("url")) if article_item.get("url") else None, # Pydantic HttpUrl braucht String
-                        description=article_item.get("description"),
-                        content_snippet=article_item.get("content"), # NewsAPI liefert oft nur einen Snippet hier
-                        published_at=article_item.get("publishedAt"), # String wird von Pydantic geparsed
-                        source_name=article_item.get("source", {}).get("name", self.source_name),
-                        source_id=article_item.get("source", {}).get("id"),
-                        image_url=article_item.get("urlToImage")
-                    )
-                    fetched_articles.append(raw_article)
-                except Exception as e_article_parse: # Fängt Pydantic ValidationErrors oder andere Fehler ab
-                    logger.warning(f"Überspringe Artikel von '{self.source_name}' aufgrund eines Parsing/Validierungs-Fehlers: '{article_item.get('title', 'Unbekannter Titel')}' - Fehler: {e_article_parse}", exc_info=False)
-            
-            logger.info(f"{len(fetched_articles)} Artikel erfolgreich von '{self.source_name}' abgerufen und als RawArticle-Objekte erstellt.")
+                    if e_http.response is not None:
+                        error_details = e_http.response.json()
+                        error_message += f": {error_details.get('code')} - {error_details.get('message')}"
+                except json.JSONDecodeError: # Falls die Fehlerantwort kein JSON ist
+                    error_message += f". Rohantwort: {e_http.response.text[:200] if e_http.response is not None else 'Kein Text'}"
+                logger.error(error_message, exc_info=False)
+                break
+            except requests.exceptions.RequestException as e_req: # z.B. DNS-Fehler, Verbindungsproblem
+                logger.error(f"Netzwerkfehler beim Abrufen von Daten von '{self.source_name}': {e_req}", exc_info=True)
+                break
+            except Exception as e_general: # Andere unerwartete Fehler
+                logger.error(f"Unerwarteter Fehler beim Verarbeiten von Daten von '{self.source_name}': {e_general}", exc_info=True)
+                break
 
-        except requests.exceptions.HTTPError as e_http:
-            error_message = f"HTTP-Fehler ({e_http.response.status_code if e_http.response else 'N/A'}) beim Abrufen von '{self.source_name}'"
-            try:
-                if e_http.response is not None:
-                    error_details = e_http.response.json()
-                    error_message += f": {error_details.get('code')} - {error_details.get('message')}"
-            except json.JSONDecodeError: # Falls die Fehlerantwort kein JSON ist
-                error_message += f". Rohantwort: {e_http.response.text[:200] if e_http.response else 'Kein Text'}"
-            logger.error(error_message, exc_info=False)
-        except requests.exceptions.RequestException as e_req: # z.B. DNS-Fehler, Verbindungsproblem
-            logger.error(f"Netzwerkfehler beim Abrufen von Daten von '{self.source_name}': {e_req}", exc_info=True)
-        except Exception as e_general: # Andere unerwartete Fehler
-            logger.error(f"Unerwarteter Fehler beim Verarbeiten von Daten von '{self.source_name}': {e_general}", exc_info=True)
-        
-        return fetched_articles
+            # Zeitstempel der ganzen Seite auf einmal parsen (wiederholte Werte nur einmal)
+            published = parse_datetimes([item.get("publishedAt") for item in articles_data])
+            for article_item, published_at in zip(articles_data, published):
+                raw_article = self._parse_article(article_item, published_at)
+                if raw_article is None:
+                    continue
+                if self.state_store is not None:
+                    key = article_key(raw_article.url, raw_article.title)
+                    if key in seen:
+                        skipped += 1
+                        continue
+                    seen.add(key)
+                    self._pending[key] = raw_article.published_at
+                yield raw_article
+                yielded += 1
+                if yielded >= max_articles:
+                    break
+
+            if not articles_data or page * self.page_size >= total_results:
+                break
+            page += 1
+
+        if skipped:
+            logger.info(f"{skipped} bereits verarbeitete Artikel von '{self.source_name}' übersprungen.")
+        logger.info(f"{yielded} Artikel erfolgreich von '{self.source_name}' abgerufen und als RawArticle-Objekte erstellt.")
 
+    def commit_state(self, failed_keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Übernimmt die im Lauf gelieferten Artikel in den State-Store. Wird vom Orchestrator
+        erst aufgerufen, wenn die Artikel verarbeitet und gespeichert sind, damit ein
+        abgebrochener Lauf sie beim nächsten Mal erneut liefert.
+
+        Artikel, die bewusst verworfen wurden (Blacklist, Triage), gelten als gesehen. Nur ``failed_keys`` (siehe ``article_key``), z.B. Artikel mit
+        fehlgeschlagener Zusammenfassung, bleiben offen: Der Wasserstand rückt höchstens bis
+        kurz vor den ältesten von ihnen vor, sodass sie beim nächsten Lauf erneut abgefragt werden.
+        """
+        if self.state_store is None or not self._pending:
+            return
+        failed = set(failed_keys or ()) & set(self._pending)
+        seen = set(self._pending) - failed
+        newest = max((self._pending[key] for key in seen if self._pending[key]), default=None)
+        failed_dates = [self._pending[key] for key in failed if self._pending[key]]
+        if newest is not None and failed_dates:
+            newest = min(newest, min(failed_dates) - timedelta(seconds=1))
+        self.state_store.record_fetch(self.state_key, newest, seen)
+        self._pending = {}
+
+    def pending_state(self) -> Dict[str, Optional[float]]:
+        """Noch nicht bestätigte Artikel als ``{article_key: published_at-Timestamp}``, z.B. für Checkpoints."""
+        return {key: published.timestamp() if published else None for key, published in self._pending.items()}
+
+    def restore_pending(self, pending: Dict[str, Optional[float]]) -> None:
+        """Übernimmt die offenen Artikel eines fortgesetzten Laufs, damit :meth:`commit_state` sie bestätigen kann."""
+        for key, timestamp in pending.items():
+            self._pending[key] = datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+    def fetch_data(self) -> List[RawArticle]:
+        """Ruft Nachrichten von NewsAPI ab und gibt sie als Liste von RawArticle-Objekten zurück."""
+        return list(self.iter_articles())
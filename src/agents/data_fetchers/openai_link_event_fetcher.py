@@ -1,41 +1,95 @@
 import logging
+import time
 import json
-from typing import List
+from functools import partial
+from typing import Any, List, Optional
 from openai import OpenAI
 
 from .base_fetcher import BaseDataFetcher
 from src.models.data_models import Event
 from src.utils.config_loader import get_api_key
+from src.utils.usage_ledger import record_openai_usage
+from src.utils.fetch_scheduler import FetchScheduler
+from src.utils.llm_cache import LLMResultCache, get_llm_cache
 
 logger = logging.getLogger(__name__)
 
 class OpenAILinkEventFetcher(BaseDataFetcher):
-    """Fetch events by searching specific websites using OpenAI's web search tool."""
+    """
+    Fetch events by searching specific websites using OpenAI's web search tool.
 
-    def __init__(self, urls: List[str], model_name: str = "gpt-4o-mini", temperature: float = 0.2):
+    Sites are searched concurrently (at most ``max_concurrency`` at a time).
+    A site that takes longer than ``site_timeout`` seconds is skipped, and
+    after ``time_budget`` seconds the events found so far are returned. The
+    result per site is cached for ``cache_ttl_hours``, so unchanged event
+    pages are not searched again on every run.
+    """
+    # Bei Änderungen am Prompt erhöhen, damit gecachte Ergebnisse verworfen werden
+    PROMPT_VERSION = "1"
+
+    def __init__(
+        self,
+        urls: List[str],
+        model_name: str = "gpt-4o-mini",
+        temperature: float = 0.2,
+        max_concurrency: int = 4,
+        site_timeout: Optional[float] = 45.0,
+        time_budget: Optional[float] = 55.0,
+        cache_ttl_hours: float = 12.0,
+        cache: Optional[LLMResultCache] = None,
+    ):
         super().__init__(source_name="OpenAI Link Search")
         self.urls = urls
         self.model_name = model_name
         self.temperature = temperature
+        self.max_concurrency = max(1, max_concurrency)
+        self.site_timeout = site_timeout
+        self.time_budget = time_budget
+        self.cache_ttl_seconds = cache_ttl_hours * 3600 if cache_ttl_hours else None
+        self.cache = cache if cache is not None else get_llm_cache()
         api_key = get_api_key("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=api_key)
+        # Das Client-Timeout beendet auch hängende Requests, die der Scheduler nur noch verwirft
+        self.client = OpenAI(api_key=api_key, timeout=site_timeout) if site_timeout else OpenAI(api_key=api_key)
+
+    def _query_site(self, url: str) -> Optional[List[Any]]:
+        """Runs the web search for one site; returns the raw JSON list or None on errors."""
+        key = LLMResultCache.make_key(
+            self.__class__.__name__, self.model_name, self.temperature, self.PROMPT_VERSION, {"url": url}
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug("Using cached events for %s", url)
+            return cached
 
-    def _search_site(self, url: str) -> List[Event]:
         prompt = (
             f"Search {url} for upcoming events. "
             "Return up to 3 events as a JSON list with keys 'title', 'start_time', 'location', and 'url'."
         )
         try:
+            started = time.monotonic()
             response = self.client.responses.create(
                 model=self.model_name,
                 tools=[{"type": "web_search_preview"}],
                 input=prompt,
                 temperature=self.temperature,
             )
+            record_openai_usage(
+                self.__class__.__name__, self.model_name, getattr(response, "usage", None), time.monotonic() - started
+            )
             text = response.output_text.strip()
             data = json.loads(text)
         except Exception as exc:
             logger.error("Error searching %s via OpenAI web search: %s", url, exc, exc_info=True)
+            return None
+        if not isinstance(data, list):
+            logger.error("Unexpected response format for %s: %s", url, type(data).__name__)
+            return None
+        self.cache.set(key, data, ttl_seconds=self.cache_ttl_seconds)
+        return data
+
+    def _search_site(self, url: str) -> List[Event]:
+        data = self._query_site(url)
+        if not data:
             return []
 
         events: List[Event] = []
@@ -56,9 +110,16 @@ class OpenAILinkEventFetcher(BaseDataFetcher):
         return events
 
     def fetch_data(self) -> List[Event]:
+        scheduler = FetchScheduler(
+            max_workers=self.max_concurrency,
+            source_timeout=self.site_timeout,
+            global_timeout=self.time_budget,
+        )
+        results = scheduler.run({url: partial(self._search_site, url) for url in self.urls})
         all_events: List[Event] = []
-        for url in self.urls:
-            events = self._search_site(url)
+        for events in results.values():
             all_events.extend(events)
+        if scheduler.timed_out:
+            logger.warning("OpenAI link search timed out for %s", scheduler.timed_out)
         logger.info("Fetched %d events via OpenAI link search", len(all_events))
         return all_events
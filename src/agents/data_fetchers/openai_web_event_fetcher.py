@@ -1,4 +1,5 @@
 import logging
+import time
 import json
 from typing import List
 from openai import OpenAI
@@ -6,6 +7,7 @@ from openai import OpenAI
 from .base_fetcher import BaseDataFetcher
 from src.models.data_models import Event
 from src.utils.config_loader import get_api_key
+from src.utils.usage_ledger import record_openai_usage
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +29,16 @@ class OpenAIWebEventFetcher(BaseDataFetcher):
             "Return up to 5 events as a JSON list with keys 'title', 'start_time', 'location', and 'url'."
         )
         try:
+            started = time.monotonic()
             response = self.client.responses.create(
                 model=self.model_name,
                 tools=[{"type": "web_search_preview"}],
                 input=prompt,
                 temperature=self.temperature,
             )
+            record_openai_usage(
+                self.__class__.__name__, self.model_name, getattr(response, "usage", None), time.monotonic() - started
+            )
             text = response.output_text.strip()
             data = json.loads(text)
         except Exception as exc:
@@ -1,7 +1,6 @@
 # newsletter_project/src/agents/data_fetchers/openweathermap_fetcher.py
 """Fetcher for weather data using OpenWeatherMap API."""
 
-import requests
 import logging
 from typing import List
 
@@ -15,6 +14,9 @@ class OpenWeatherMapFetcher(BaseDataFetcher):
     """Fetches 5 day weather forecast for a given city."""
 
     BASE_URL = "https://api.openweathermap.org/data/2.5/forecast"
+    # Die Vorhersage wird nur alle paar Stunden neu berechnet
+    http_cache_enabled = True
+    http_cache_ttl_seconds = 30 * 60
 
     def __init__(self, city: str = "Zurich", api_key_name: str = "OPENWEATHER_API_KEY", units: str = "metric"):
         source_name = f"OpenWeatherMap {city}"
@@ -31,9 +33,7 @@ class OpenWeatherMapFetcher(BaseDataFetcher):
         }
         try:
             logger.info(f"Fetching weather for {self.city} from OpenWeatherMap")
-            resp = requests.get(self.BASE_URL, params=params, timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self.http_get_json(self.BASE_URL, params=params)
         except Exception as e:
             logger.error(f"Error fetching weather data: {e}")
             return []
@@ -1,6 +1,5 @@
 """Todoist data fetcher."""
 from typing import List, Optional
-import requests
 import logging
 
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
@@ -14,6 +13,8 @@ class TodoistFetcher(BaseDataFetcher):
     """Fetches tasks from the Todoist REST API."""
 
     API_URL = "https://api.todoist.com/rest/v2/tasks"
+    http_cache_enabled = True
+    http_cache_ttl_seconds = 5 * 60
 
     def __init__(self, api_token_name: str = "TODOIST_API_TOKEN", project_id: Optional[str] = None):
         super().__init__(source_name="Todoist")
@@ -26,9 +27,7 @@ class TodoistFetcher(BaseDataFetcher):
         if self.project_id:
             params["project_id"] = self.project_id
         try:
-            resp = requests.get(self.API_URL, headers=headers, params=params, timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self.http_get_json(self.API_URL, headers=headers, params=params)
         except Exception as exc:
             logger.error("Failed to fetch Todoist tasks: %s", exc, exc_info=True)
             return []
@@ -1,5 +1,5 @@
-from typing import List
-import requests
+from datetime import datetime, time as dt_time, timedelta
+from typing import List, Optional
 import logging
 from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
 from src.models.data_models import Quote
@@ -10,15 +10,20 @@ class ZenQuotesFetcher(BaseDataFetcher):
     """Fetcher for a daily inspirational quote from the ZenQuotes API."""
 
     BASE_URL = "https://zenquotes.io/api/today"
+    http_cache_enabled = True
 
     def __init__(self):
         super().__init__(source_name="ZenQuotes")
 
+    def http_cache_ttl(self) -> Optional[float]:
+        """Das Zitat des Tages bleibt bis Mitternacht gültig."""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), dt_time.min)
+        return (midnight - now).total_seconds()
+
     def fetch_data(self) -> List[Quote]:
         try:
-            response = requests.get(self.BASE_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http_get_json(self.BASE_URL, timeout=10)
             if isinstance(data, list) and data:
                 q = data[0]
                 quote = Quote(text=q.get("q", ""), author=q.get("a"))
@@ -1,9 +1,9 @@
 import os
 import logging
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
+from src.utils.google_clients import build_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,8 +13,7 @@ class GDriveUploader:
     def __init__(self, credentials_path: str):
         scopes = ['https://www.googleapis.com/auth/drive.file']
         try:
-            credentials = service_account.Credentials.from_service_account_file(credentials_path, scopes=scopes)
-            self.service = build('drive', 'v3', credentials=credentials)
+            self.service = build_service('drive', 'v3', credentials_path, scopes)
         except Exception as e:
             logger.error(f"Fehler beim Initialisieren des Google Drive Clients: {e}")
             raise
@@ -1,8 +1,4 @@
-from .summarizer_agent import SummarizerAgent
-from .categorizer_agent import CategorizerAgent
-from .article_writer_agent import ArticleWriterAgent
-from .art_description_agent import ArtDescriptionAgent
-from .event_filter_agent import EventFilterAgent
+from src.agents.registry import lazy_exports
 
 __all__ = [
     "SummarizerAgent",
@@ -11,3 +7,6 @@ __all__ = [
     "ArtDescriptionAgent",
     "EventFilterAgent",
 ]
+
+# Die Agenten (und damit langchain/openai) werden erst beim ersten Zugriff importiert
+__getattr__ = lazy_exports(__name__, __all__)
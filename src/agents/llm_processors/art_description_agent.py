@@ -35,7 +35,7 @@ Epoche: {epoch}
         )
 
     def describe_artwork(self, art: Artwork) -> str:
-        return self.chain.invoke({
+        return self._invoke_cached(self.chain, {
             "title": art.title,
             "artist": art.artist or "Unbekannt",
             "location": art.location or "Unbekannt",
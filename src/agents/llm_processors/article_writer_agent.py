@@ -5,25 +5,58 @@ Dieser Agent nutzt das OpenAI SDK mit dem ``web_search_preview`` Tool,
 um auf Basis eines Links und einer Zusammenfassung einen ausgearbeiteten
 Artikel zu verfassen. Er erwartet ein :class:`ProcessedArticle` Objekt
 und gibt den generierten Artikeltext zurück.
+
+Mit ``max_concurrency > 1`` werden mehrere Artikel gleichzeitig über den
+asynchronen Client geschrieben; mit ``stream=True`` werden die Antworten als
+Token-Deltas gelesen. Ein optionaler Callback erhält jeden Artikel, sobald er
+fertig ist; der Orchestrator übernimmt damit die Texte einzeln, der Newsletter
+wird aber erst nach dem ganzen Batch zusammengestellt.
 """
 
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
 import logging
-from openai import OpenAI
+import time
+from openai import AsyncOpenAI, OpenAI
 
 from src.models.data_models import ProcessedArticle
 from src.utils.config_loader import get_api_key
+from src.utils.llm_cache import LLMResultCache, get_llm_cache
+from src.utils.profiler import profiled
+from src.utils.usage_ledger import record_openai_usage
 
 logger = logging.getLogger(__name__)
 
+FAILED_ARTICLE_TEXT = "Artikel konnte nicht generiert werden."
+
+# Wird mit (Index im Batch, Artikel, Text) aufgerufen, sobald ein Artikel fertig ist
+ArticleDoneCallback = Callable[[int, ProcessedArticle, str], None]
+
 class ArticleWriterAgent:
     """Erzeugt aus einem :class:`ProcessedArticle` einen ausgeschriebenen Artikel."""
 
-    def __init__(self, model_name: str = "gpt-4o-mini", temperature: float = 0.2):
-        api_key = get_api_key("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=api_key)
+    # Bei Änderungen an _build_prompt erhöhen, damit alte Cache-Einträge nicht mehr treffen.
+    PROMPT_VERSION = "1"
+    # Grobe Schätzung pro Artikel (inkl. Websuche-Kontext und Antwort), solange im Lauf keine Messwerte vorliegen
+    ESTIMATED_TOKENS_PER_ARTICLE = 4000
+
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        temperature: float = 0.2,
+        cache: Optional[LLMResultCache] = None,
+        max_concurrency: int = 1, # >1 schreibt mehrere Artikel gleichzeitig (asynchroner Client)
+        stream: bool = False, # Antworten als Token-Deltas lesen
+    ):
+        self._api_key = get_api_key("OPENAI_API_KEY")
+        self.client = OpenAI(api_key=self._api_key)
         self.model_name = model_name
         self.temperature = temperature
+        self.cache = cache if cache is not None else get_llm_cache()
+        self.max_concurrency = max(1, max_concurrency)
+        self.stream = stream
+        # Laufzeiten des letzten Batches (time_to_first_token, time_to_first_article, total) in Sekunden
+        self.last_batch_timings: Dict[str, float] = {}
         logger.info(
             f"ArticleWriterAgent initialisiert mit Modell '{self.model_name}' und Temperatur {self.temperature}."
         )
@@ -45,26 +78,152 @@ class ArticleWriterAgent:
         )
         return prompt
 
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "tools": [{"type": "web_search_preview"}],
+            "input": prompt,
+            "temperature": self.temperature,
+        }
+
+    def _cache_key(self, prompt: str) -> str:
+        return LLMResultCache.make_key(
+            agent=self.__class__.__name__,
+            model_name=self.model_name,
+            temperature=self.temperature,
+            prompt_version=self.PROMPT_VERSION,
+            inputs={"prompt": prompt},
+        )
+
+    def _record_usage(self, response: Any, started: float) -> None:
+        record_openai_usage(
+            self.__class__.__name__, self.model_name, getattr(response, "usage", None), time.monotonic() - started
+        )
+
     def write_article(self, article: ProcessedArticle) -> str:
         """Generiert den Artikeltext."""
         prompt = self._build_prompt(article)
+        cache_key = self._cache_key(prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"ArticleWriterAgent: Cache-Treffer für '{article.title}'.")
+            return cached
         try:
-            response = self.client.responses.create(
-                model=self.model_name,
-                tools=[{"type": "web_search_preview"}],
-                input=prompt,
-                temperature=self.temperature,
-            )
+            started = time.monotonic()
+            response = self.client.responses.create(**self._request_kwargs(prompt))
+            self._record_usage(response, started)
             text = response.output_text.strip()
             logger.debug("ArticleWriterAgent Antwort erhalten.")
+            if text:
+                self.cache.set(cache_key, text)
             return text
         except Exception as e:
             logger.error(f"Fehler beim Generieren des Artikels: {e}", exc_info=True)
-            return "Artikel konnte nicht generiert werden."
+            return FAILED_ARTICLE_TEXT
+
+    async def _astream_text(self, client: AsyncOpenAI, prompt: str, on_first_token: Callable[[], None]) -> str:
+        """Liest die Antwort als Stream von Token-Deltas."""
+        parts: List[str] = []
+        final_text: Optional[str] = None
+        started = time.monotonic()
+        stream = await client.responses.create(stream=True, **self._request_kwargs(prompt))
+        async for event in stream:
+            event_type = getattr(event, "type", "")
+            if event_type == "response.output_text.delta":
+                if not parts:
+                    on_first_token()
+                parts.append(event.delta)
+            elif event_type == "response.completed":
+                final_text = getattr(event.response, "output_text", None)
+                self._record_usage(event.response, started)
+        return ("".join(parts) or final_text or "").strip()
+
+    async def awrite_article(
+        self,
+        article: ProcessedArticle,
+        client: AsyncOpenAI,
+        on_first_token: Optional[Callable[[], None]] = None,
+    ) -> str:
+        """Asynchrone Variante von :meth:`write_article` (optional gestreamt)."""
+        prompt = self._build_prompt(article)
+        cache_key = self._cache_key(prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"ArticleWriterAgent: Cache-Treffer für '{article.title}'.")
+            return cached
+        try:
+            if self.stream:
+                text = await self._astream_text(client, prompt, on_first_token or (lambda: None))
+            else:
+                started = time.monotonic()
+                response = await client.responses.create(**self._request_kwargs(prompt))
+                self._record_usage(response, started)
+                text = response.output_text.strip()
+            if text:
+                self.cache.set(cache_key, text)
+            return text
+        except Exception as e:
+            logger.error(f"Fehler beim Generieren des Artikels '{article.title}': {e}", exc_info=True)
+            return FAILED_ARTICLE_TEXT
+
+    async def aprocess_batch(
+        self,
+        articles: List[ProcessedArticle],
+        on_article_done: Optional[ArticleDoneCallback] = None,
+    ) -> List[str]:
+        """
+        Schreibt die Artikel mit höchstens ``max_concurrency`` gleichzeitigen Anfragen.
+        Die Reihenfolge der Ergebnisse entspricht der Eingabe; ``on_article_done`` wird
+        in der Reihenfolge der Fertigstellung aufgerufen.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = time.monotonic()
+        timings: Dict[str, float] = {}
+
+        def first_token() -> None:
+            timings.setdefault("time_to_first_token", time.monotonic() - start)
+
+        async with AsyncOpenAI(api_key=self._api_key) as client:
+            async def write(index: int, article: ProcessedArticle) -> str:
+                async with semaphore:
+                    text = await self.awrite_article(article, client, on_first_token=first_token)
+                timings.setdefault("time_to_first_article", time.monotonic() - start)
+                if on_article_done is not None:
+                    on_article_done(index, article, text)
+                return text
 
-    def process_batch(self, articles: List[ProcessedArticle]) -> List[str]:
+            results = list(await asyncio.gather(*(write(i, a) for i, a in enumerate(articles))))
+
+        timings["total"] = time.monotonic() - start
+        self.last_batch_timings = timings
+        first_token = timings.get("time_to_first_token")
+        logger.info(
+            "ArticleWriterAgent: %d Artikel in %.2fs geschrieben (%serster Artikel nach %.2fs).",
+            len(articles),
+            timings["total"],
+            f"erstes Token nach {first_token:.2f}s, " if first_token is not None else "",
+            timings.get("time_to_first_article", 0.0),
+        )
+        return results
+
+    @profiled(category="agent")
+    def process_batch(
+        self,
+        articles: List[ProcessedArticle],
+        on_article_done: Optional[ArticleDoneCallback] = None,
+    ) -> List[str]:
         """Schreibt für mehrere Artikel jeweils einen vollwertigen Text."""
+        if articles and (self.max_concurrency > 1 or self.stream):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError: # Kein laufender Event-Loop -> asynchroner Batch möglich
+                return asyncio.run(self.aprocess_batch(articles, on_article_done=on_article_done))
+            logger.warning("Bereits laufender Event-Loop erkannt. Schreibe Artikel sequentiell; nutze aprocess_batch für asynchrone Aufrufer.")
+
         results: List[str] = []
-        for art in articles:
-            results.append(self.write_article(art))
+        for index, art in enumerate(articles):
+            text = self.write_article(art)
+            if on_article_done is not None:
+                on_article_done(index, art, text)
+            results.append(text)
         return results
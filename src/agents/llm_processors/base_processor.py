@@ -1,24 +1,78 @@
 # newsletter_project/src/agents/llm_processors/base_processor.py
 # Abstrakte Basisklasse für alle LLM-basierten Verarbeitungs-Agenten.
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models.chat_models import BaseChatModel # Basistyp für ChatModelle
 from src.utils.config_loader import get_api_key, get_env_variable # Für API-Key und Modellnamen
+from src.utils.llm_cache import LLMResultCache, get_llm_cache
+from src.utils.profiler import profiled
+from src.utils.rate_limiter import RateLimiter
+from src.utils.usage_ledger import record_llm_call
 import logging
 
 logger = logging.getLogger(__name__)
 
+class TokenUsageCallback(BaseCallbackHandler):
+    """Bucht Token-Nutzung und Latenz jeder LLM-Antwort im Usage-Ledger und im Laufprofil."""
+    # Synchron im aufrufenden Kontext ausführen, damit die Nutzung der richtigen Section zugeordnet wird
+    run_inline = True
+
+    def __init__(self, agent: str = "unbekannt", model: Optional[str] = None):
+        self.agent = agent
+        self.model = model
+        self._started: Dict[UUID, float] = {}
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.monotonic()
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[Any], *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.monotonic()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._started.pop(run_id, None)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        latency = time.monotonic() - started if started is not None else None
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens")
+        completion_tokens = usage.get("completion_tokens")
+        if prompt_tokens is None:
+            # Neuere Versionen liefern die Nutzung nur noch an der Nachricht
+            for generations in response.generations:
+                for generation in generations:
+                    metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                    prompt_tokens = (prompt_tokens or 0) + metadata.get("input_tokens", 0)
+                    completion_tokens = (completion_tokens or 0) + metadata.get("output_tokens", 0)
+        record_llm_call(self.agent, self.model, prompt_tokens, completion_tokens, latency)
+
+
 class BaseLLMProcessor(ABC):
     """
     Abstrakte Basisklasse für Agenten, die Daten mithilfe eines LLM verarbeiten.
     Standardmäßig wird OpenAI GPT über LangChain verwendet.
+    ``process_batch`` jeder Unterklasse wird automatisch im Laufprofil gemessen.
     """
+    # Bei jeder inhaltlichen Änderung eines Prompts erhöhen, damit alte Cache-Einträge nicht mehr treffen.
+    PROMPT_VERSION = "1"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "process_batch" in cls.__dict__ and not getattr(cls.process_batch, "__isabstractmethod__", False):
+            cls.process_batch = profiled(category="agent")(cls.process_batch)
+
     def __init__(self, 
                  model_name: Optional[str] = None, 
                  temperature: float = 1, # Standardtemperatur für ausgewogene Kreativität
-                 llm_provider: str = "openai"):
+                 llm_provider: str = "openai",
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[LLMResultCache] = None):
         """
         Initialisiert den LLM-Prozessor.
         Args:
@@ -26,10 +80,14 @@ class BaseLLMProcessor(ABC):
                                         Wird aus .env (OPENAI_DEFAULT_MODEL) geholt, falls nicht angegeben.
             temperature (float): Die Temperatur für die LLM-Generierung.
             llm_provider (str): Der Anbieter des LLM (derzeit "openai" oder "gpt").
+            rate_limiter (RateLimiter, optional): Gemeinsames Limit für Requests/Tokens pro Minute.
+            cache (LLMResultCache, optional): Ergebnis-Cache; Default ist der per .env konfigurierte Cache.
         """
         self.llm_provider = llm_provider.lower()
         self.model_name = model_name
         self.temperature = temperature
+        self.rate_limiter = rate_limiter
+        self.cache = cache if cache is not None else get_llm_cache()
         self.llm: Optional[BaseChatModel] = None # Der LangChain LLM-Client
 
         logger.info(f"Initialisiere LLM Processor für Provider: '{self.llm_provider}'.")
@@ -44,6 +102,7 @@ class BaseLLMProcessor(ABC):
                     model=self.model_name,
                     openai_api_key=openai_api_key,
                     temperature=self.temperature,
+                    callbacks=[TokenUsageCallback(self.__class__.__name__, self.model_name)],
                 )
                 logger.info(
                     f"OpenAI LLM Processor initialisiert mit Modell: {self.model_name}, Temperatur: {self.temperature}."
@@ -74,5 +133,43 @@ class BaseLLMProcessor(ABC):
             raise RuntimeError("LLM nicht initialisiert. Verarbeitung abgebrochen.")
         pass # Implementierung in abgeleiteten Klassen
 
+    def _cache_key(self, inputs: Dict[str, Any], variant: str = "default") -> str:
+        return LLMResultCache.make_key(
+            agent=f"{self.__class__.__name__}:{variant}",
+            model_name=self.model_name,
+            temperature=self.temperature,
+            prompt_version=self.PROMPT_VERSION,
+            inputs=inputs,
+        )
+
+    def _invoke_cached(self, chain: Any, inputs: Dict[str, Any], variant: str = "default", estimated_tokens: int = 0) -> Any:
+        """
+        Führt ``chain.invoke(inputs)`` aus, sofern das Ergebnis nicht bereits im Cache liegt.
+        Das Rate-Limit wird nur für tatsächlich gesendete Anfragen belastet.
+        """
+        key = self._cache_key(inputs, variant)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"{self.__class__.__name__}: Cache-Treffer ({variant}).")
+            return cached
+        if self.rate_limiter:
+            self.rate_limiter.acquire(estimated_tokens)
+        result = chain.invoke(inputs)
+        self.cache.set(key, result)
+        return result
+
+    async def _ainvoke_cached(self, chain: Any, inputs: Dict[str, Any], variant: str = "default", estimated_tokens: int = 0) -> Any:
+        """Asynchrone Variante von :meth:`_invoke_cached`."""
+        key = self._cache_key(inputs, variant)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"{self.__class__.__name__}: Cache-Treffer ({variant}).")
+            return cached
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(estimated_tokens)
+        result = await chain.ainvoke(inputs)
+        self.cache.set(key, result)
+        return result
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(model='{self.model_name}', provider='{self.llm_provider}')>"
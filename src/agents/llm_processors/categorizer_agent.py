@@ -1,11 +1,12 @@
 # newsletter_project/src/agents/llm_processors/categorizer_agent.py
 # LLM-Agent zum Kategorisieren von Texten (z.B. Artikel).
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser 
 from pydantic import BaseModel as LangchainBaseModel, Field as LangchainField
 from src.models.data_models import ProcessedArticle # Arbeitet jetzt mit ProcessedArticle (hat schon summary)
+from src.utils.rate_limiter import RateLimiter, estimate_tokens
 from .base_processor import BaseLLMProcessor
 import logging
 import json # Für manuelles Parsen, falls JsonOutputParser nicht perfekt funktioniert
@@ -27,11 +28,23 @@ class CategorizerAgent(BaseLLMProcessor):
     Ein LLM-Agent, der darauf spezialisiert ist, Artikel
     in vordefinierte Kategorien einzuordnen.
     """
+    # Maximale Länge der Zusammenfassung, die an das LLM geschickt wird
+    MAX_INPUT_CHARS = 2500
+    # Geschätzte Tokens für Prompt-Gerüst inkl. Kategorienliste (einmal pro Anfrage)
+    PROMPT_OVERHEAD_TOKENS = 300
+    # Geschätzte Antwort-Tokens pro Artikel im Batch-Modus ({"id", "category", "importance"})
+    RESPONSE_TOKENS_PER_ARTICLE = 25
+
     def __init__(self, 
                  categories: List[str], # Die Liste der erlaubten Kategorien
                  model_name: Optional[str] = None,
-                 temperature: float = 1): # Sehr niedrige Temperatur für konsistente Kategorisierung
-        super().__init__(model_name=model_name, temperature=temperature)
+                 temperature: float = 1, # Sehr niedrige Temperatur für konsistente Kategorisierung
+                 batch_token_budget: Optional[int] = None, # Token-Budget pro Batch-Anfrage; None = ein Artikel pro Anfrage
+                 max_batch_size: int = 25,
+                 rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(model_name=model_name, temperature=temperature, rate_limiter=rate_limiter)
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max(1, max_batch_size)
         
         if not categories:
             logger.error("CategorizerAgent erfordert eine Liste von Kategorien bei der Initialisierung.")
@@ -66,6 +79,29 @@ JSON-ANTWORT (nur das JSON-Objekt):
         self.output_parser = JsonOutputParser(pydantic_object=CategorizationResponseSchema)
         
         self.chain = self.prompt_template | self.llm | self.output_parser
+
+        # Batch-Prompt: mehrere Artikel mit ID in einer Anfrage, Antwort als JSON-Array
+        self.batch_prompt_template = ChatPromptTemplate.from_template(
+             """
+Du bist ein Experte für die thematische Kategorisierung von Nachrichtenartikeln.
+Ordne JEDEN der folgenden Artikel EINER der vorgegebenen Kategorien zu.
+
+Vorgegebene Kategorien: [{available_categories}]
+
+Wähle pro Artikel nur eine einzige, die absolut relevanteste Kategorie aus der Liste.
+Wenn keine Kategorie exakt passt, wähle die allgemeinste passende Kategorie aus der Liste oder, falls vorhanden, eine Kategorie wie 'Sonstiges' oder 'Der Rund um Blick'.
+Bewerte außerdem, wie wichtig jeder Artikel im Kontext des Themas ist, auf einer Skala von 1 (sehr unwichtig) bis 10 (sehr wichtig).
+
+Antworte ausschließlich mit einem JSON-Array. Jedes Element muss die Schlüssel "id" (die ID des Artikels),
+"category" und "importance" enthalten. Gib KEINEN zusätzlichen Text außerhalb des JSON-Arrays zurück.
+
+ARTIKEL:
+{articles_block}
+
+JSON-ANTWORT (nur das JSON-Array):
+"""
+        )
+        self.batch_chain = self.batch_prompt_template | self.llm | JsonOutputParser()
         logger.info(f"CategorizerAgent Kette initialisiert mit Kategorien: {self.categories_str}.")
 
     def _get_text_for_categorization(self, article: ProcessedArticle) -> str:
@@ -81,6 +117,47 @@ JSON-ANTWORT (nur das JSON-Objekt):
             return title
         return ""
 
+    def _apply_categorization(self, article: ProcessedArticle, response_data: Dict[str, Any]) -> str:
+        """Übernimmt Wichtigkeit aus einer LLM-Antwort in den Artikel und gibt die validierte Kategorie zurück."""
+        category = response_data.get("category", "Unkategorisiert")
+        importance_val = response_data.get("importance", 0)
+
+        try:
+            importance_score = float(importance_val)
+        except (TypeError, ValueError):
+            importance_score = 0.0
+
+        if importance_score < 0 or importance_score > 10:
+            logger.warning(
+                f"Erhaltene Wichtigkeit '{importance_score}' außerhalb des erwarteten Bereichs 1-10 für Artikel '{article.title}'."
+            )
+            importance_score = max(0.0, min(importance_score, 10.0))
+
+        article.relevance_score = importance_score
+        if article.llm_processing_details is None:
+            article.llm_processing_details = {}
+        article.llm_processing_details["importance"] = importance_score
+
+        # Zusätzliche Validierung: Stelle sicher, dass die zurückgegebene Kategorie eine der erlaubten ist.
+        # Manchmal halluzinieren LLMs Kategorien, die nicht in der Liste standen.
+        if category not in self.categories_list and category != "Unkategorisiert" and category != "Fehler bei Kategorisierung":
+            logger.warning(f"LLM gab eine ungültige Kategorie '{category}' zurück für Artikel '{article.title}' (nicht in der Liste: {self.categories_list}). Setze auf 'Unkategorisiert'.")
+            category = "Unkategorisiert"
+
+        logger.debug(f"Artikel '{article.title}' kategorisiert als: '{category}'.")
+        return category
+
+    def _single_inputs(self, article: ProcessedArticle) -> Dict[str, Any]:
+        return {
+            "available_categories": self.categories_str,
+            "title": article.title or "Kein Titel", # Stelle sicher, dass immer ein Titel da ist
+            "summary": (article.summary or "")[:self.MAX_INPUT_CHARS] # Nur Zusammenfassung als Haupttext
+        }
+
+    def _category_key(self, article: ProcessedArticle) -> str:
+        """Cache-Schlüssel pro Artikelinhalt; Einzel- und Batch-Modus teilen sich die Einträge."""
+        return self._cache_key(self._single_inputs(article))
+
     def categorize_article(self, article: ProcessedArticle) -> str:
         """
         Kategorisiert einen einzelnen ProcessedArticle.
@@ -95,44 +172,15 @@ JSON-ANTWORT (nur das JSON-Objekt):
             return "Unkategorisiert" # Standardkategorie bei unzureichendem Input
 
         try:
-            # Begrenze die Länge des Inputs für den LLM, falls nötig
-            max_input_chars = 2500 # Titel + Zusammenfassung sollten hier reinpassen
-            
             # Das Ergebnis des JsonOutputParser(pydantic_object=...) ist bereits ein Dictionary
             # (oder das Pydantic-Objekt selbst, wenn man es direkt verwenden würde)
-            response_data: Dict = self.chain.invoke({
-                "available_categories": self.categories_str,
-                "title": article.title or "Kein Titel", # Stelle sicher, dass immer ein Titel da ist
-                "summary": article.summary[:max_input_chars] # Nur Zusammenfassung als Haupttext
-            })
+            response_data: Dict = self._invoke_cached(
+                self.chain,
+                self._single_inputs(article),
+                estimated_tokens=estimate_tokens(text_to_categorize) + self.PROMPT_OVERHEAD_TOKENS,
+            )
             
-            category = response_data.get("category", "Unkategorisiert")
-            importance_val = response_data.get("importance", 0)
-
-            try:
-                importance_score = float(importance_val)
-            except (TypeError, ValueError):
-                importance_score = 0.0
-
-            if importance_score < 0 or importance_score > 10:
-                logger.warning(
-                    f"Erhaltene Wichtigkeit '{importance_score}' außerhalb des erwarteten Bereichs 1-10 für Artikel '{article.title}'."
-                )
-                importance_score = max(0.0, min(importance_score, 10.0))
-
-            article.relevance_score = importance_score
-            if article.llm_processing_details is None:
-                article.llm_processing_details = {}
-            article.llm_processing_details["importance"] = importance_score
-
-            # Zusätzliche Validierung: Stelle sicher, dass die zurückgegebene Kategorie eine der erlaubten ist.
-            # Manchmal halluzinieren LLMs Kategorien, die nicht in der Liste standen.
-            if category not in self.categories_list and category != "Unkategorisiert" and category != "Fehler bei Kategorisierung":
-                logger.warning(f"LLM gab eine ungültige Kategorie '{category}' zurück für Artikel '{article.title}' (nicht in der Liste: {self.categories_list}). Setze auf 'Unkategorisiert'.")
-                category = "Unkategorisiert"
-
-            logger.debug(f"Artikel '{article.title}' kategorisiert als: '{category}'.")
-            return category
+            return self._apply_categorization(article, response_data)
 
         except json.JSONDecodeError as e_json: # Falls der LLM kein valides JSON liefert trotz Anweisung
             logger.error(f"Fehler beim Parsen der JSON-Kategorisierungsantwort für '{article.title}': {e_json}. Überprüfe den LLM-Output.", exc_info=True)
@@ -141,6 +189,122 @@ JSON-ANTWORT (nur das JSON-Objekt):
             logger.error(f"Fehler beim Kategorisieren des Artikels '{article.title}': {e}", exc_info=True)
             return "Fehler bei Kategorisierung (Allgemein)" # Fallback
 
+    def _format_batch_entry(self, article_id: int, article: ProcessedArticle) -> str:
+        title = article.title or "Kein Titel"
+        summary = (article.summary or "")[:self.MAX_INPUT_CHARS]
+        return f"[ID {article_id}]\nTITEL: {title}\nZUSAMMENFASSUNG: {summary}"
+
+    def _build_batches(self, articles: List[ProcessedArticle]) -> List[List[int]]:
+        """
+        Teilt die Artikel (als Indizes) so in Batches auf, dass jede Anfrage das Token-Budget
+        einhält. An Tagen mit kurzen Zusammenfassungen passen so mehr Artikel in eine Anfrage.
+        """
+        budget = max(self.batch_token_budget or 0, self.PROMPT_OVERHEAD_TOKENS + 1)
+        batches: List[List[int]] = []
+        current: List[int] = []
+        used = self.PROMPT_OVERHEAD_TOKENS
+        for idx, article in enumerate(articles):
+            cost = estimate_tokens(self._format_batch_entry(idx, article)) + self.RESPONSE_TOKENS_PER_ARTICLE
+            if current and (used + cost > budget or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current = []
+                used = self.PROMPT_OVERHEAD_TOKENS
+            current.append(idx)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def categorize_batch(self, articles: List[ProcessedArticle]) -> Dict[int, str]:
+        """
+        Kategorisiert mehrere Artikel mit einer einzigen Anfrage.
+        Gibt ein Mapping von Listenindex auf Kategorie zurück; Artikel, die in der
+        Antwort fehlen oder nicht zugeordnet werden konnten, fehlen auch im Ergebnis.
+        Die Antwort wird nicht als Ganzes gecacht (die IDs sind nur Positionen im Batch),
+        sondern pro Artikel unter :meth:`_category_key`.
+        """
+        entries = [self._format_batch_entry(idx, art) for idx, art in enumerate(articles)]
+        articles_block = "\n\n".join(entries)
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(
+                    estimate_tokens(articles_block) + self.PROMPT_OVERHEAD_TOKENS
+                    + self.RESPONSE_TOKENS_PER_ARTICLE * len(articles)
+                )
+            response_data = self.batch_chain.invoke(
+                {"available_categories": self.categories_str, "articles_block": articles_block}
+            )
+        except Exception as e:
+            logger.error(f"Fehler bei der Batch-Kategorisierung von {len(articles)} Artikeln: {e}", exc_info=True)
+            return {}
+
+        if isinstance(response_data, dict): # Manche Modelle verpacken das Array in ein Objekt
+            response_data = next((v for v in response_data.values() if isinstance(v, list)), [response_data])
+        if not isinstance(response_data, list):
+            logger.warning(f"Unerwartetes Format der Batch-Kategorisierung: {type(response_data).__name__}")
+            return {}
+
+        results: Dict[int, str] = {}
+        for entry in response_data:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= idx < len(articles) and idx not in results:
+                response = {"category": entry.get("category"), "importance": entry.get("importance")}
+                self.cache.set(self._category_key(articles[idx]), response)
+                results[idx] = self._apply_categorization(articles[idx], response)
+        return results
+
+    def _assign_category(self, article: ProcessedArticle, category_name: str) -> None:
+        article.category = category_name # Aktualisiere das ProcessedArticle-Objekt direkt
+        if article.llm_processing_details is None: article.llm_processing_details = {}
+        article.llm_processing_details["categorizer_model"] = self.model_name
+        article.llm_processing_details["assigned_category"] = category_name
+
+    def _process_in_batches(self, processed_articles: List[ProcessedArticle]) -> None:
+        """
+        Kategorisiert im Batch-Modus; fehlende Artikel werden einzeln nachgeholt.
+        Artikel mit gecachter Kategorie werden direkt übernommen, nur die übrigen
+        gehen in Batch-Anfragen.
+        """
+        candidates: List[ProcessedArticle] = []
+        cache_hits = 0
+        for article in processed_articles:
+            text = self._get_text_for_categorization(article)
+            if not text or len(text.strip()) < 10:
+                # Wie im Einzelmodus: ohne Inhalt keine LLM-Anfrage
+                self._assign_category(article, self.categorize_article(article))
+                continue
+            cached = self.cache.get(self._category_key(article))
+            if isinstance(cached, dict):
+                self._assign_category(article, self._apply_categorization(article, cached))
+                cache_hits += 1
+            else:
+                candidates.append(article)
+
+        batches = self._build_batches(candidates)
+        requests_sent = 0
+        retried = 0
+        for batch_indices in batches:
+            batch = [candidates[i] for i in batch_indices]
+            results = self.categorize_batch(batch)
+            requests_sent += 1
+            for idx, article in enumerate(batch):
+                if idx in results:
+                    self._assign_category(article, results[idx])
+                    article.llm_processing_details["categorizer_batch_size"] = len(batch)
+                else:
+                    logger.debug(f"Artikel '{article.title}' fehlt in der Batch-Antwort. Kategorisiere einzeln.")
+                    self._assign_category(article, self.categorize_article(article))
+                    retried += 1
+        logger.info(
+            f"Batch-Kategorisierung: {cache_hits} Artikel aus dem Cache, {len(candidates)} Artikel in "
+            f"{requests_sent} Batch-Anfragen, {retried} einzeln nachkategorisiert."
+        )
+
     def process_batch(self, processed_articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
         """
         Verarbeitet eine Liste von ProcessedArticle-Objekten und fügt jedem die Kategorie hinzu.
@@ -151,14 +315,16 @@ JSON-ANTWORT (nur das JSON-Objekt):
              return processed_articles # Gib die Liste unverändert zurück oder eine leere Liste
              
         logger.info(f"Starte Batch-Kategorisierung für {len(processed_articles)} Artikel.")
+
+        if self.batch_token_budget and len(processed_articles) > 1:
+            self._process_in_batches(processed_articles)
+            logger.info(f"Batch-Kategorisierung für {len(processed_articles)} Artikel abgeschlossen.")
+            return processed_articles
         
         for i, article in enumerate(processed_articles):
             logger.debug(f"Kategorisiere Artikel {i+1}/{len(processed_articles)} im Batch: '{article.title}'")
             category_name = self.categorize_article(article)
-            article.category = category_name # Aktualisiere das ProcessedArticle-Objekt direkt
-            if article.llm_processing_details is None: article.llm_processing_details = {}
-            article.llm_processing_details["categorizer_model"] = self.model_name
-            article.llm_processing_details["assigned_category"] = category_name
+            self._assign_category(article, category_name)
             
         logger.info(f"Batch-Kategorisierung für {len(processed_articles)} Artikel abgeschlossen.")
         return processed_articles
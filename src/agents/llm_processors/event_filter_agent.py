@@ -1,44 +1,193 @@
+import hashlib
 import logging
-from typing import List
+import math
+from typing import Any, Dict, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
 
 from src.models.data_models import Event
+from src.utils.rate_limiter import RateLimiter, estimate_tokens
+from src.utils.text_utils import normalize_text
 from .base_processor import BaseLLMProcessor
 
 logger = logging.getLogger(__name__)
 
+
+def event_identity(event: Event) -> str:
+    """Hash of normalized title, location and start time; stable across sources and days."""
+    start = event.start_time.isoformat() if event.start_time else ""
+    identity = "|".join((normalize_text(event.summary), normalize_text(event.location), start))
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
 class EventFilterAgent(BaseLLMProcessor):
-    """Filters events based on interest using an LLM."""
+    """
+    Filters events based on interest using an LLM.
+
+    With ``batch_size > 1`` several events are rated in one request that
+    returns ``[{"index", "score"}]`` as JSON; events missing from or
+    unparseable in that answer are rated one by one. Scores are cached per
+    :func:`event_identity` (the only cache layer of this agent), so events
+    that reappear on later days (or from another fetcher) are not rated again.
+    """
+    # Maximale Länge der Beschreibung pro Event im Sammel-Prompt
+    MAX_DESCRIPTION_CHARS = 500
+    # Geschätzte Tokens für Anweisungen und Antwort (für das Rate-Limit)
+    PROMPT_OVERHEAD_TOKENS = 60
 
-    def __init__(self, threshold: float = 5.0, model_name: str | None = None, temperature: float = 0):
-        super().__init__(model_name=model_name, temperature=temperature)
+    def __init__(
+        self,
+        threshold: float = 5.0,
+        model_name: str | None = None,
+        temperature: float = 0,
+        batch_size: int = 1,
+        score_cache_hours: float = 7 * 24,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(model_name=model_name, temperature=temperature, rate_limiter=rate_limiter)
         self.threshold = threshold
+        self.batch_size = max(1, batch_size)
+        self.score_cache_seconds = score_cache_hours * 3600
         self.prompt_template = ChatPromptTemplate.from_template(
             "Rate from 1 (boring) to 10 (exciting) how interesting this event is for a Zurich tech newsletter.\n" \
             "Return only the number.\nEVENT:\n{event_text}"
         )
         self.chain = self.prompt_template | self.llm | StrOutputParser()
-        logger.info("EventFilterAgent initialized with threshold %s", self.threshold)
+        self.batch_prompt_template = ChatPromptTemplate.from_template(
+            "Rate from 1 (boring) to 10 (exciting) how interesting each of the following events is for a Zurich tech newsletter.\n"
+            "Return only a JSON array with one object per event containing the keys \"index\" (the event's index) "
+            "and \"score\" (the number). No text outside the JSON array.\nEVENTS:\n{events_block}"
+        )
+        self.batch_chain = self.batch_prompt_template | self.llm | JsonOutputParser()
+        logger.info(
+            "EventFilterAgent initialized with threshold %s, batch size %d", self.threshold, self.batch_size
+        )
+
+    @staticmethod
+    def _event_text(event: Event, max_description_chars: Optional[int] = None) -> str:
+        description = (event.description or "")[:max_description_chars]
+        return f"Title: {event.summary}\nDescription: {description}\nLocation: {event.location or ''}"
+
+    def _score_key(self, event: Event) -> str:
+        return self._cache_key({"event": event_identity(event)}, variant="score")
+
+    def _cached_score(self, event: Event) -> Optional[float]:
+        cached = self.cache.get(self._score_key(event))
+        return float(cached) if isinstance(cached, (int, float)) else None
+
+    def _store_score(self, event: Event, score: float) -> None:
+        self.cache.set(self._score_key(event), score, ttl_seconds=self.score_cache_seconds)
+
+    @staticmethod
+    def _parse_score(value: Any) -> Optional[float]:
+        try:
+            score = float(str(value).strip())
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, min(score, 10.0))
+
+    def _invoke(self, chain: Any, inputs: Dict[str, Any], text: str) -> Any:
+        """Sends the request under the shared rate limit; results are cached per event, not per prompt."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire(estimate_tokens(text) + self.PROMPT_OVERHEAD_TOKENS)
+        return chain.invoke(inputs)
 
     def _score_event(self, event: Event) -> float:
-        event_text = f"Title: {event.summary}\nDescription: {event.description or ''}\nLocation: {event.location or ''}"
+        event_text = self._event_text(event)
         try:
-            output = self.chain.invoke({"event_text": event_text})
-            score = float(output.strip())
+            output = self._invoke(self.chain, {"event_text": event_text}, event_text)
         except Exception as exc:
             logger.error("Error scoring event '%s': %s", event.summary, exc, exc_info=True)
             return 0.0
+        score = self._parse_score(output)
+        if score is None:
+            logger.error("Unparseable score for event '%s': %r", event.summary, output)
+            return 0.0
+        self._store_score(event, score)
         return score
 
+    def score_batch(self, events: List[Event]) -> Dict[int, float]:
+        """
+        Rates several events with a single request.
+        Returns a mapping of list index to score; events missing from the
+        answer or with an unparseable score are missing in the result.
+        """
+        events_block = "\n\n".join(
+            f"[{idx}]\n{self._event_text(evt, self.MAX_DESCRIPTION_CHARS)}" for idx, evt in enumerate(events)
+        )
+        try:
+            response_data = self._invoke(self.batch_chain, {"events_block": events_block}, events_block)
+        except Exception as exc:
+            logger.error("Error scoring a batch of %d events: %s", len(events), exc, exc_info=True)
+            return {}
+
+        if isinstance(response_data, dict):  # Manche Modelle verpacken das Array in ein Objekt
+            response_data = next((v for v in response_data.values() if isinstance(v, list)), [response_data])
+        if not isinstance(response_data, list):
+            logger.warning("Unexpected batch scoring response: %s", type(response_data).__name__)
+            return {}
+
+        scores: Dict[int, float] = {}
+        for entry in response_data:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            score = self._parse_score(entry.get("score"))
+            if score is not None and 0 <= idx < len(events) and idx not in scores:
+                scores[idx] = score
+        return scores
+
+    def requests_needed(self, event_count: int) -> int:
+        """Upper bound of LLM requests for scoring ``event_count`` uncached events."""
+        if self.batch_size > 1 and event_count > 1:
+            return math.ceil(event_count / self.batch_size)
+        return event_count
+
+    def estimated_tokens(self, events: List[Event]) -> int:
+        """Rough token estimate for scoring the events that have no cached score yet."""
+        pending = [evt for evt in events if self._cached_score(evt) is None]
+        max_chars = self.MAX_DESCRIPTION_CHARS if self.batch_size > 1 and len(pending) > 1 else None
+        text_tokens = sum(estimate_tokens(self._event_text(evt, max_chars)) for evt in pending)
+        return text_tokens + self.requests_needed(len(pending)) * self.PROMPT_OVERHEAD_TOKENS
+
+    def filter_cached(self, events: List[Event]) -> List[Event]:
+        """Keeps the events whose cached score reaches the threshold, without any LLM request."""
+        filtered = [evt for evt in events if (self._cached_score(evt) or 0.0) >= self.threshold]
+        logger.info("EventFilterAgent kept %d of %d events using cached scores only", len(filtered), len(events))
+        return filtered
+
+    def _score_all(self, events: List[Event]) -> List[float]:
+        scores: List[Optional[float]] = [self._cached_score(evt) for evt in events]
+        pending = [idx for idx, score in enumerate(scores) if score is None]
+        cache_hits = len(events) - len(pending)
+        batched = self.batch_size > 1 and len(pending) > 1
+        if batched:
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                results = self.score_batch([events[idx] for idx in chunk])
+                for pos, idx in enumerate(chunk):
+                    if pos in results:
+                        scores[idx] = results[pos]
+                        self._store_score(events[idx], results[pos])
+        retried = 0
+        for idx, score in enumerate(scores):
+            if score is None:
+                retried += int(batched)
+                scores[idx] = self._score_event(events[idx])
+        logger.info(
+            "EventFilterAgent scored %d events (%d from cache, %d scored individually after batching)",
+            len(events), cache_hits, retried,
+        )
+        return [score or 0.0 for score in scores]
+
     def process_batch(self, events: List[Event]) -> List[Event]:
         if self.llm is None:
             logger.error("LLM not available for EventFilterAgent. Returning events unchanged.")
             return events
-        filtered: List[Event] = []
-        for evt in events:
-            score = self._score_event(evt)
-            if score >= self.threshold:
-                filtered.append(evt)
+        scores = self._score_all(events)
+        filtered = [evt for evt, score in zip(events, scores) if score >= self.threshold]
         logger.info("EventFilterAgent kept %d of %d events", len(filtered), len(events))
         return filtered
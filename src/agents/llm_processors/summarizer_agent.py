@@ -1,23 +1,41 @@
 # newsletter_project/src/agents/llm_processors/summarizer_agent.py
 # LLM-Agent zum Zusammenfassen von Texten (z.B. Artikel).
 
-from typing import List, Union, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Union, Optional, Dict
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser # Einfacher Parser für String-Antworten
 from src.models.data_models import RawArticle, ProcessedArticle # Unsere Datenmodelle
+from src.utils.async_runner import run_coroutine
+from src.utils.profiler import profile_section
+from src.utils.rate_limiter import RateLimiter, estimate_tokens
 from .base_processor import BaseLLMProcessor # Unsere Basisklasse
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Platzhalter, wenn das LLM keine Zusammenfassung lieferte; solche Artikel werden als
+# ``summary_failed`` markiert und im nächsten Lauf erneut verarbeitet
+SUMMARY_LLM_ERROR = "Zusammenfassung fehlgeschlagen (LLM-Fehler)."
+SUMMARY_EMPTY_RESPONSE = "Zusammenfassung konnte nicht erstellt werden (leere LLM-Antwort)."
+
 class SummarizerAgent(BaseLLMProcessor):
     """
     Ein LLM-Agent, der darauf spezialisiert ist, Texte (insbesondere Artikel) zusammenzufassen.
     """
+    # Maximale Eingabelänge in Zeichen, um Token-Limits und Kosten zu managen.
+    MAX_INPUT_CHARS = 4000
+    # Geschätzte Tokens für Prompt-Gerüst und Antwort, zusätzlich zum Artikeltext.
+    PROMPT_OVERHEAD_TOKENS = 250
+
     def __init__(self, 
                  model_name: Optional[str] = None, # Wird vom BaseLLMProcessor mit Default belegt
-                 temperature: float = 1): # Niedrigere Temperatur für faktenbasierte Zusammenfassungen
-        super().__init__(model_name=model_name, temperature=temperature)
+                 temperature: float = 1, # Niedrigere Temperatur für faktenbasierte Zusammenfassungen
+                 max_concurrency: int = 1, # >1 aktiviert die asynchrone Batch-Verarbeitung
+                 rate_limiter: Optional[RateLimiter] = None): # Gemeinsames Limit für Requests/Tokens pro Minute
+        super().__init__(model_name=model_name, temperature=temperature, rate_limiter=rate_limiter)
+        self.max_concurrency = max(1, max_concurrency)
         
         # Definiere das Prompt-Template für die Zusammenfassung.
         self.prompt_template = ChatPromptTemplate.from_messages([
@@ -58,29 +76,67 @@ ZUSAMMENFASSUNG:""")
         return article.title if article.title else ""
 
 
-    def summarize_article_text(self, title: Optional[str], text_content: str) -> str:
-        """Fasst einen gegebenen Text basierend auf einem Titel zusammen."""
+    def _build_chain_input(self, title: Optional[str], text_content: str) -> Optional[Dict[str, str]]:
+        """Erstellt die Eingabe für die Kette oder None, wenn der Text zu kurz ist."""
         if not text_content or len(text_content.strip()) < 20: # Mindestlänge für sinnvollen Input
             logger.warning(f"Zu wenig Inhalt für Titel '{title}' zum Zusammenfassen. Gebe leere Zusammenfassung zurück.")
+            return None
+        return {
+            "title": title or "Kein Titel",
+            "text_to_summarize": text_content[:self.MAX_INPUT_CHARS],
+        }
+
+    def _estimate_request_tokens(self, chain_input: Dict[str, str]) -> int:
+        return estimate_tokens(chain_input["title"]) + estimate_tokens(chain_input["text_to_summarize"]) + self.PROMPT_OVERHEAD_TOKENS
+
+    def summarize_article_text(self, title: Optional[str], text_content: str) -> str:
+        """Fasst einen gegebenen Text basierend auf einem Titel zusammen."""
+        chain_input = self._build_chain_input(title, text_content)
+        if chain_input is None:
             return "Keine Zusammenfassung möglich (unzureichender Inhalt)."
 
         logger.debug(f"Erstelle Zusammenfassung für Titel: '{title}' (Textlänge: {len(text_content)} Zeichen)")
         try:
-            # Begrenze die Länge des Inputs, um Token-Limits und Kosten zu managen.
-            # Zeichenlänge ist eine Annäherung. GPT-Modelle haben begrenzte Token-Limits.
-            max_input_chars_for_llm = 4000 # Kann je nach Modell angepasst werden
-            
-            summary_result = self.chain.invoke({
-                "title": title or "Kein Titel",
-                "text_to_summarize": text_content[:max_input_chars_for_llm] 
-            })
+            summary_result = self._invoke_cached(
+                self.chain, chain_input, estimated_tokens=self._estimate_request_tokens(chain_input)
+            )
             
             logger.debug(f"Zusammenfassung für '{title}' erfolgreich vom LLM erhalten.")
-            return summary_result.strip() if summary_result else "Zusammenfassung konnte nicht erstellt werden (leere LLM-Antwort)."
+            return summary_result.strip() if summary_result else SUMMARY_EMPTY_RESPONSE
         except Exception as e:
             logger.error(f"Fehler beim Zusammenfassen des Textes für Titel '{title}': {e}", exc_info=True)
-            return "Zusammenfassung fehlgeschlagen (LLM-Fehler)."
+            return SUMMARY_LLM_ERROR
 
+    async def asummarize_article_text(self, title: Optional[str], text_content: str) -> str:
+        """Asynchrone Variante von :meth:`summarize_article_text` (nutzt ``chain.ainvoke``)."""
+        chain_input = self._build_chain_input(title, text_content)
+        if chain_input is None:
+            return "Keine Zusammenfassung möglich (unzureichender Inhalt)."
+        try:
+            summary_result = await self._ainvoke_cached(
+                self.chain, chain_input, estimated_tokens=self._estimate_request_tokens(chain_input)
+            )
+            return summary_result.strip() if summary_result else SUMMARY_EMPTY_RESPONSE
+        except Exception as e:
+            logger.error(f"Fehler beim Zusammenfassen des Textes für Titel '{title}': {e}", exc_info=True)
+            return SUMMARY_LLM_ERROR
+
+    def _to_processed_article(self, article: RawArticle, summary: str) -> ProcessedArticle:
+        details: Dict[str, Any] = {"summarizer_model": self.model_name}
+        if summary in (SUMMARY_LLM_ERROR, SUMMARY_EMPTY_RESPONSE):
+            details["summary_failed"] = True
+        return ProcessedArticle(
+            title=article.title or "Unbekannter Titel",
+            url=article.url,
+            summary=summary,
+            # Kategorie und Relevanz werden von anderen Agenten hinzugefügt
+            source_name=article.source_name,
+            published_at=article.published_at,
+            llm_processing_details=details,
+            image_url=article.image_url,
+            related_sources=list(article.related_sources),
+            related_urls=list(article.related_urls),
+        )
 
     def process_article(self, article: RawArticle) -> ProcessedArticle:
         """
@@ -95,22 +151,29 @@ ZUSAMMENFASSUNG:""")
                  url=article.url,
                  summary="Fehler: LLM nicht verfügbar für Zusammenfassung.",
                  source_name=article.source_name,
-                 published_at=article.published_at
+                 published_at=article.published_at,
+                 llm_processing_details={"summary_failed": True}
              )
              
         text_to_summarize = self._get_text_for_summarization(article)
         summary = self.summarize_article_text(article.title, text_to_summarize)
-        
-        return ProcessedArticle(
-            title=article.title or "Unbekannter Titel",
-            url=article.url,
-            summary=summary,
-            # Kategorie und Relevanz werden von anderen Agenten hinzugefügt
-            source_name=article.source_name,
-            published_at=article.published_at,
-            llm_processing_details={"summarizer_model": self.model_name},
-            image_url=article.image_url
-        )
+        return self._to_processed_article(article, summary)
+
+    async def aprocess_batch(self, articles: List[RawArticle], max_concurrency: Optional[int] = None) -> List[ProcessedArticle]:
+        """
+        Fasst mehrere Artikel gleichzeitig zusammen (höchstens ``max_concurrency`` offene Anfragen).
+        Die Reihenfolge der Ergebnisse entspricht der Eingabe; Fehler bleiben auf den
+        jeweiligen Artikel beschränkt und liefern die üblichen Fallback-Zusammenfassungen.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+        async def summarize(article: RawArticle) -> ProcessedArticle:
+            async with semaphore:
+                text_to_summarize = self._get_text_for_summarization(article)
+                summary = await self.asummarize_article_text(article.title, text_to_summarize)
+                return self._to_processed_article(article, summary)
+
+        return list(await asyncio.gather(*(summarize(a) for a in articles)))
 
     def process_batch(self, articles: List[RawArticle]) -> List[ProcessedArticle]:
         """
@@ -121,6 +184,16 @@ ZUSAMMENFASSUNG:""")
              logger.error("LLM nicht initialisiert im SummarizerAgent. Batch-Verarbeitung abgebrochen.")
              return []
              
+        if self.max_concurrency > 1 and len(articles) > 1:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError: # Kein laufender Event-Loop -> asynchroner Batch möglich
+                logger.info(f"Starte asynchrone Batch-Zusammenfassung für {len(articles)} Artikel (max. {self.max_concurrency} parallel)...")
+                processed_articles_list = run_coroutine(self.aprocess_batch(articles))
+                logger.info(f"Batch-Zusammenfassung für {len(processed_articles_list)} Artikel abgeschlossen.")
+                return processed_articles_list
+            logger.warning("Bereits laufender Event-Loop erkannt. Verwende sequentielle Zusammenfassung; nutze aprocess_batch für asynchrone Aufrufer.")
+
         logger.info(f"Starte Batch-Zusammenfassung für {len(articles)} Artikel...")
         processed_articles_list: List[ProcessedArticle] = []
         
@@ -130,3 +203,52 @@ ZUSAMMENFASSUNG:""")
             
         logger.info(f"Batch-Zusammenfassung für {len(processed_articles_list)} Artikel abgeschlossen.")
         return processed_articles_list
+
+
+class SummaryPrefetcher:
+    """
+    Fasst Artikel im Hintergrund zusammen, während weitere Seiten noch abgerufen werden.
+
+    :meth:`submit` startet die Zusammenfassung eines Artikels sofort, :meth:`take`
+    liefert später die fertigen Ergebnisse (wartet ggf. auf laufende Anfragen).
+    Artikel werden über URL und Titel wiedererkannt.
+    """
+
+    def __init__(self, summarizer: SummarizerAgent, max_workers: Optional[int] = None):
+        self.summarizer = summarizer
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers or summarizer.max_concurrency), thread_name_prefix="summary"
+        )
+        self._futures: Dict[str, Future] = {}
+
+    @staticmethod
+    def _key(article: Union[RawArticle, ProcessedArticle]) -> str:
+        return f"{article.url}|{article.title}"
+
+    def submit(self, article: RawArticle) -> None:
+        key = self._key(article)
+        if key not in self._futures:
+            self._futures[key] = self._executor.submit(self._summarize, article)
+
+    def _summarize(self, article: RawArticle) -> ProcessedArticle:
+        with profile_section("SummarizerAgent.prefetch", "agent", items=1):
+            return self.summarizer.process_article(article)
+
+    def take(self, articles: List[RawArticle]) -> List[Optional[ProcessedArticle]]:
+        """Ergebnisse in der Reihenfolge von ``articles``; None für nicht (erfolgreich) vorab verarbeitete Artikel."""
+        results: List[Optional[ProcessedArticle]] = []
+        for article in articles:
+            future = self._futures.pop(self._key(article), None)
+            try:
+                results.append(future.result() if future is not None else None)
+            except Exception as e:
+                logger.error(f"Vorab-Zusammenfassung für '{article.title}' fehlgeschlagen: {e}")
+                results.append(None)
+        return results
+
+    def close(self) -> None:
+        """Verwirft nicht mehr benötigte Vorab-Zusammenfassungen."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,131 @@
+"""
+Lazy registry of the fetcher and agent classes.
+
+Importing a fetcher or agent module pulls in heavy client libraries
+(``openai``, ``langchain_openai``, ``googleapiclient``, ...). The registry maps
+class names to their modules, so the packages and the orchestrator can
+import a class only when it is actually used, and :class:`LazyComponent`
+builds the configured instances on first access.
+"""
+
+import importlib
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS: Dict[str, str] = {
+    # Data fetchers
+    "BaseDataFetcher": "src.agents.data_fetchers.base_fetcher",
+    "NewsAPIFetcher": "src.agents.data_fetchers.newsapi_fetcher",
+    "OpenWeatherMapFetcher": "src.agents.data_fetchers.openweathermap_fetcher",
+    "GoogleCalendarFetcher": "src.agents.data_fetchers.google_calendar_fetcher",
+    "BirthdaySheetFetcher": "src.agents.data_fetchers.birthday_sheet_fetcher",
+    "TodoistFetcher": "src.agents.data_fetchers.todoist_fetcher",
+    "EuropeanaFetcher": "src.agents.data_fetchers.europeana_fetcher",
+    "ZenQuotesFetcher": "src.agents.data_fetchers.zenquotes_fetcher",
+    "EventbriteFetcher": "src.agents.data_fetchers.eventbrite_fetcher",
+    "OpenAIWebEventFetcher": "src.agents.data_fetchers.openai_web_event_fetcher",
+    "OpenAILinkEventFetcher": "src.agents.data_fetchers.openai_link_event_fetcher",
+    # LLM agents
+    "SummarizerAgent": "src.agents.llm_processors.summarizer_agent",
+    "SummaryPrefetcher": "src.agents.llm_processors.summarizer_agent",
+    "CategorizerAgent": "src.agents.llm_processors.categorizer_agent",
+    "ArticleWriterAgent": "src.agents.llm_processors.article_writer_agent",
+    "ArtDescriptionAgent": "src.agents.llm_processors.art_description_agent",
+    "EventFilterAgent": "src.agents.llm_processors.event_filter_agent",
+    # Distributors
+    "GDriveUploader": "src.agents.distributors.gdrive_uploader",
+}
+
+
+def load_component(name: str) -> Any:
+    """Imports the module of a registered class and returns the class."""
+    try:
+        module_name = COMPONENTS[name]
+    except KeyError:
+        raise KeyError(f"Unbekannte Komponente '{name}'. Registriert: {sorted(COMPONENTS)}") from None
+    return getattr(importlib.import_module(module_name), name)
+
+
+def lazy_exports(package: str, names: Iterable[str]) -> Callable[[str], Any]:
+    """
+    Returns a module-level ``__getattr__`` (PEP 562) for ``package`` that
+    resolves the given class names through the registry on first access.
+    """
+    exported = set(names)
+    package_module = importlib.import_module(package)
+
+    def __getattr__(name: str) -> Any:
+        if name not in exported:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = load_component(name)
+        setattr(package_module, name, value)  # Folgezugriffe ohne __getattr__
+        return value
+
+    return __getattr__
+
+
+class LazyComponent:
+    """
+    Descriptor for a fetcher or agent of the orchestrator that is built on
+    first access and then cached on the instance.
+
+    The component is only built if all ``requires`` environment variables are
+    set; otherwise (or if ``factory`` raises) the attribute resolves to
+    ``default``. Assigning the attribute directly (e.g. in tests) bypasses
+    the factory. Construction is serialised per attribute, so stages that
+    start in parallel share one instance.
+
+    Args:
+        factory: Builds the component from the owning instance.
+        requires: Environment variables the source needs (e.g. its API key).
+        default: Value if the source is disabled or cannot be built.
+        label: Name used in log messages (defaults to the attribute name).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Any], Any],
+        requires: Iterable[str] = (),
+        default: Any = None,
+        label: Optional[str] = None,
+    ):
+        self.factory = factory
+        self.requires = tuple(requires)
+        self.default = default
+        self.label = label
+        self.name = ""
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.label = self.label or name
+
+    def missing_requirements(self) -> List[str]:
+        return [var for var in self.requires if not os.getenv(var)]
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        with self._lock:
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            instance.__dict__[self.name] = value = self._build(instance)
+            return value
+
+    def _build(self, instance: Any) -> Any:
+        missing = self.missing_requirements()
+        if missing:
+            logger.info(f"{self.label} nicht konfiguriert ({', '.join(missing)} fehlt), wird übersprungen.")
+            return self.default
+        try:
+            value = self.factory(instance)
+        except Exception as e:
+            logger.error(f"Fehler bei der Initialisierung von {self.label}: {e}", exc_info=True)
+            return self.default
+        if value is not None:
+            logger.info(f"{self.label} erfolgreich initialisiert.")
+        return value if value is not None else self.default
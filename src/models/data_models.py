@@ -6,39 +6,19 @@ from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, date, timezone
 import logging
 
+from src.utils.datetime_utils import parse_datetime
+
 logger = logging.getLogger(__name__)
 
 def ensure_timezone_aware(dt_value: Optional[Union[datetime, str]]) -> Optional[datetime]:
-    """Stellt sicher, dass ein datetime-Objekt timezone-aware ist (UTC als Default). Akzeptiert auch Strings."""
-    if dt_value is None:
-        return None
-    
-    if isinstance(dt_value, str):
-        try:
-            # Versuche, gängige ISO-Formate zu parsen, inklusive 'Z' für UTC
-            if dt_value.endswith('Z'):
-                dt_value = datetime.fromisoformat(dt_value.replace('Z', '+00:00'))
-            else:
-                # Prüfe, ob bereits Zeitzoneninfo vorhanden ist
-                # Dieser Teil ist etwas heikel, da fromisoformat nicht alle TZ-Formate direkt mag
-                try:
-                    dt_value = datetime.fromisoformat(dt_value)
-                except ValueError: # Fallback für Formate wie "YYYY-MM-DD HH:MM:SS" ohne TZ
-                    dt_value = datetime.strptime(dt_value, "%Y-%m-%d %H:%M:%S")
-
-        except ValueError as e:
-            logger.warning(f"Ungültiges Datumsstring-Format für Konvertierung: '{dt_value}'. Fehler: {e}")
-            return None # Oder wirf einen Fehler, je nach gewünschtem Verhalten
-
-    if not isinstance(dt_value, datetime): # Wenn nach der Konvertierung immer noch kein datetime
-        logger.warning(f"Wert '{dt_value}' konnte nicht in ein datetime-Objekt konvertiert werden.")
-        return None
-
-    if dt_value.tzinfo is None or dt_value.tzinfo.utcoffset(dt_value) is None:
-        # Wenn keine Zeitzoneninfo vorhanden ist, setze auf UTC
-        return dt_value.replace(tzinfo=timezone.utc)
-    # Wenn bereits timezone-aware, gib es direkt zurück
-    return dt_value
+    """
+    Stellt sicher, dass ein datetime-Objekt timezone-aware ist (UTC als Default). Akzeptiert auch Strings,
+    die über den gecachten Parser in ``src.utils.datetime_utils`` gelesen werden.
+    """
+    if dt_value is None or isinstance(dt_value, (datetime, str)):
+        return parse_datetime(dt_value)
+    logger.warning(f"Wert '{dt_value}' konnte nicht in ein datetime-Objekt konvertiert werden.")
+    return None
 
 class RawArticle(BaseModel):
     title: Optional[str] = Field(default=None)
@@ -49,6 +29,9 @@ class RawArticle(BaseModel):
     source_name: Optional[str] = Field(default=None)
     source_id: Optional[str] = Field(default=None) # z.B. von NewsAPI
     image_url: Optional[HttpUrl] = Field(default=None)
+    # Weitere Quellen derselben Meldung (von der Deduplizierung zusammengeführt)
+    related_sources: List[str] = Field(default_factory=list)
+    related_urls: List[str] = Field(default_factory=list)
 
     _ensure_published_at_tz_aware = field_validator('published_at', mode='before')(ensure_timezone_aware)
 
@@ -64,6 +47,8 @@ class ProcessedArticle(BaseModel):
     llm_processing_details: Dict[str, Any] = Field(default_factory=dict)
     article_text: Optional[str] = Field(default=None)
     image_url: Optional[HttpUrl] = Field(default=None)
+    related_sources: List[str] = Field(default_factory=list)
+    related_urls: List[str] = Field(default_factory=list)
 
     _ensure_published_at_tz_aware = field_validator('published_at', mode='before')(ensure_timezone_aware)
 
@@ -75,6 +60,7 @@ class Event(BaseModel):
     description: Optional[str] = Field(default=None)
     url: Optional[HttpUrl] = Field(default=None)
     source: str # z.B. "Google Calendar", "Veranstaltungen Zürich API"
+    sources: List[str] = Field(default_factory=list) # Alle Quellen, die dieses Event gemeldet haben (nach Deduplizierung)
 
     _ensure_start_time_tz_aware = field_validator('start_time', mode='before')(ensure_timezone_aware)
     _ensure_end_time_tz_aware = field_validator('end_time', mode='before')(ensure_timezone_aware)
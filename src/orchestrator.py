@@ -2,172 +2,231 @@
 # Steuert den gesamten Ablauf der Newsletter-Generierung.
 
 import logging
-from datetime import datetime, timezone, date
-from typing import List, Optional, Any, Dict 
-
-from src.utils.config_loader import load_env, get_env_variable
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone, date
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Any, Dict, Callable, Iterable
+
+from src.utils.config_loader import load_env, get_env_variable, get_env_int, get_env_float, get_env_bool, get_env_list
 from src.models.data_models import (
     RawArticle,
     ProcessedArticle,
     Event,
     WeatherInfo,
     Quote,
+    Birthday,
+    TodoItem,
 )
-from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
-from src.agents.data_fetchers.google_calendar_fetcher import GoogleCalendarFetcher
-from src.agents.data_fetchers.openweathermap_fetcher import OpenWeatherMapFetcher
-from src.agents.data_fetchers.zenquotes_fetcher import ZenQuotesFetcher
-from src.agents.data_fetchers.eventbrite_fetcher import EventbriteFetcher
-from src.agents.data_fetchers.openai_web_event_fetcher import OpenAIWebEventFetcher
-from src.agents.data_fetchers.openai_link_event_fetcher import OpenAILinkEventFetcher
-from src.agents.llm_processors.summarizer_agent import SummarizerAgent
-from src.agents.llm_processors.categorizer_agent import CategorizerAgent
-from src.agents.llm_processors.article_writer_agent import ArticleWriterAgent
-from src.agents.llm_processors.event_filter_agent import EventFilterAgent
-from src.utils.epub_utils import generate_epub
+from src.agents.registry import LazyComponent, load_component
 from src.utils.birthday_utils import get_upcoming_birthdays
-from src.agents.data_fetchers.birthday_sheet_fetcher import BirthdaySheetFetcher
-
-from src.agents.data_fetchers.todoist_fetcher import TodoistFetcher
-
-from src.agents.distributors.gdrive_uploader import GDriveUploader
+from src.utils.fetch_scheduler import FetchScheduler
+from src.utils.stage_graph import StageGraph, StageExecutionError
+from src.utils.rate_limiter import RateLimiter
+from src.utils.llm_cache import get_llm_cache
+from src.utils.profiler import RunProfiler, profile_section
+from src.utils.usage_ledger import UsageLedger, get_active_ledger, parse_prices
+from src.utils.http_cache import get_http_cache
+from src.utils.article_dedup import ArticleDeduplicator
+from src.utils.event_dedup import deduplicate_events
+from src.utils.event_prefilter import EventPrefilter, PrefilterResult
+from src.utils.article_triage import ArticleTriage, parse_source_weights
+from src.utils.state_store import FetchStateStore, article_key, get_state_store
+from src.utils.checkpoints import CheckpointStore
+
+if TYPE_CHECKING:
+    # Fetcher und Agenten werden erst bei Bedarf über die Registry importiert (siehe LazyComponent)
+    from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
+    from src.agents.llm_processors.summarizer_agent import SummaryPrefetcher
 
 logger = logging.getLogger(__name__)
 
-class NewsletterOrchestrator:
-    def __init__(self):
-        load_env()
-        logger.info("Initialisiere Newsletter Orchestrator...")
 
-        blacklist_raw = get_env_variable("NEWSLETTER_SOURCE_BLACKLIST", "")
-        self.source_blacklist = [s.strip().lower() for s in blacklist_raw.split(',') if s.strip()] if blacklist_raw else []
-        if self.source_blacklist:
-            logger.info(f"Quellen-Blacklist aktiv: {self.source_blacklist}")
+class PipelineAbort(Exception):
+    """Beendet die Pipeline vorzeitig mit einer Statusmeldung (z.B. wenn keine Artikel gefunden wurden)."""
+
 
-        self.news_api_fetchers: List[NewsAPIFetcher] = [
-            NewsAPIFetcher(query="Künstliche Intelligenz OR Technologie", language="de", endpoint="everything", days_ago=1, page_size=3, source_name_override="KI & Tech News (DE)"), # page_size reduziert für Tests
-            NewsAPIFetcher(country="ch", category="technology", endpoint="top-headlines", page_size=2, source_name_override="Schweiz Tech-Schlagzeilen"),
-            NewsAPIFetcher(query="global innovation OR science breakthrough", language="en", endpoint="everything", days_ago=1, page_size=3, source_name_override="Internationale Innovation (EN)")
+class NewsletterOrchestrator:
+    # Hintergrund-Zusammenfassungen des laufenden Abrufs (nur während eines Pipeline-Laufs gesetzt)
+    summary_prefetcher: Optional["SummaryPrefetcher"] = None
+    # State-Store für inkrementelle Läufe (None = jeder Lauf holt das ganze Zeitfenster)
+    state_store: Optional[FetchStateStore] = None
+    history_hours: float = 24.0
+    # Deterministischer Vorfilter vor der LLM-Bewertung der Termine (None = nur Duplikate entfernen)
+    event_prefilter: Optional[EventPrefilter] = None
+    # Triage vor der Zusammenfassung (None = alle Artikel zusammenfassen) und ihre Zahlen im letzten Lauf
+    article_triage: Optional[ArticleTriage] = None
+    triage_stats: Optional[Dict[str, int]] = None
+    # Token-Budget pro Lauf (None = unbegrenzt) und Preise je Modell (USD pro Million Tokens)
+    llm_token_budget: Optional[int] = None
+    llm_prices: Optional[Dict[str, Any]] = None
+    # Laufprofil und Usage-Ledger des letzten Laufs
+    profiler: Optional[RunProfiler] = None
+    usage_ledger: Optional[UsageLedger] = None
+    # Checkpoints der Stage-Ergebnisse für --resume (None = keine Checkpoints) und Lauf-ID des aktuellen Laufs
+    checkpoint_store: Optional[CheckpointStore] = None
+    run_id: Optional[str] = None
+    # Stages, deren Ergebnis nach jedem Lauf gesichert wird (history, triage und event_prefilter sind billig neu zu berechnen)
+    CHECKPOINT_STAGES = ("news_fetch", "summarize", "categorize", "write", "events_fetch", "event_filter", "extras_fetch")
+    # Zusätzlicher Checkpoint neben news_fetch: noch nicht bestätigte Artikel je Fetcher
+    PENDING_CHECKPOINT = "news_pending"
+
+    # --- Fetcher und Agenten: werden erst beim ersten Zugriff importiert und erstellt ---
+
+    def _build_news_fetchers(self) -> List["NewsAPIFetcher"]:
+        news_api_fetcher = load_component("NewsAPIFetcher")
+        # Alle NewsAPI-Abfragen teilen sich ein Request-Budget; mehrere Seiten pro Abfrage sind optional
+        news_paging = {
+            "max_articles": get_env_int("NEWSAPI_MAX_ARTICLES", 0) or None,
+            "time_budget": get_env_float("NEWSAPI_TIME_BUDGET", None),
+            "rate_limiter": self.news_rate_limiter,
+            "state_store": self.state_store,
+        }
+        return [
+            news_api_fetcher(query="Künstliche Intelligenz OR Technologie", language="de", endpoint="everything", days_ago=1, page_size=3, source_name_override="KI & Tech News (DE)", **news_paging), # page_size reduziert für Tests
+            news_api_fetcher(country="ch", category="technology", endpoint="top-headlines", page_size=2, source_name_override="Schweiz Tech-Schlagzeilen", **news_paging),
+            news_api_fetcher(query="global innovation OR science breakthrough", language="en", endpoint="everything", days_ago=1, page_size=3, source_name_override="Internationale Innovation (EN)", **news_paging)
         ]
 
+    def _build_calendar_fetcher(self) -> Any:
+        cal_id = get_env_variable("GOOGLE_CALENDAR_ID", "primary")
+        return load_component("GoogleCalendarFetcher")(get_env_variable("GOOGLE_CALENDAR_CREDENTIALS_JSON"), cal_id)
 
-        # Optional: Google Calendar Fetcher für Termine
-        calendar_creds = get_env_variable("GOOGLE_CALENDAR_CREDENTIALS_JSON")
-        if calendar_creds:
-            cal_id = get_env_variable("GOOGLE_CALENDAR_ID", "primary")
-            try:
-                self.calendar_fetcher = GoogleCalendarFetcher(calendar_creds, cal_id)
-                logger.info("GoogleCalendarFetcher erfolgreich initialisiert.")
-            except Exception as e:
-                logger.error(f"Fehler bei der Initialisierung des GoogleCalendarFetcher: {e}")
-                self.calendar_fetcher = None
-        else:
-            self.calendar_fetcher = None
-
-        # Eventbrite fetcher
-        try:
-            self.eventbrite_fetcher = EventbriteFetcher()
-            logger.info("EventbriteFetcher erfolgreich initialisiert.")
-        except Exception as e:
-            logger.error("Fehler bei der Initialisierung des EventbriteFetchers: %s", e, exc_info=True)
-            self.eventbrite_fetcher = None
+    def _build_eventbrite_fetcher(self) -> Any:
+        return load_component("EventbriteFetcher")()
 
+    def _build_web_event_fetcher(self) -> Any:
         # Events via OpenAI web search
-        try:
-            search_query = get_env_variable("EVENT_SEARCH_QUERY", "events in Zurich")
-            self.web_event_fetcher = OpenAIWebEventFetcher(query=search_query)
-            logger.info("OpenAIWebEventFetcher erfolgreich initialisiert.")
-        except Exception as e:
-            logger.error("Fehler bei der Initialisierung des OpenAIWebEventFetcher: %s", e, exc_info=True)
-            self.web_event_fetcher = None
+        search_query = get_env_variable("EVENT_SEARCH_QUERY", "events in Zurich")
+        return load_component("OpenAIWebEventFetcher")(query=search_query)
 
+    def _build_link_event_fetcher(self) -> Any:
         # Events from specific links via OpenAI search
-        links_raw = get_env_variable("EVENT_LINKS", "")
-        self.link_event_fetcher = None
-        if links_raw:
-            urls = [u.strip() for u in links_raw.split(',') if u.strip()]
-            if urls:
-                try:
-                    self.link_event_fetcher = OpenAILinkEventFetcher(urls=urls)
-                    logger.info("OpenAILinkEventFetcher erfolgreich initialisiert.")
-                except Exception as e:
-                    logger.error("Fehler bei der Initialisierung des OpenAILinkEventFetcher: %s", e, exc_info=True)
-
-
+        urls = get_env_list("EVENT_LINKS")
+        if not urls:
+            return None
+        return load_component("OpenAILinkEventFetcher")(
+            urls=urls,
+            max_concurrency=get_env_int("EVENT_LINKS_MAX_CONCURRENCY", 4),
+            site_timeout=get_env_float("EVENT_LINKS_SITE_TIMEOUT", 45.0) or None,
+            time_budget=get_env_float("EVENT_LINKS_TIME_BUDGET", 55.0) or None,
+            cache_ttl_hours=get_env_float("EVENT_LINKS_CACHE_HOURS", 12.0),
+        )
+
+    def _build_weather_fetcher(self) -> Any:
         # Weather fetcher for Zurich
-        try:
-            self.weather_fetcher = OpenWeatherMapFetcher(city="Zurich")
-            logger.info("OpenWeatherMapFetcher erfolgreich initialisiert.")
-        except Exception as e:
-            logger.error(f"Fehler bei der Initialisierung des OpenWeatherMapFetcher: {e}", exc_info=True)
-            self.weather_fetcher = None
-
-        self.quote_fetcher = ZenQuotesFetcher()
-
+        return load_component("OpenWeatherMapFetcher")(city="Zurich")
+
+    def _build_quote_fetcher(self) -> Any:
+        return load_component("ZenQuotesFetcher")()
+
+    def _build_birthday_fetcher(self) -> Any:
+        return load_component("BirthdaySheetFetcher")(
+            get_env_variable("GOOGLE_SHEETS_CREDENTIALS_JSON"),
+            get_env_variable("BIRTHDAY_SHEET_ID"),
+            get_env_variable("BIRTHDAY_SHEET_RANGE", "A2:B"),
+        )
+
+    def _build_todo_fetcher(self) -> Any:
+        return load_component("TodoistFetcher")()
+
+    def _build_summarizer(self) -> Any:
+        return load_component("SummarizerAgent")(
+            max_concurrency=get_env_int("SUMMARIZER_MAX_CONCURRENCY", 8),
+            rate_limiter=self.llm_rate_limiter,
+        )
+
+    def _build_categorizer(self) -> Any:
+        logger.info(f"Kategorien: {self.newsletter_categories}")
+        return load_component("CategorizerAgent")(
+            categories=self.newsletter_categories,
+            batch_token_budget=get_env_int("CATEGORIZER_BATCH_TOKEN_BUDGET", 3000) or None,
+            rate_limiter=self.llm_rate_limiter,
+        )
+
+    def _build_event_filter(self) -> Any:
+        return load_component("EventFilterAgent")(
+            batch_size=get_env_int("EVENT_FILTER_BATCH_SIZE", 20),
+            score_cache_hours=get_env_float("EVENT_FILTER_CACHE_HOURS", 7 * 24),
+            rate_limiter=self.llm_rate_limiter,
+        )
+
+    def _build_article_writer(self) -> Any:
+        return load_component("ArticleWriterAgent")(
+            max_concurrency=get_env_int("ARTICLE_WRITER_MAX_CONCURRENCY", 3),
+            stream=get_env_bool("ARTICLE_WRITER_STREAM", False),
+        )
+
+    news_api_fetchers = LazyComponent(_build_news_fetchers, requires=["NEWSAPI_API_KEY"], default=(), label="NewsAPIFetcher")
+    # Optional: Google Calendar Fetcher für Termine
+    calendar_fetcher = LazyComponent(_build_calendar_fetcher, requires=["GOOGLE_CALENDAR_CREDENTIALS_JSON"], label="GoogleCalendarFetcher")
+    eventbrite_fetcher = LazyComponent(_build_eventbrite_fetcher, requires=["EVENTBRITE_OAUTH_TOKEN"], label="EventbriteFetcher")
+    web_event_fetcher = LazyComponent(_build_web_event_fetcher, requires=["OPENAI_API_KEY"], label="OpenAIWebEventFetcher")
+    link_event_fetcher = LazyComponent(_build_link_event_fetcher, requires=["OPENAI_API_KEY", "EVENT_LINKS"], label="OpenAILinkEventFetcher")
+    weather_fetcher = LazyComponent(_build_weather_fetcher, requires=["OPENWEATHER_API_KEY"], label="OpenWeatherMapFetcher")
+    quote_fetcher = LazyComponent(_build_quote_fetcher, label="ZenQuotesFetcher")
+    birthday_fetcher = LazyComponent(_build_birthday_fetcher, requires=["GOOGLE_SHEETS_CREDENTIALS_JSON", "BIRTHDAY_SHEET_ID"], label="BirthdaySheetFetcher")
+    todo_fetcher = LazyComponent(_build_todo_fetcher, requires=["TODOIST_API_TOKEN"], label="TodoistFetcher")
+    summarizer = LazyComponent(_build_summarizer, requires=["OPENAI_API_KEY"], label="SummarizerAgent")
+    categorizer = LazyComponent(_build_categorizer, requires=["OPENAI_API_KEY"], label="CategorizerAgent")
+    event_filter = LazyComponent(_build_event_filter, requires=["OPENAI_API_KEY"], label="EventFilterAgent")
+    article_writer = LazyComponent(_build_article_writer, requires=["OPENAI_API_KEY"], label="ArticleWriterAgent")
 
-        
-        try:
-            self.summarizer = SummarizerAgent() 
-            logger.info("SummarizerAgent erfolgreich initialisiert.")
-        except Exception as e:
-            logger.critical(f"Fehler bei der Initialisierung des SummarizerAgent: {e}", exc_info=True)
-            self.summarizer = None
-        
-        try:
-            # Lade Kategorien aus .env oder verwende einen Default
-            categories_str = get_env_variable("NEWSLETTER_CATEGORIES", "IT & AI,Welt und Politik,Wirtschaft,Zürich Inside,Kultur und Inspiration,Der Rund um Blick")
-            self.newsletter_categories = [cat.strip() for cat in categories_str.split(',')]
-            if not self.newsletter_categories or not all(self.newsletter_categories): # Prüft auf leere Liste oder leere Strings
-                logger.warning("Keine gültigen Kategorien gefunden. Verwende Fallback-Kategorien.")
-                self.newsletter_categories = ["Allgemein"] # Fallback
-
-            self.categorizer = CategorizerAgent(categories=self.newsletter_categories)
-            logger.info(f"CategorizerAgent erfolgreich initialisiert mit Kategorien: {self.newsletter_categories}")
-        except Exception as e:
-            logger.critical(
-                f"Fehler bei der Initialisierung des CategorizerAgent: {e}", exc_info=True
-            )
-            self.categorizer = None
-
-        try:
-            self.event_filter = EventFilterAgent()
-            logger.info("EventFilterAgent erfolgreich initialisiert.")
-        except Exception as e:
-            logger.error("Fehler bei der Initialisierung des EventFilterAgent: %s", e, exc_info=True)
-            self.event_filter = None
+    def __init__(self):
+        load_env()
+        logger.info("Initialisiere Newsletter Orchestrator...")
 
-        try:
-            self.article_writer = ArticleWriterAgent()
-            logger.info("ArticleWriterAgent erfolgreich initialisiert.")
-        except Exception as e:
-            logger.critical(
-                f"Fehler bei der Initialisierung des ArticleWriterAgent: {e}", exc_info=True
+        blacklist_raw = get_env_variable("NEWSLETTER_SOURCE_BLACKLIST", "")
+        self.source_blacklist = [s.strip().lower() for s in blacklist_raw.split(',') if s.strip()] if blacklist_raw else []
+        if self.source_blacklist:
+            logger.info(f"Quellen-Blacklist aktiv: {self.source_blacklist}")
+        # Maximale Hamming-Distanz der SimHash-Fingerprints für Near-Duplicates (negativ = Deduplizierung aus)
+        self.dedup_max_distance = get_env_int("NEWS_DEDUP_MAX_DISTANCE", 3)
+
+        # Inkrementeller Modus: nur neue Artikel abrufen und mit gespeicherten Ergebnissen früherer Läufe zusammenführen
+        if get_env_bool("NEWS_INCREMENTAL", False):
+            self.state_store = get_state_store()
+            self.history_hours = get_env_float("NEWS_HISTORY_HOURS", 24.0)
+            logger.info(f"Inkrementeller Abruf aktiv (Artikel der letzten {self.history_hours}h werden übernommen).")
+
+        self.news_rate_limiter = RateLimiter(requests_per_minute=get_env_float("NEWSAPI_REQUESTS_PER_MINUTE", None))
+        # Zusammenfassungen schon während des Abrufs starten
+        self.prefetch_summaries = get_env_bool("NEWS_PREFETCH_SUMMARIES", True)
+
+        # Gemeinsames Rate-Limit für die LLM-Aufrufe (nicht gesetzt = unbegrenzt)
+        self.llm_rate_limiter = RateLimiter(
+            requests_per_minute=get_env_float("OPENAI_REQUESTS_PER_MINUTE", None),
+            tokens_per_minute=get_env_float("OPENAI_TOKENS_PER_MINUTE", None),
+        )
+
+        # Lade Kategorien aus .env oder verwende einen Default
+        categories_str = get_env_variable("NEWSLETTER_CATEGORIES", "IT & AI,Welt und Politik,Wirtschaft,Zürich Inside,Kultur und Inspiration,Der Rund um Blick")
+        self.newsletter_categories = [cat.strip() for cat in categories_str.split(',')]
+        if not self.newsletter_categories or not all(self.newsletter_categories): # Prüft auf leere Liste oder leere Strings
+            logger.warning("Keine gültigen Kategorien gefunden. Verwende Fallback-Kategorien.")
+            self.newsletter_categories = ["Allgemein"] # Fallback
+
+        self.event_prefilter = EventPrefilter(
+            max_days_ahead=get_env_float("EVENT_MAX_DAYS_AHEAD", 14.0) or None,
+            allow_keywords=get_env_list("EVENT_ALLOW_KEYWORDS"),
+            deny_keywords=get_env_list("EVENT_DENY_KEYWORDS"),
+        )
+
+        # Nur die vielversprechendsten Artikel zusammenfassen (0 = alle)
+        triage_top_k = get_env_int("NEWS_TRIAGE_TOP_K", 0)
+        if triage_top_k > 0:
+            self.article_triage = ArticleTriage(
+                triage_top_k,
+                self.newsletter_categories,
+                keywords=get_env_list("NEWS_TRIAGE_KEYWORDS"),
+                source_weights=parse_source_weights(get_env_list("NEWS_TRIAGE_SOURCE_WEIGHTS")),
+                half_life_hours=get_env_float("NEWS_TRIAGE_HALF_LIFE_HOURS", 12.0) or 12.0,
             )
-            self.article_writer = None
-
-        # Birthday fetcher initialisieren
-        self.birthday_fetcher = None
-        creds = get_env_variable("GOOGLE_SHEETS_CREDENTIALS_JSON")
-        sheet_id = get_env_variable("BIRTHDAY_SHEET_ID")
-        sheet_range = get_env_variable("BIRTHDAY_SHEET_RANGE", "A2:B")
-        if creds and sheet_id:
-            try:
-                self.birthday_fetcher = BirthdaySheetFetcher(creds, sheet_id, sheet_range)
-                logger.info("BirthdaySheetFetcher erfolgreich initialisiert.")
-            except Exception as e:
-                logger.error(
-                    f"Fehler bei der Initialisierung des BirthdaySheetFetcher: {e}",
-                    exc_info=True,
-                )
-                
-
-        try:
-            self.todo_fetcher = TodoistFetcher()
-            logger.info("TodoistFetcher erfolgreich initialisiert.")
-        except Exception as e:
-            logger.error("Fehler bei der Initialisierung des TodoistFetchers: %s", e, exc_info=True)
-            self.todo_fetcher = None
-
+            if self.prefetch_summaries:
+                # Die Triage braucht alle Artikel; Vorab-Zusammenfassungen würden die Auswahl vorwegnehmen
+                logger.info("Artikel-Triage aktiv: Zusammenfassungen starten erst nach dem Abruf.")
+                self.prefetch_summaries = False
 
         # Wie viele Artikel sollen voll ausgeschrieben werden?
         top_n_str = get_env_variable("NEWSLETTER_TOP_ARTICLE_COUNT", "3")
@@ -179,25 +238,55 @@ class NewsletterOrchestrator:
             )
             self.top_article_count = 3
 
+        # Token-Budget: ist es fast aufgebraucht, werden weniger Artikel ausgeschrieben und Termine nicht mehr bewertet
+        self.llm_token_budget = get_env_int("LLM_TOKEN_BUDGET_PER_RUN", 0) or None
+        self.llm_prices = parse_prices(get_env_variable("LLM_PRICES_PER_MILLION", ""))
+
+        # Parallele Datensammlung: Worker-Pool und Timeouts (Sekunden, 0 = kein Limit)
+        self.fetch_max_workers = max(1, get_env_int("FETCH_MAX_WORKERS", 8))
+        self.fetch_source_timeout = get_env_float("FETCH_SOURCE_TIMEOUT", 60.0) or None
+        self.fetch_global_timeout = get_env_float("FETCH_GLOBAL_TIMEOUT", 120.0) or None
+        # Wie viele Stages (z.B. Nachrichten- und Terminkette) gleichzeitig laufen dürfen
+        self.pipeline_max_workers = max(1, get_env_int("PIPELINE_MAX_WORKERS", 4))
+        self.stage_graph: Optional[StageGraph] = None
+        # Zwischenergebnisse je Lauf sichern, damit ein abgebrochener Lauf mit --resume fortgesetzt werden kann
+        checkpoint_dir = get_env_variable("PIPELINE_CHECKPOINT_DIR", os.path.join("tmp", "checkpoints"))
+        if checkpoint_dir:
+            self.checkpoint_store = CheckpointStore(
+                checkpoint_dir,
+                keep_runs=max(1, get_env_int("PIPELINE_CHECKPOINT_KEEP_RUNS", 5)),
+                retention_seconds=get_env_float("PIPELINE_CHECKPOINT_RETENTION_DAYS", 7.0) * 24 * 3600,
+            )
+
         logger.info("Newsletter Orchestrator initialisiert.")
 
-    def _fetch_all_data(self) -> List[RawArticle]:
-        # ... (Code bleibt gleich wie in Schritt 5) ...
-        all_fetched_articles: List[RawArticle] = []
-        logger.info("Starte Datensammlung von allen konfigurierten Quellen...")
-        for fetcher in self.news_api_fetchers:
-            try:
-                logger.info(f"Rufe Daten von Fetcher '{fetcher.source_name}' ab...")
-                articles = fetcher.fetch_data()
-                if articles:
-                    all_fetched_articles.extend(articles)
-                    logger.info(f"{len(articles)} Artikel von '{fetcher.source_name}' erfolgreich abgerufen.")
-                else:
-                    logger.info(f"Keine Artikel von '{fetcher.source_name}' abgerufen.")
-            except Exception as e:
-                logger.error(f"Fehler beim Abrufen von Daten durch Fetcher '{fetcher.source_name}': {e}", exc_info=True)
-        logger.info(f"Insgesamt {len(all_fetched_articles)} Rohartikel von allen Quellen gesammelt.")
-        return all_fetched_articles
+    def _make_fetch_scheduler(self) -> FetchScheduler:
+        """Erstellt einen FetchScheduler mit der konfigurierten Parallelität und den Timeouts."""
+        return FetchScheduler(
+            max_workers=self.fetch_max_workers,
+            source_timeout=self.fetch_source_timeout,
+            global_timeout=self.fetch_global_timeout,
+        )
+
+    def _iter_news_from(self, fetcher: "NewsAPIFetcher") -> Iterable[RawArticle]:
+        """Liefert die Artikel eines einzelnen News-Fetchers, seitenweise falls unterstützt."""
+        logger.info(f"Rufe Daten von Fetcher '{fetcher.source_name}' ab...")
+        iter_articles = getattr(fetcher, "iter_articles", None)
+        if iter_articles is None:
+            yield from fetcher.fetch_data() or []
+            return
+        with profile_section(f"{fetcher.source_name}.iter_articles", "fetcher", items=0) as span:
+            for article in iter_articles():
+                if span is not None:
+                    span.add_items(1)
+                yield article
+
+    def _news_stream_jobs(self) -> Dict[str, Callable[[], Iterable[RawArticle]]]:
+        """Ein Stream pro konfiguriertem NewsAPI-Fetcher."""
+        return {
+            f"news[{idx}] {fetcher.source_name}": partial(self._iter_news_from, fetcher)
+            for idx, fetcher in enumerate(self.news_api_fetchers)
+        }
 
     def _fetch_weather(self) -> List[WeatherInfo]:
         """Fetch weather forecast information."""
@@ -210,24 +299,10 @@ class NewsletterOrchestrator:
             logger.error(f"Fehler beim Abrufen der Wetterdaten: {e}", exc_info=True)
             return []
 
-    def _filter_blacklisted_sources(self, articles: List[RawArticle]) -> List[RawArticle]:
-        """Entfernt Artikel von Quellen, die in der Blacklist stehen."""
-        if not self.source_blacklist:
-            return articles
-
-        filtered: List[RawArticle] = []
-        removed = 0
-        for art in articles:
-            src_id = (art.source_id or "").lower()
-            src_name = (art.source_name or "").lower()
-            if src_id in self.source_blacklist or src_name in self.source_blacklist:
-                removed += 1
-            else:
-                filtered.append(art)
-
-        if removed:
-            logger.info(f"{removed} Artikel aufgrund der Quellen-Blacklist entfernt.")
-        return filtered
+    def _is_blacklisted(self, article: RawArticle) -> bool:
+        src_id = (article.source_id or "").lower()
+        src_name = (article.source_name or "").lower()
+        return src_id in self.source_blacklist or src_name in self.source_blacklist
 
     def _fetch_calendar_events(self) -> List[Event]:
         """Ruft die nächsten Termine aus Google Calendar ab, falls konfiguriert."""
@@ -277,85 +352,450 @@ class NewsletterOrchestrator:
             logger.error("Fehler beim Abrufen der Link-Such-Daten: %s", exc)
             return []
 
+    def _fetch_birthdays(self) -> List[Birthday]:
+        """Ruft die Geburtstage ab und gibt die nächsten drei zurück."""
+        if not self.birthday_fetcher:
+            return []
+        try:
+            birthdays = self.birthday_fetcher.fetch_data()
+            return get_upcoming_birthdays(birthdays, 3)
+        except Exception as e_birth:
+            logger.error(f"Fehler beim Abrufen der Geburtstage: {e_birth}", exc_info=True)
+            return []
+
+    def _fetch_todos(self) -> List[TodoItem]:
+        """Ruft die offenen Todos von Todoist ab, falls konfiguriert."""
+        if not self.todo_fetcher:
+            return []
+        try:
+            todos = self.todo_fetcher.fetch_data()
+            logger.info(f"{len(todos)} Todos von Todoist abgerufen.")
+            return todos
+        except Exception as e:
+            logger.error("Fehler beim Abrufen der Todos: %s", e, exc_info=True)
+            return []
 
-    def _process_articles_with_llm(self, raw_articles: List[RawArticle]) -> List[ProcessedArticle]:
-        """Verarbeitet Rohartikel mit LLM-Agenten (Zusammenfassung, dann Kategorisierung)."""
-        
-        # 1. Zusammenfassen
+    def _fetch_quote(self) -> List[Quote]:
+        """Ruft das Zitat des Tages ab."""
+        try:
+            return self.quote_fetcher.fetch_data()
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen des Zitats: {e}", exc_info=True)
+            return []
+
+    def _fetch_event_sources(self) -> List[Event]:
+        """Ruft alle Termin-Quellen parallel ab und führt mehrfach gemeldete Events zusammen."""
+        jobs: Dict[str, Callable[[], List[Event]]] = {
+            "calendar": self._fetch_calendar_events,
+            "eventbrite": self._fetch_eventbrite_events,
+            "web_events": self._fetch_web_events,
+            "link_events": self._fetch_link_events,
+        }
+        results = self._make_fetch_scheduler().run(jobs)
+        all_events: List[Event] = []
+        for events in results.values():
+            all_events.extend(events)
+        logger.info(f"Insgesamt {len(all_events)} Termine von allen Quellen gesammelt.")
+        return deduplicate_events(all_events)
+
+    def _fetch_extra_sources(self) -> Dict[str, Any]:
+        """Ruft Geburtstage, Todos, Wetter und Zitat parallel ab."""
+        jobs: Dict[str, Callable[[], List[Any]]] = {
+            "birthdays": self._fetch_birthdays,
+            "todos": self._fetch_todos,
+            "weather": self._fetch_weather,
+            "quote": self._fetch_quote,
+        }
+        return self._make_fetch_scheduler().run(jobs)
+
+    def _collect_news_articles(self) -> List[RawArticle]:
+        """
+        Ruft die Nachrichten aller Fetcher als Stream ab. Blacklist und Deduplizierung
+        werden pro eintreffendem Artikel angewendet, und neue Meldungen werden sofort
+        zur Zusammenfassung eingereiht, während weitere Seiten noch geladen werden.
+        """
+        logger.info("Starte Datensammlung von allen konfigurierten Quellen...")
+        dedup = ArticleDeduplicator(
+            max_distance=self.dedup_max_distance,
+            # Beim Vorab-Zusammenfassen muss der zuerst gesehene Artikel Repräsentant bleiben
+            prefer_richest=not self.prefetch_summaries,
+        ) if self.dedup_max_distance >= 0 else None
+        self.summary_prefetcher = (
+            load_component("SummaryPrefetcher")(self.summarizer) if self.prefetch_summaries and self.summarizer else None
+        )
+
+        fetched = blacklisted = 0
+        unique_articles: List[RawArticle] = []
+        start = time.monotonic()
+        for _, article in self._make_fetch_scheduler().stream(self._news_stream_jobs()):
+            fetched += 1
+            if self.source_blacklist and self._is_blacklisted(article):
+                blacklisted += 1
+                continue
+            if dedup is not None and not dedup.add(article):
+                continue
+            unique_articles.append(article)
+            if self.summary_prefetcher is not None:
+                self.summary_prefetcher.submit(article)
+
+        logger.info(f"Insgesamt {fetched} Rohartikel von allen Quellen gesammelt ({time.monotonic() - start:.2f}s).")
+        if not fetched and self.state_store is not None and self._load_article_history():
+            logger.info("Keine neuen Artikel seit dem letzten Lauf, verwende gespeicherte Ergebnisse.")
+            return []
+        if not fetched:
+            logger.warning("Keine Rohartikel zum Verarbeiten gefunden.")
+            raise PipelineAbort("Keine Daten gefunden")
+        if blacklisted:
+            logger.info(f"{blacklisted} Artikel aufgrund der Quellen-Blacklist entfernt.")
+        if fetched == blacklisted:
+            logger.warning("Alle Artikel wurden von der Blacklist herausgefiltert.")
+            raise PipelineAbort("Keine Daten nach Blacklist")
+        raw_articles = dedup.results() if dedup is not None else unique_articles
+        if dedup is not None and dedup.duplicates:
+            logger.info(f"Deduplizierung: {dedup.duplicates} Duplikate entfernt, {len(raw_articles)} Artikel verbleiben.")
+        logger.info(f"{len(raw_articles)} Rohartikel gesammelt (nach Filter).")
+        for i, article in enumerate(raw_articles[:1]):  # Nur den ersten Artikel zur Kontrolle loggen
+            logger.debug(
+                f"  Rohartikel {i+1}: {article.title} (Quelle: {article.source_name}, Datum: {article.published_at})"
+            )
+        return raw_articles
+
+    def _triage_articles(self, raw_articles: List[RawArticle]) -> List[RawArticle]:
+        """Behält vor der Zusammenfassung nur die Top-K Artikel nach lokalem Score (NEWS_TRIAGE_TOP_K)."""
+        if self.article_triage is None or len(raw_articles) <= self.article_triage.top_k:
+            return raw_articles
+        result = self.article_triage.apply(raw_articles)
+        self.triage_stats = result.stats
+        return result.kept
+
+    def _summarize_articles(self, raw_articles: List[RawArticle]) -> List[ProcessedArticle]:
+        """Fasst die Rohartikel mit dem SummarizerAgent zusammen."""
         if not self.summarizer:
             logger.error("SummarizerAgent nicht verfügbar. Überspringe Zusammenfassung.")
             # Erstelle ProcessedArticles ohne echte Zusammenfassung, aber mit Platzhalter
-            summarized_articles = [
-                ProcessedArticle(title=ra.title or "N/A", summary="Zusammenfassung nicht verfügbar (Summarizer-Fehler).", url=ra.url, source_name=ra.source_name, published_at=ra.published_at) 
+            return [
+                ProcessedArticle(title=ra.title or "N/A", summary="Zusammenfassung nicht verfügbar (Summarizer-Fehler).", url=ra.url, source_name=ra.source_name, published_at=ra.published_at, related_sources=list(ra.related_sources), related_urls=list(ra.related_urls), llm_processing_details={"summary_failed": True}) 
                 for ra in raw_articles
             ]
-        else:
-            logger.info(f"Starte LLM-Verarbeitung (Zusammenfassung) für {len(raw_articles)} Artikel...")
+        logger.info(f"Starte LLM-Verarbeitung (Zusammenfassung) für {len(raw_articles)} Artikel...")
+        prefetcher, self.summary_prefetcher = self.summary_prefetcher, None
+        if prefetcher is None:
             summarized_articles = self.summarizer.process_batch(raw_articles)
-            logger.info(f"{len(summarized_articles)} Artikel erfolgreich zusammengefasst.")
-
+        else:
+            prefetched = prefetcher.take(raw_articles)
+            prefetcher.close()
+            missing = [ra for ra, pa in zip(raw_articles, prefetched) if pa is None]
+            remaining = iter(self.summarizer.process_batch(missing) if missing else [])
+            summarized_articles = []
+            for ra, pa in zip(raw_articles, prefetched):
+                if pa is None:
+                    processed = next(remaining, None)
+                    if processed is not None:
+                        summarized_articles.append(processed)
+                else:
+                    # Duplikate, die nach dem Start der Zusammenfassung eintrafen, nachtragen
+                    summarized_articles.append(
+                        pa.model_copy(update={"related_sources": list(ra.related_sources), "related_urls": list(ra.related_urls)})
+                    )
+            logger.info(f"{len(raw_articles) - len(missing)} Zusammenfassungen bereits während des Abrufs erstellt.")
+        logger.info(f"{len(summarized_articles)} Artikel erfolgreich zusammengefasst.")
+        return summarized_articles
+
+    def _categorize_articles(self, summarized_articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
+        """Ordnet die zusammengefassten Artikel mit dem CategorizerAgent Kategorien zu."""
         if not summarized_articles:
-            logger.warning("Keine Artikel nach der Zusammenfassung übrig.")
             return []
-
-        # 2. Kategorisieren (nimmt die zusammengefassten Artikel)
         if not self.categorizer:
             logger.error("CategorizerAgent nicht verfügbar. Überspringe Kategorisierung.")
-            categorized_articles = summarized_articles
-        else:
-            logger.info(
-                f"Starte LLM-Verarbeitung (Kategorisierung) für {len(summarized_articles)} Artikel..."
-            )
-            # Der CategorizerAgent modifiziert die ProcessedArticle-Objekte direkt (fügt Kategorie hinzu)
-            categorized_articles = self.categorizer.process_batch(summarized_articles)
-            logger.info(f"{len(categorized_articles)} Artikel erfolgreich kategorisiert.")
-
-        # 3. Ausformulierten Artikeltext generieren
-        if self.article_writer:
-            # Nur die Top-N Artikel anhand des Relevanzscores ausformulieren
-            sorted_articles = sorted(
-                categorized_articles,
-                key=lambda a: a.relevance_score or 0,
-                reverse=True,
-            )
-            top_articles = sorted_articles[: self.top_article_count]
+            return summarized_articles
+        logger.info(
+            f"Starte LLM-Verarbeitung (Kategorisierung) für {len(summarized_articles)} Artikel..."
+        )
+        # Der CategorizerAgent modifiziert die ProcessedArticle-Objekte direkt (fügt Kategorie hinzu)
+        categorized_articles = self.categorizer.process_batch(summarized_articles)
+        logger.info(f"{len(categorized_articles)} Artikel erfolgreich kategorisiert.")
+        return categorized_articles
 
-            logger.info(
-                f"Starte LLM-Verarbeitung (Artikelerstellung) für {len(top_articles)} von {len(categorized_articles)} Artikeln (Top {self.top_article_count})."
-            )
-            article_texts = self.article_writer.process_batch(top_articles)
-            for art, text in zip(top_articles, article_texts):
-                art.article_text = text
-                if art.llm_processing_details is None:
-                    art.llm_processing_details = {}
-                art.llm_processing_details["writer_model"] = self.article_writer.model_name
-        else:
+    def _write_top_articles(self, categorized_articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
+        """Lässt die Top-N Artikel (nach Relevanzscore) vom ArticleWriterAgent ausformulieren."""
+        if not self.article_writer:
             logger.error("ArticleWriterAgent nicht verfügbar. Überspringe Artikelerstellung.")
+            return categorized_articles
 
+        # Nur die Top-N Artikel anhand des Relevanzscores ausformulieren
+        sorted_articles = sorted(
+            categorized_articles,
+            key=lambda a: a.relevance_score or 0,
+            reverse=True,
+        )
+        # Aus früheren Läufen übernommene Artikel sind ggf. schon ausformuliert
+        top_articles = [a for a in sorted_articles[: self.top_article_count] if not a.article_text]
+        top_articles = self._limit_articles_to_budget(top_articles)
+
+        logger.info(
+            f"Starte LLM-Verarbeitung (Artikelerstellung) für {len(top_articles)} von {len(categorized_articles)} Artikeln (Top {self.top_article_count})."
+        )
+        def attach_text(index: int, art: ProcessedArticle, text: str) -> None:
+            # Jeder Text wird übernommen, sobald er fertig ist; compose startet erst nach dem ganzen Batch
+            art.article_text = text
+            if art.llm_processing_details is None:
+                art.llm_processing_details = {}
+            art.llm_processing_details["writer_model"] = self.article_writer.model_name
+            logger.debug(f"Artikel {index + 1}/{len(top_articles)} geschrieben: '{art.title}'")
+
+        self.article_writer.process_batch(top_articles, on_article_done=attach_text)
         return categorized_articles
 
-
-    def run_pipeline(self) -> Optional[str]:
+    def _limit_articles_to_budget(self, top_articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
+        """Kürzt die auszuschreibenden Artikel so, dass sie voraussichtlich ins restliche Token-Budget passen."""
+        ledger = get_active_ledger()
+        remaining = ledger.remaining_tokens() if ledger else None
+        if remaining is None or not top_articles:
+            return top_articles
+        writer_name = type(self.article_writer).__name__
+        per_article = ledger.average_tokens_per_call(writer_name) or getattr(
+            self.article_writer, "ESTIMATED_TOKENS_PER_ARTICLE", None
+        ) or load_component("ArticleWriterAgent").ESTIMATED_TOKENS_PER_ARTICLE
+        affordable = int(remaining // max(1.0, per_article))
+        if affordable < len(top_articles):
+            logger.warning(
+                f"Token-Budget fast aufgebraucht ({remaining} Tokens übrig): schreibe {affordable} "
+                f"statt {len(top_articles)} Artikel aus."
+            )
+            return top_articles[:affordable]
+        return top_articles
+
+    def _load_article_history(self, exclude: Optional[set] = None) -> List[ProcessedArticle]:
+        since = datetime.now(timezone.utc) - timedelta(hours=self.history_hours)
+        return self.state_store.load_processed(since, exclude=exclude)
+
+    def _merge_article_history(self, fresh_articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
+        """Ergänzt die neu verarbeiteten Artikel um gespeicherte Artikel früherer Läufe."""
+        if self.state_store is None:
+            return fresh_articles
+        fresh_keys = {article_key(a.url, a.title) for a in fresh_articles}
+        cached = self._load_article_history(exclude=fresh_keys)
+        logger.info(f"{len(fresh_articles)} neue und {len(cached)} gespeicherte Artikel zusammengeführt.")
+        return fresh_articles + cached
+
+    @staticmethod
+    def _summary_failed(article: ProcessedArticle) -> bool:
+        return bool((article.llm_processing_details or {}).get("summary_failed"))
+
+    def _record_article_history(self, articles: List[ProcessedArticle]) -> List[ProcessedArticle]:
+        """Speichert die verarbeiteten Artikel und bestätigt danach die Wasserstände der Fetcher."""
+        if self.state_store is None:
+            return articles
+        # Fehlgeschlagene Zusammenfassungen werden weder gespeichert noch als gesehen markiert,
+        # damit der nächste Lauf sie erneut abruft; alle übrigen Artikel gelten als erledigt
+        failed = [a for a in articles if self._summary_failed(a)]
+        failed_keys = {article_key(a.url, a.title) for a in failed}
+        failed_keys.update(article_key(url) for a in failed for url in a.related_urls)
+        self.state_store.save_processed(a for a in articles if not self._summary_failed(a))
+        if failed_keys:
+            logger.info(f"{len(failed)} Artikel mit fehlgeschlagener Zusammenfassung werden im nächsten Lauf erneut abgerufen.")
+        for fetcher in self.news_api_fetchers:
+            commit_state = getattr(fetcher, "commit_state", None)
+            if commit_state is not None:
+                commit_state(failed_keys)
+        return articles
+
+    def _prefilter_events(self, events: List[Event]) -> PrefilterResult:
+        """Sortiert vergangene, zu weit entfernte, doppelte und per Keyword ausgeschlossene Termine aus."""
+        prefilter = self.event_prefilter or EventPrefilter(max_days_ahead=None)
+        return prefilter.apply(events)
+
+    def _filter_events(self, prefiltered: PrefilterResult) -> List[Event]:
+        """Bewertet die verbleibenden Kandidaten des Vorfilters mit dem EventFilterAgent."""
+        if not self.event_filter:
+            return prefiltered.events
+        total = prefiltered.stats["total"]
+        saved = self.event_filter.requests_needed(total) - self.event_filter.requests_needed(len(prefiltered.candidates))
+        logger.info(
+            f"Vorfilter: {prefiltered.skipped} von {total} Terminen ohne LLM-Bewertung, "
+            f"spart bis zu {saved} LLM-Anfragen."
+        )
+        ledger = get_active_ledger()
+        if prefiltered.candidates and ledger is not None:
+            estimated = self.event_filter.estimated_tokens(prefiltered.candidates)
+            if not ledger.can_afford(estimated):
+                # Ohne Budget keine ungeprüften Termine übernehmen, nur bereits bewertete
+                logger.warning(
+                    f"Token-Budget reicht nicht für die Bewertung von {len(prefiltered.candidates)} Terminen "
+                    f"(ca. {estimated} Tokens): nur Termine mit gespeicherter Bewertung werden übernommen."
+                )
+                return prefiltered.merge(self.event_filter.filter_cached(prefiltered.candidates))
+        scored = self.event_filter.process_batch(prefiltered.candidates) if prefiltered.candidates else []
+        return prefiltered.merge(scored)
+
+    def _build_stage_graph(self) -> StageGraph:
+        """
+        Baut den Ablauf als Stage-Graph auf. Die Nachrichtenkette
+        (news_fetch -> triage -> summarize -> categorize -> history -> write) läuft parallel zur
+        Terminkette (events_fetch -> event_prefilter -> event_filter) und zu den Zusatzdaten
+        (Geburtstage, Todos, Wetter, Zitat). ``compose`` wartet auf alle drei.
+        """
+        graph = StageGraph(max_workers=self.pipeline_max_workers, on_result=self._save_checkpoint)
+        graph.add_stage("news_fetch", self._collect_news_articles)
+        graph.add_stage("triage", lambda news_fetch: self._triage_articles(news_fetch), ["news_fetch"])
+        graph.add_stage("summarize", lambda triage: self._summarize_articles(triage), ["triage"])
+        graph.add_stage("categorize", lambda summarize: self._categorize_articles(summarize), ["summarize"])
+        graph.add_stage("history", lambda categorize: self._merge_article_history(categorize), ["categorize"])
+        graph.add_stage(
+            "write",
+            lambda history: self._record_article_history(self._write_top_articles(history)),
+            ["history"],
+        )
+        graph.add_stage("events_fetch", self._fetch_event_sources)
+        graph.add_stage("event_prefilter", lambda events_fetch: self._prefilter_events(events_fetch), ["events_fetch"])
+        graph.add_stage("event_filter", lambda event_prefilter: self._filter_events(event_prefilter), ["event_prefilter"])
+        graph.add_stage("extras_fetch", self._fetch_extra_sources)
+        graph.add_stage(
+            "compose",
+            lambda write, event_filter, extras_fetch: self._compose_newsletter(write, event_filter, extras_fetch),
+            ["write", "event_filter", "extras_fetch"],
+        )
+        return graph
+
+    def rerun_stage(self, name: str, downstream: bool = False) -> Any:
+        """
+        Führt eine einzelne Stage des letzten Laufs mit dessen Zwischenergebnissen erneut aus,
+        z.B. ``rerun_stage("compose")`` nach einem Fehler beim Schreiben des Newsletters.
+        """
+        if self.stage_graph is None:
+            raise RuntimeError("Es gibt noch keinen Pipeline-Lauf, dessen Stages erneut ausgeführt werden könnten.")
+        # Zeiten und LLM-Nutzung der Wiederholung gehören zum Profil und Ledger des Laufs
+        try:
+            with self.profiler.activate(), self.usage_ledger.activate():
+                return self.stage_graph.rerun(name, downstream=downstream)
+        finally:
+            self._write_profile_report(self.profiler, self.usage_ledger)
+
+    def _save_checkpoint(self, stage: str, result: Any) -> None:
+        if self.checkpoint_store is None or self.run_id is None or stage not in self.CHECKPOINT_STAGES:
+            return
+        try:
+            with profile_section(f"checkpoint.{stage}", "output"):
+                self.checkpoint_store.save(self.run_id, stage, result)
+                if stage == "news_fetch":
+                    # Offene Artikel der Fetcher, damit ein fortgesetzter Lauf ihre Wasserstände bestätigen kann
+                    self.checkpoint_store.save(self.run_id, self.PENDING_CHECKPOINT, self._pending_fetch_state())
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Checkpoint für Stage '{stage}' konnte nicht gespeichert werden: {e}")
+
+    def _pending_fetch_state(self) -> Dict[str, Dict[str, Optional[float]]]:
+        return {
+            fetcher.state_key: fetcher.pending_state()
+            for fetcher in self.news_api_fetchers
+            if getattr(fetcher, "pending_state", None) is not None
+        }
+
+    def _restore_pending_fetch_state(self, run_id: str) -> None:
+        """Gibt den Fetchern die offenen Artikel des übernommenen ``news_fetch`` zurück (siehe ``commit_state``)."""
+        pending = self.checkpoint_store.load(run_id, [self.PENDING_CHECKPOINT]).get(self.PENDING_CHECKPOINT) or {}
+        for fetcher in self.news_api_fetchers:
+            restore_pending = getattr(fetcher, "restore_pending", None)
+            if restore_pending is not None and fetcher.state_key in pending:
+                restore_pending(pending[fetcher.state_key])
+
+    def _load_checkpoints(self, run_id: str) -> Dict[str, Any]:
+        """Lädt die gesicherten Stage-Ergebnisse eines früheren Laufs (``latest`` = jüngster Lauf)."""
+        if self.checkpoint_store is None:
+            logger.warning("Checkpoints sind deaktiviert (PIPELINE_CHECKPOINT_DIR leer), starte vollständigen Lauf.")
+            return {}
+        if run_id == "latest":
+            run_id = self.checkpoint_store.latest_run_id() or ""
+            if not run_id:
+                logger.warning("Keine früheren Läufe mit Checkpoints gefunden, starte vollständigen Lauf.")
+                return {}
+        self.run_id = run_id
+        preloaded = self.checkpoint_store.load(run_id, self.CHECKPOINT_STAGES)
+        if preloaded:
+            logger.info(f"Setze Lauf {run_id} fort, übernommene Stages: {', '.join(sorted(preloaded))}.")
+            if "news_fetch" in preloaded:
+                self._restore_pending_fetch_state(run_id)
+        else:
+            logger.warning(f"Keine Checkpoints für Lauf {run_id} gefunden, starte vollständigen Lauf.")
+        return preloaded
+
+    def _write_profile_report(self, profiler: RunProfiler, ledger: UsageLedger) -> None:
+        """Schreibt das Laufprofil samt LLM-Nutzung als JSON (PIPELINE_PROFILE_DIR) und loggt die Übersicht."""
+        profile_dir = get_env_variable("PIPELINE_PROFILE_DIR", os.path.join("tmp", "profiles"))
+        logger.info("Laufprofil (teuerste Sections):\n%s", profiler.summary_table())
+        usage = ledger.summary()
+        budget = f" von {ledger.token_budget}" if ledger.token_budget else ""
+        cost = f", ca. {usage['cost_usd']:.4f} USD" if usage["cost_usd"] is not None else ""
+        per_agent = ", ".join(
+            f"{agent}={group['prompt_tokens'] + group['completion_tokens']}" for agent, group in usage["by_agent"].items()
+        )
+        triage = (
+            f", {self.triage_stats['avoided_summarizer_calls']} Zusammenfassungen durch Triage eingespart"
+            if self.triage_stats else ""
+        )
+        logger.info(
+            f"LLM-Nutzung: {usage['calls']} Aufrufe, {usage['total_tokens']} Tokens{budget}{cost} ({per_agent or '-'}){triage}."
+        )
+        if not profile_dir:
+            return
+        try:
+            extra: Dict[str, Any] = {"llm_usage": usage}
+            if self.triage_stats is not None:
+                extra["article_triage"] = self.triage_stats
+            path = profiler.write_report(profile_dir, extra=extra)
+            logger.info(f"Laufprofil gespeichert unter: {path}")
+        except OSError as e:
+            logger.warning(f"Laufprofil konnte nicht gespeichert werden: {e}")
+
+    def run_pipeline(self, resume_run_id: Optional[str] = None) -> Optional[str]:
+        """
+        Führt die Pipeline aus. Mit ``resume_run_id`` werden die gesicherten Ergebnisse eines
+        früheren Laufs übernommen und nur die fehlenden Stages ausgeführt.
+        """
         logger.info("Newsletter-Generierungspipeline gestartet durch Orchestrator.")
         start_time = datetime.now(timezone.utc)
 
-        # --- Schritt 1: Daten sammeln ---
-        raw_articles = self._fetch_all_data()
-        if not raw_articles:
-            logger.warning("Keine Rohartikel zum Verarbeiten gefunden.")
-            return "Keine Daten gefunden"
-        raw_articles = self._filter_blacklisted_sources(raw_articles)
-        if not raw_articles:
-            logger.warning("Alle Artikel wurden von der Blacklist herausgefiltert.")
-            return "Keine Daten nach Blacklist"
-        logger.info(f"{len(raw_articles)} Rohartikel gesammelt (nach Filter).")
-        for i, article in enumerate(raw_articles[:1]):  # Nur den ersten Artikel zur Kontrolle loggen
-            logger.debug(
-                f"  Rohartikel {i+1}: {article.title} (Quelle: {article.source_name}, Datum: {article.published_at})"
-            )
+        self.stage_graph = self._build_stage_graph()
+        profiler = self.profiler = RunProfiler(f"{start_time.strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:6]}")
+        self.run_id = profiler.run_id
+        self.triage_stats = None
+        preloaded = self._load_checkpoints(resume_run_id) if resume_run_id else {}
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.prune(keep=self.run_id)
+            logger.info(f"Lauf-ID {self.run_id} (fortsetzen mit: python main.py --resume {self.run_id}).")
+        self.usage_ledger = UsageLedger(self.llm_token_budget, self.llm_prices)
+        try:
+            with profiler.activate(), self.usage_ledger.activate():
+                results = self.stage_graph.run(preloaded=preloaded)
+        except StageExecutionError as e_stage:
+            if isinstance(e_stage.error, PipelineAbort):
+                return str(e_stage.error)
+            if self.checkpoint_store is not None:
+                logger.error(
+                    f"Stage '{e_stage.stage}' fehlgeschlagen. Fortsetzen mit: python main.py --resume {self.run_id}"
+                )
+            raise
+        finally:
+            self._write_profile_report(profiler, self.usage_ledger)
+        newsletter_output_path = results["compose"]
+
+        pipeline_duration = datetime.now(timezone.utc) - start_time
+        logger.info(f"Newsletter-Pipeline in {pipeline_duration} abgeschlossen (Orchestrator).")
+        logger.info(f"LLM-Cache: {get_llm_cache().stats}")
+        http_stats = get_http_cache().stats
+        logger.info(
+            f"HTTP-Cache: {http_stats['bytes_saved']} Bytes eingespart "
+            f"({http_stats['fresh_hits']} frisch, {http_stats['revalidated']} per 304 revalidiert, "
+            f"{http_stats['misses']} geladen mit {http_stats['bytes_downloaded']} Bytes)."
+        )
+        return newsletter_output_path
 
-        # --- Schritt 2: Daten verarbeiten mit LLMs ---
-        processed_articles = self._process_articles_with_llm(raw_articles)
+    def _compose_newsletter(
+        self,
+        processed_articles: List[ProcessedArticle],
+        all_events: List[Event],
+        extras: Dict[str, Any],
+    ) -> str:
+        """Erstellt den Newsletter (EPUB oder Text) aus den Ergebnissen aller Zweige."""
         if not processed_articles:
             logger.warning("Keine Artikel nach der LLM-Verarbeitung. Pipeline wird beendet.")
             return "Keine verarbeiteten Daten nach LLM-Stufen"
@@ -363,16 +803,6 @@ class NewsletterOrchestrator:
         for i, article in enumerate(processed_articles[:1]): # Ersten verarbeiteten Artikel loggen
             logger.debug(f"  Verarbeiteter Artikel {i+1}: '{article.title}' - Zusammenfassung (erste 50 Zeichen): '{article.summary[:50]}...' - Kategorie: {article.category}")
 
-        # --- Schritt 3: Zusätzliche Daten abrufen ---
-        calendar_events = self._fetch_calendar_events()
-        eventbrite_events = self._fetch_eventbrite_events()
-        web_events = self._fetch_web_events()
-        link_events = self._fetch_link_events()
-        all_events = calendar_events + eventbrite_events + web_events + link_events
-
-        if self.event_filter:
-            all_events = self.event_filter.process_batch(all_events)
-
         # --- Schritt 4: Daten evaluieren ---
         final_items_for_newsletter = sorted(
             processed_articles,
@@ -381,49 +811,25 @@ class NewsletterOrchestrator:
         )[: self.top_article_count]
 
         extra_chapters = []
-        upcoming_birthdays = []
-        if self.birthday_fetcher:
-            try:
-                birthdays = self.birthday_fetcher.fetch_data()
-                upcoming_birthdays = get_upcoming_birthdays(birthdays, 3)
-                if upcoming_birthdays:
-                    from datetime import date
-
-                    html = "<h1>Bevorstehende Geburtstage</h1><ul>"
-                    for b in upcoming_birthdays:
-                        try:
-                            d = date(date.today().year, b.date_month, b.date_day)
-                        except ValueError:
-                            continue
-                        html += f"<li>{b.name} - {d.strftime('%d.%m.')}</li>"
-                    html += "</ul>"
-                    extra_chapters.append(("Geburtstage", html))
-            except Exception as e_birth:
-                logger.error(f"Fehler beim Abrufen der Geburtstage: {e_birth}", exc_info=True)
-
-
-        todos = []
-        if self.todo_fetcher:
-            try:
-                todos = self.todo_fetcher.fetch_data()
-                logger.info(f"{len(todos)} Todos von Todoist abgerufen.")
-            except Exception as e:
-                logger.error("Fehler beim Abrufen der Todos: %s", e, exc_info=True)
-
-        weather_infos = self._fetch_weather()
-
-
-        quote: Optional[Quote] = None
-        try:
-            quotes = self.quote_fetcher.fetch_data()
-            if quotes:
-                quote = quotes[0]
-        except Exception as e:
-            logger.error(f"Fehler beim Abrufen des Zitats: {e}", exc_info=True)
-
+        upcoming_birthdays = extras["birthdays"]
+        if upcoming_birthdays:
+            html = "<h1>Bevorstehende Geburtstage</h1><ul>"
+            for b in upcoming_birthdays:
+                try:
+                    d = date(date.today().year, b.date_month, b.date_day)
+                except ValueError:
+                    continue
+                html += f"<li>{b.name} - {d.strftime('%d.%m.')}</li>"
+            html += "</ul>"
+            extra_chapters.append(("Geburtstage", html))
 
+        todos = extras["todos"]
+        weather_infos = extras["weather"]
+        quote: Optional[Quote] = extras["quote"][0] if extras["quote"] else None
 
         # --- Schritt 5: Newsletter komponieren (Platzhalter) ---
+        # Fehler beim Erstellen, Schreiben oder Hochladen lassen die Stage fehlschlagen,
+        # damit ``--resume`` nur sie mit den gesicherten Zwischenergebnissen wiederholt.
         output_format = get_env_variable("NEWSLETTER_OUTPUT_FORMAT", "txt").lower()
 
         if output_format == "epub":
@@ -431,37 +837,44 @@ class NewsletterOrchestrator:
             try:
                 articles_per_page = int(get_env_variable("EPUB_ARTICLES_PER_PAGE", "1"))
                 use_a4_css = get_env_variable("EPUB_USE_A4_CSS", "false").lower() == "true"
-                generate_epub(
-                    processed_articles,
-                    newsletter_output_path,
-                    articles_per_page=articles_per_page,
-                    use_a4_css=use_a4_css,
+                # ebooklib wird nur für das EPUB-Format benötigt
+                from src.utils.epub_utils import generate_epub
 
-                    extra_chapters=extra_chapters,
+                with profile_section("generate_epub", "output", items=len(processed_articles)):
+                    generate_epub(
+                        processed_articles,
+                        newsletter_output_path,
+                        articles_per_page=articles_per_page,
+                        use_a4_css=use_a4_css,
 
-                    events=all_events,
-                    todos=todos,
-                    weather_infos=weather_infos,
-                    quote_of_the_day=quote.text if quote else None,
-                    quote_author=quote.author if quote else None,
+                        extra_chapters=extra_chapters,
 
+                        events=all_events,
+                        todos=todos,
+                        weather_infos=weather_infos,
+                        quote_of_the_day=quote.text if quote else None,
+                        quote_author=quote.author if quote else None,
 
 
 
-                )
-                logger.info(f"EPUB erstellt unter: {newsletter_output_path}")
 
-                creds = get_env_variable("GOOGLE_DRIVE_CREDENTIALS_JSON")
-                if creds:
-                    folder_id = get_env_variable("GOOGLE_DRIVE_FOLDER_ID")
-                    try:
-                        uploader = GDriveUploader(creds)
-                        file_id = uploader.upload_file(newsletter_output_path, folder_id)
-                        logger.info(f"EPUB in Google Drive hochgeladen. File ID: {file_id}")
-                    except Exception as e_up:
-                        logger.error(f"Fehler beim Hochladen zu Google Drive: {e_up}", exc_info=True)
+                    )
+                logger.info(f"EPUB erstellt unter: {newsletter_output_path}")
             except Exception as e_epub:
                 logger.error(f"Fehler beim Erstellen des EPUB: {e_epub}", exc_info=True)
+                raise
+
+            creds = get_env_variable("GOOGLE_DRIVE_CREDENTIALS_JSON")
+            if creds:
+                folder_id = get_env_variable("GOOGLE_DRIVE_FOLDER_ID")
+                try:
+                    with profile_section("gdrive_upload", "output"):
+                        uploader = load_component("GDriveUploader")(creds)
+                        file_id = uploader.upload_file(newsletter_output_path, folder_id)
+                    logger.info(f"EPUB in Google Drive hochgeladen. File ID: {file_id}")
+                except Exception as e_up:
+                    logger.error(f"Fehler beim Hochladen zu Google Drive: {e_up}", exc_info=True)
+                    raise
         else:
             newsletter_output_path = "tmp/platzhalter_newsletter_mit_kategorien.txt"
             try:
@@ -490,7 +903,6 @@ class NewsletterOrchestrator:
                         f.write("Keine Artikel für diesen Newsletter gefunden.\n")
                     if upcoming_birthdays:
                         f.write("\nGeburtstage:\n")
-                        from datetime import date
                         for b in upcoming_birthdays:
                             try:
                                 d = date(date.today().year, b.date_month, b.date_day)
@@ -517,12 +929,10 @@ class NewsletterOrchestrator:
                 logger.info(f"Platzhalter-Newsletter (mit Kategorien) erstellt unter: {newsletter_output_path}")
             except Exception as e:
                 logger.error(f"Fehler beim Schreiben des Platzhalter-Newsletters: {e}", exc_info=True)
-                newsletter_output_path = "Fehler beim Schreiben"
+                raise
 
-        # --- Schritt 5: Newsletter verteilen (Platzhalter) ---
+        # --- Schritt 6: Newsletter verteilen (Platzhalter) ---
         # ... (bleibt gleich) ...
 
-        pipeline_duration = datetime.now(timezone.utc) - start_time
-        logger.info(f"Newsletter-Pipeline in {pipeline_duration} abgeschlossen (Orchestrator).")
         return newsletter_output_path
 
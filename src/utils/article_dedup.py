@@ -0,0 +1,170 @@
+"""Cross-source deduplication of news articles before the LLM stages."""
+
+import hashlib
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.models.data_models import RawArticle
+from src.utils.text_utils import shingles, tokenize
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+
+# Query-Parameter, die nur dem Tracking dienen und die Identität eines Artikels nicht ändern
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "mc_cid", "mc_eid", "ref", "ref_src", "cmpid", "ocid", "at_medium", "at_campaign"}
+
+
+def canonicalize_url(url: Optional[str]) -> Optional[str]:
+    """
+    Normalises an article URL so that syndicated or tracked variants compare equal:
+    lowercase host without ``www.``/``m.``, no fragment, no tracking parameters,
+    sorted query and no trailing slash.
+    """
+    if not url:
+        return None
+    parts = urlsplit(str(url).strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/")
+    if path.endswith("/amp"):
+        path = path[: -len("/amp")]
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+def simhash(features: List[str]) -> int:
+    """64-bit SimHash over weighted features (e.g. word shingles)."""
+    if not features:
+        return 0
+    bit_rows: List[str] = []
+    for feature, count in Counter(features).items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        bit_rows.extend([format(int.from_bytes(digest, "big"), "064b")] * count)
+    # Spaltenweise die gesetzten Bits zählen (zip/count laufen in C statt 64 Python-Schritten pro Feature)
+    half = len(bit_rows) / 2
+    fingerprint = 0
+    for column in zip(*bit_rows):
+        fingerprint = (fingerprint << 1) | (column.count("1") > half)
+    return fingerprint
+
+
+def _article_fingerprint(article: RawArticle) -> Optional[int]:
+    """SimHash over title+description shingles, None if the article has no usable text."""
+    tokens = tokenize(f"{article.title or ''} {article.description or ''}")
+    if not tokens:
+        return None
+    return simhash(shingles(tokens, 3))
+
+
+def _richness(article: RawArticle) -> int:
+    """How much usable content an article carries (for choosing the representative)."""
+    return (
+        len(article.content_snippet or "")
+        + len(article.description or "")
+        + (50 if article.image_url else 0)
+        + (20 if article.published_at else 0)
+    )
+
+
+class ArticleDeduplicator:
+    """
+    Incremental near-duplicate clustering of :class:`RawArticle` objects.
+
+    Articles with the same canonical URL are merged directly. Otherwise a
+    SimHash over title+description shingles is compared against earlier
+    clusters; fingerprints within ``max_distance`` differing bits are
+    treated as the same story. The fingerprint is split into
+    ``max_distance + 1`` bands, so by the pigeonhole principle two
+    near-duplicates always share a band and only those candidates are
+    compared.
+
+    Each cluster keeps the richest article as representative (or the first
+    one with ``prefer_richest=False``, which keeps the representative stable
+    while articles are still streaming in); the source names and URLs of
+    the other members are attached as ``related_sources``/``related_urls``.
+    """
+
+    def __init__(self, max_distance: int = 3, prefer_richest: bool = True):
+        self.max_distance = max(0, max_distance)
+        self.prefer_richest = prefer_richest
+        self._band_count = self.max_distance + 1
+        self._band_width = SIMHASH_BITS // self._band_count
+        self._clusters: List[List[RawArticle]] = []
+        self._fingerprints: List[int] = []
+        self._by_url: Dict[str, int] = {}
+        self._bands: Dict[Tuple[int, int], List[int]] = {}
+        self.duplicates = 0
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self._band_width) - 1
+        return [(band, (fingerprint >> (band * self._band_width)) & mask) for band in range(self._band_count)]
+
+    def _find_cluster(self, url_key: Optional[str], fingerprint: Optional[int]) -> Optional[int]:
+        if url_key and url_key in self._by_url:
+            return self._by_url[url_key]
+        if fingerprint is None:
+            return None
+        for band_key in self._band_keys(fingerprint):
+            for cluster_id in self._bands.get(band_key, ()):
+                if bin(self._fingerprints[cluster_id] ^ fingerprint).count("1") <= self.max_distance:
+                    return cluster_id
+        return None
+
+    def add(self, article: RawArticle) -> bool:
+        """Adds an article; returns True if it started a new cluster (i.e. is not a duplicate)."""
+        url_key = canonicalize_url(str(article.url) if article.url else None)
+        fingerprint = _article_fingerprint(article)
+        cluster_id = self._find_cluster(url_key, fingerprint)
+
+        if cluster_id is None:
+            cluster_id = len(self._clusters)
+            self._clusters.append([article])
+            self._fingerprints.append(fingerprint or 0)
+            if fingerprint is not None:
+                for band_key in self._band_keys(fingerprint):
+                    self._bands.setdefault(band_key, []).append(cluster_id)
+            is_new = True
+        else:
+            self._clusters[cluster_id].append(article)
+            self.duplicates += 1
+            is_new = False
+        if url_key:
+            self._by_url.setdefault(url_key, cluster_id)
+        return is_new
+
+    def results(self) -> List[RawArticle]:
+        """One representative per cluster, in order of first appearance."""
+        representatives: List[RawArticle] = []
+        for members in self._clusters:
+            if len(members) == 1:
+                representatives.append(members[0])
+                continue
+            best = max(members, key=_richness) if self.prefer_richest else members[0]
+            others = [m for m in members if m is not best]
+            related_sources = list(best.related_sources)
+            related_urls = list(best.related_urls)
+            for other in others:
+                if other.source_name and other.source_name not in related_sources and other.source_name != best.source_name:
+                    related_sources.append(other.source_name)
+                if other.url and str(other.url) not in related_urls and other.url != best.url:
+                    related_urls.append(str(other.url))
+            representatives.append(
+                best.model_copy(update={"related_sources": related_sources, "related_urls": related_urls})
+            )
+        return representatives
+
+
+def deduplicate_articles(articles: List[RawArticle], max_distance: int = 3) -> List[RawArticle]:
+    """Clusters exact and near-duplicate articles and keeps one representative per cluster."""
+    dedup = ArticleDeduplicator(max_distance=max_distance)
+    for article in articles:
+        dedup.add(article)
+    return dedup.results()
@@ -0,0 +1,195 @@
+"""Cheap relevance triage of raw articles before the LLM summarization."""
+
+import logging
+import math
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from src.models.data_models import RawArticle
+from src.utils.text_utils import normalize_text, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Füllwörter in Kategorienamen und Artikeltexten, die keine Relevanz tragen
+STOPWORDS = frozenset(
+    "der die das den dem des ein eine einer und oder um im in am an auf aus bei mit von vom zu zum zur für über "
+    "ist sind wird werden hat haben nicht auch als wie noch nach vor so sich es er sie wir"
+    " the a an and or of in on at to for from with by is are was be this that".split()
+)
+
+# Gewichtung von inhaltlicher Nähe zu den Kategorien und Aktualität im Score
+RELEVANCE_WEIGHT = 0.6
+RECENCY_WEIGHT = 0.4
+
+
+def parse_source_weights(entries: Iterable[str]) -> Dict[str, float]:
+    """Parses ``quelle=gewicht`` entries (e.g. from NEWS_TRIAGE_SOURCE_WEIGHTS); invalid entries are skipped."""
+    weights: Dict[str, float] = {}
+    for entry in entries:
+        name, _, value = entry.partition("=")
+        try:
+            weight = float(value)
+        except ValueError:
+            logger.warning(f"Ungültiges Quellengewicht '{entry}' wird ignoriert (Format: quelle=gewicht).")
+            continue
+        if normalize_text(name):
+            weights[normalize_text(name)] = max(0.0, weight)
+    return weights
+
+
+class TriageResult:
+    """Outcome of :meth:`ArticleTriage.apply`."""
+
+    def __init__(self, kept: List[RawArticle], dropped: List[RawArticle], scores: List[float]):
+        # Artikel, die zusammengefasst werden (in ursprünglicher Reihenfolge)
+        self.kept = kept
+        self.dropped = dropped
+        # Score je Eingabeartikel, in Eingabereihenfolge
+        self.scores = scores
+
+    @property
+    def avoided_summaries(self) -> int:
+        """
+        Summarizer requests saved (one per dropped article). Dropped articles
+        are not categorized or written either, but how many requests that
+        saves depends on the categorizer batches and the top-N selection, so
+        it is not counted here.
+        """
+        return len(self.dropped)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "total": len(self.kept) + len(self.dropped),
+            "kept": len(self.kept),
+            "avoided_summarizer_calls": self.avoided_summaries,
+        }
+
+
+class ArticleTriage:
+    """
+    Ranks raw articles with local signals and keeps only the ``top_k`` best
+    for summarization.
+
+    The score combines the TF-IDF similarity of title, description and
+    snippet to the newsletter categories (plus optional extra keywords), the
+    recency of the article (halved every ``half_life_hours``, articles
+    without date count as half as recent) and a per-source weight. Stories
+    reported by several sources (``related_sources`` after deduplication)
+    get a small bonus. Category words are also found inside German compound
+    words, e.g. "politik" in "Weltpolitik".
+
+    Args:
+        top_k: Number of articles to keep.
+        categories: Newsletter categories whose words define relevance.
+        keywords: Additional relevant keywords.
+        source_weights: Factor per (normalised) source name, matched as substring.
+        half_life_hours: Age after which the recency signal is halved.
+    """
+
+    def __init__(
+        self,
+        top_k: int,
+        categories: Iterable[str],
+        keywords: Optional[Iterable[str]] = None,
+        source_weights: Optional[Dict[str, float]] = None,
+        half_life_hours: float = 12.0,
+    ):
+        self.top_k = max(1, top_k)
+        self.queries = [q for q in (self._terms(c) for c in categories) if q]
+        extra = [term for kw in keywords or [] for term in self._terms(kw)]
+        if extra:
+            self.queries.append(extra)
+        self.source_weights = source_weights or {}
+        self.half_life_hours = half_life_hours
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        return [tok for tok in tokenize(text, min_length=2) if tok not in STOPWORDS]
+
+    @staticmethod
+    def _document(article: RawArticle) -> List[str]:
+        # Der Titel zählt doppelt
+        return ArticleTriage._terms(
+            f"{article.title or ''} {article.title or ''} {article.description or ''} {article.content_snippet or ''}"
+        )
+
+    def _relevance(self, documents: List[List[str]]) -> List[float]:
+        """Highest cosine similarity of each document to one of the category queries."""
+        query_terms = {term for query in self.queries for term in query}
+        if not query_terms or not documents:
+            return [0.0] * len(documents)
+        matches: Dict[str, List[str]] = {}
+
+        def matching(token: str) -> List[str]:
+            if token not in matches:
+                matches[token] = [
+                    term for term in query_terms
+                    if token == term or (len(term) >= 5 and (token.startswith(term) or token.endswith(term)))
+                ]
+            return matches[token]
+
+        n_docs = len(documents)
+        counts = [Counter(tokens) for tokens in documents]
+        token_df: Counter = Counter(token for tf in counts for token in tf)
+        term_df: Counter = Counter(term for tf in counts for term in {t for token in tf for t in matching(token)})
+
+        def idf(df: int) -> float:
+            return math.log((n_docs + 1) / (df + 1)) + 1
+
+        scores = []
+        for tf in counts:
+            norm = math.sqrt(sum(((1 + math.log(c)) * idf(token_df[token])) ** 2 for token, c in tf.items())) or 1.0
+            term_counts: Counter = Counter()
+            for token, count in tf.items():
+                for term in matching(token):
+                    term_counts[term] += count
+            best = 0.0
+            for query in self.queries:
+                terms = set(query)
+                q_norm = math.sqrt(sum(idf(term_df[t]) ** 2 for t in terms))
+                dot = sum((1 + math.log(term_counts[t])) * idf(term_df[t]) ** 2 for t in terms if term_counts[t])
+                best = max(best, dot / (norm * q_norm))
+            scores.append(best)
+        return scores
+
+    def _recency(self, article: RawArticle, now: datetime) -> float:
+        if article.published_at is None:
+            return 0.5
+        age_hours = max(0.0, (now - article.published_at).total_seconds() / 3600)
+        return 0.5 ** (age_hours / self.half_life_hours) if self.half_life_hours > 0 else 1.0
+
+    def _source_weight(self, article: RawArticle) -> float:
+        weight = 1.0
+        source = normalize_text(article.source_name)
+        if source:
+            for name, factor in self.source_weights.items():
+                if name in source:
+                    weight = factor
+                    break
+        return weight * (1 + 0.1 * min(len(article.related_sources), 5))
+
+    def score(self, articles: List[RawArticle], now: Optional[datetime] = None) -> List[float]:
+        now = now or datetime.now(timezone.utc)
+        relevance = self._relevance([self._document(a) for a in articles])
+        top = max(relevance, default=0.0) or 1.0
+        return [
+            (RELEVANCE_WEIGHT * rel / top + RECENCY_WEIGHT * self._recency(article, now)) * self._source_weight(article)
+            for article, rel in zip(articles, relevance)
+        ]
+
+    def apply(self, articles: List[RawArticle], now: Optional[datetime] = None) -> TriageResult:
+        scores = self.score(articles, now)
+        ranked = sorted(range(len(articles)), key=lambda i: scores[i], reverse=True)
+        keep = set(ranked[: self.top_k])
+        result = TriageResult(
+            [a for i, a in enumerate(articles) if i in keep],
+            [a for i, a in enumerate(articles) if i not in keep],
+            scores,
+        )
+        logger.info(
+            f"Artikel-Triage: {len(result.kept)} von {len(articles)} Artikeln werden zusammengefasst, "
+            f"{result.avoided_summaries} Zusammenfassungen eingespart."
+        )
+        return result
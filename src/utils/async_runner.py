@@ -0,0 +1,50 @@
+"""Runs coroutines for synchronous callers on one shared background event loop."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="async-runner", daemon=True).start()
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Like ``asyncio.run(coro)``, but every call uses the same event loop.
+
+    langchain_openai caches its default ``httpx.AsyncClient`` per process, and
+    that client is bound to the loop it first ran on; with a new loop per
+    ``asyncio.run`` the next batch of a LangChain agent fails with "Event loop
+    is closed". Context variables of the caller (e.g. the current profiler
+    span) are passed on. Must not be called from the loop's own thread.
+    """
+    loop = _shared_loop()
+    context = contextvars.copy_context()
+    result: concurrent.futures.Future = concurrent.futures.Future()
+
+    def done(task: asyncio.Task) -> None:
+        if task.cancelled():
+            result.cancel()
+        elif task.exception() is not None:
+            result.set_exception(task.exception())
+        else:
+            result.set_result(task.result())
+
+    def start() -> None:
+        context.run(loop.create_task, coro).add_done_callback(done)
+
+    loop.call_soon_threadsafe(start)
+    return result.result()
@@ -0,0 +1,94 @@
+"""On-disk snapshots of stage results, so a failed pipeline run can be resumed."""
+
+import logging
+import os
+import shutil
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils import snapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snap"
+
+
+class CheckpointStore:
+    """
+    Stores the result of selected stages per run in
+    ``directory/<run_id>/<stage>.snap`` (columnar snapshot of the Pydantic
+    models, see :mod:`src.utils.snapshot`). The snapshots were written by
+    this application, so they are loaded without re-validation.
+
+    Snapshots are written atomically, so a crash while saving leaves the
+    previous state intact. Only the newest ``keep_runs`` runs are kept, and
+    runs older than ``retention_seconds`` are deleted (see :meth:`prune`).
+    """
+
+    def __init__(self, directory: str, keep_runs: int = 5, retention_seconds: Optional[float] = 7 * 24 * 3600):
+        self.directory = directory
+        self.keep_runs = keep_runs
+        self.retention_seconds = retention_seconds
+
+    def run_dir(self, run_id: str) -> str:
+        if not run_id or os.sep in run_id or run_id in (".", ".."):
+            raise ValueError(f"Ungültige Lauf-ID '{run_id}'.")
+        return os.path.join(self.directory, run_id)
+
+    def save(self, run_id: str, stage: str, value: Any) -> str:
+        run_dir = self.run_dir(run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, f"{stage}{SNAPSHOT_SUFFIX}")
+        tmp_path = f"{path}.tmp"
+        data = snapshot.dumps(value)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+    def stages(self, run_id: str) -> List[str]:
+        run_dir = self.run_dir(run_id)
+        if not os.path.isdir(run_dir):
+            return []
+        return sorted(name[: -len(SNAPSHOT_SUFFIX)] for name in os.listdir(run_dir) if name.endswith(SNAPSHOT_SUFFIX))
+
+    def load(self, run_id: str, stages: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Results of all (or the given) stored stages of a run; unreadable snapshots are skipped."""
+        wanted = set(stages) if stages is not None else None
+        results: Dict[str, Any] = {}
+        for stage in self.stages(run_id):
+            if wanted is not None and stage not in wanted:
+                continue
+            path = os.path.join(self.run_dir(run_id), f"{stage}{SNAPSHOT_SUFFIX}")
+            try:
+                with open(path, "rb") as f:
+                    results[stage] = snapshot.loads(f.read(), trusted=True)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Checkpoint '{path}' konnte nicht gelesen werden und wird ignoriert: {e}")
+        return results
+
+    def _run_entries(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return []
+        entries = [e for e in os.scandir(self.directory) if e.is_dir()]
+        return sorted(entries, key=lambda e: e.stat().st_mtime)
+
+    def runs(self) -> List[str]:
+        """Run IDs with checkpoints, oldest first."""
+        return [e.name for e in self._run_entries()]
+
+    def latest_run_id(self) -> Optional[str]:
+        runs = self.runs()
+        return runs[-1] if runs else None
+
+    def prune(self, keep: Optional[str] = None) -> None:
+        """
+        Deletes runs older than ``retention_seconds`` and all but the newest
+        ``keep_runs`` runs (``keep`` is never deleted).
+        """
+        entries = [e for e in self._run_entries() if e.name != keep]
+        excess = max(0, len(entries) - max(0, self.keep_runs - (1 if keep else 0)))
+        cutoff = time.time() - self.retention_seconds if self.retention_seconds else None
+        for idx, entry in enumerate(entries):
+            if idx < excess or (cutoff is not None and entry.stat().st_mtime < cutoff):
+                shutil.rmtree(entry.path, ignore_errors=True)
@@ -4,7 +4,7 @@
 import os
 from dotenv import load_dotenv
 import logging
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__) # Logger für dieses Modul
 
@@ -53,3 +53,54 @@ def get_api_key(key_name: str) -> str:
         raise ValueError(f"API-Schlüssel '{key_name}' nicht in den Umgebungsvariablen gefunden. Bitte in .env setzen oder als System-Umgebungsvariable definieren.")
     logger.debug(f"API-Schlüssel '{key_name}' erfolgreich geladen.")
     return api_key
+
+def get_env_int(variable_name: str, default: int) -> int:
+    """
+    Holt eine Umgebungsvariable als Ganzzahl. Bei fehlendem oder ungültigem Wert wird der Default verwendet.
+    """
+    raw = os.getenv(variable_name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Ungültiger Wert '{raw}' für {variable_name}. Verwende Standard {default}.")
+        return default
+
+def get_env_float(variable_name: str, default: Optional[float]) -> Optional[float]:
+    """
+    Holt eine Umgebungsvariable als Kommazahl. Bei fehlendem oder ungültigem Wert wird der Default verwendet.
+    """
+    raw = os.getenv(variable_name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Ungültiger Wert '{raw}' für {variable_name}. Verwende Standard {default}.")
+        return default
+
+def get_env_bool(variable_name: str, default: bool = False) -> bool:
+    """
+    Holt eine Umgebungsvariable als Wahrheitswert ("true", "1", "yes", "on" gelten als wahr).
+    """
+    raw = os.getenv(variable_name)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in ("true", "1", "yes", "on")
+
+def get_env_list(variable_name: str) -> List[str]:
+    """
+    Holt eine kommagetrennte Umgebungsvariable als Liste (leere Einträge werden ignoriert).
+    """
+    raw = os.getenv(variable_name) or ""
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+def get_cache_dir() -> str:
+    """
+    Liefert das Verzeichnis für persistente Caches und Zustandsdaten (NEWSLETTER_CACHE_DIR, Default 'tmp/cache')
+    und legt es bei Bedarf an.
+    """
+    cache_dir = os.getenv("NEWSLETTER_CACHE_DIR") or os.path.join("tmp", "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
@@ -0,0 +1,124 @@
+"""Fast, memoised parsing of the timestamp strings delivered by the data sources."""
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_SIZE = 8192
+
+_ISO_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?)?"
+    r"\s*(Z|z|UTC|[+-]\d{2}(?::?\d{2})?)?"
+)
+_GERMAN_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})(?:,?\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?")
+_RFC2822_PATTERN = re.compile(r"(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{1,2}:\d{2}.*")
+
+
+def _offset(raw: Optional[str]) -> timezone:
+    if raw is None or raw in ("Z", "z", "UTC"):
+        return timezone.utc
+    digits = raw[1:].replace(":", "")
+    delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:4] or 0))
+    return timezone(-delta if raw[0] == "-" else delta)
+
+
+def _from_iso_match(match: "re.Match[str]") -> datetime:
+    year, month, day, hour, minute, second, fraction, tz = match.groups()
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo=_offset(tz),
+    )
+
+
+def _from_german_match(match: "re.Match[str]") -> datetime:
+    day, month, year, hour, minute, second = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0), tzinfo=timezone.utc)
+
+
+# Vorkompilierte Fallback-Formate, in dieser Reihenfolge versucht, wenn fromisoformat scheitert
+_FALLBACK_FORMATS: List[Tuple["re.Pattern[str]", Callable[["re.Match[str]"], datetime]]] = [
+    (_ISO_PATTERN, _from_iso_match),          # ISO-Varianten älterer Python-Versionen (Z, +0200, Komma-Bruchteile)
+    (_GERMAN_PATTERN, _from_german_match),    # 04.06.2025 10:00
+    (_RFC2822_PATTERN, lambda m: parsedate_to_datetime(m.string)),  # Tue, 04 Jun 2025 10:00:00 GMT (RSS)
+]
+
+
+def _aware(value: datetime) -> datetime:
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_string(value: str) -> Optional[datetime]:
+    text = value.strip()
+    try:
+        # Schneller Pfad: die ISO-Formen der APIs (NewsAPI/Eventbrite liefern '...Z')
+        if text.endswith("Z"):
+            return _aware(datetime.fromisoformat(text[:-1] + "+00:00"))
+        return _aware(datetime.fromisoformat(text))
+    except ValueError:
+        pass
+    for pattern, build in _FALLBACK_FORMATS:
+        match = pattern.fullmatch(text)
+        if match is None:
+            continue
+        try:
+            return _aware(build(match))
+        except (ValueError, TypeError):
+            break
+    # Dank Cache wird jeder ungültige Wert nur einmal gemeldet
+    logger.warning("Ungültiges Datumsstring-Format für Konvertierung: '%s'.", value)
+    return None
+
+
+def parse_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """
+    Parses a timestamp string into a timezone-aware datetime (UTC if the
+    string carries no offset); datetimes are only made timezone-aware.
+
+    ISO strings take the fast ``fromisoformat`` path; other shapes are tried
+    against pre-compiled fallback formats (older ISO variants, ``DD.MM.YYYY
+    HH:MM``, RFC 2822). Results, including failures (None), are memoised in
+    an LRU cache of ``PARSE_CACHE_SIZE`` strings, so the timestamps repeated
+    within and across API responses are parsed once.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return _aware(value)
+    return _parse_string(value)
+
+
+def parse_datetimes(values: Iterable[Union[str, datetime, None]]) -> List[Optional[datetime]]:
+    """
+    Batch version of :func:`parse_datetime` for a whole API response: every
+    distinct string is parsed once, independent of the LRU cache size.
+    """
+    parsed: Dict[str, Optional[datetime]] = {}
+    results: List[Optional[datetime]] = []
+    for value in values:
+        if isinstance(value, str):
+            if value not in parsed:
+                parsed[value] = _parse_string(value)
+            results.append(parsed[value])
+        else:
+            results.append(parse_datetime(value))
+    return results
+
+
+def clear_parse_cache() -> None:
+    _parse_string.cache_clear()
+
+
+def parse_cache_info():
+    """Hit/miss statistics of the parse cache (``functools`` cache info)."""
+    return _parse_string.cache_info()
@@ -0,0 +1,144 @@
+"""Cross-source deduplication of events before the pre-filter and LLM scoring."""
+
+import logging
+import math
+from typing import Dict, List, Optional, Set
+
+from src.models.data_models import Event
+from src.utils.text_utils import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Ortsangaben, die fast jedes Event trägt und die daher nichts über den Veranstaltungsort aussagen
+_GENERIC_LOCATION_TOKENS = {"zürich", "zurich", "zuerich", "zh", "schweiz", "switzerland", "ch", "online", "stadt", "city"}
+
+
+def _title_tokens(event: Event) -> Set[str]:
+    return set(tokenize(event.summary))
+
+
+def _location_tokens(event: Event) -> Set[str]:
+    return {tok for tok in tokenize(event.location) if tok not in _GENERIC_LOCATION_TOKENS and not tok.isdigit()}
+
+
+def _hour_bucket(event: Event) -> Optional[int]:
+    return int(event.start_time.timestamp() // 3600) if event.start_time else None
+
+
+def _richness(event: Event) -> int:
+    """How much usable information an event carries (for choosing the representative)."""
+    return (
+        len(event.description or "")
+        + len(event.location or "")
+        + (50 if event.url else 0)
+        + (20 if event.end_time else 0)
+        + (20 if event.start_time else 0)
+    )
+
+
+class EventDeduplicator:
+    """
+    Incremental clustering of the same event reported by several sources.
+
+    Events are indexed by their start time bucketed to the hour. A new event
+    is compared only with clusters in its own and the neighbouring buckets
+    (so timestamps that differ by a few minutes still meet) and joins a
+    cluster if
+
+    - the start times differ by at most ``time_tolerance_minutes``,
+    - the normalised title tokens overlap by at least ``title_threshold``
+      (Jaccard, or containment for titles of two or more tokens), and
+    - the locations are compatible: unknown on one side, or sharing a
+      token once generic tokens like the city name are removed.
+
+    Events without start time are only compared with each other. Each
+    cluster is merged into its richest member, with missing fields filled
+    in from the others and every source listed in ``Event.sources``.
+    """
+
+    def __init__(self, title_threshold: float = 0.5, time_tolerance_minutes: float = 60):
+        self.title_threshold = title_threshold
+        self.time_tolerance_seconds = time_tolerance_minutes * 60
+        self._bucket_radius = max(1, math.ceil(self.time_tolerance_seconds / 3600))
+        self._clusters: List[List[Event]] = []
+        self._buckets: Dict[Optional[int], List[int]] = {}
+        self.duplicates = 0
+
+    def _titles_match(self, a: Set[str], b: Set[str]) -> bool:
+        if not a or not b:
+            return False
+        common = len(a & b)
+        if common / len(a | b) >= self.title_threshold:
+            return True
+        smaller = min(len(a), len(b))
+        return smaller >= 2 and common == smaller
+
+    @staticmethod
+    def _locations_match(a: Set[str], b: Set[str]) -> bool:
+        return not a or not b or bool(a & b)
+
+    def _is_same(self, event: Event, other: Event) -> bool:
+        if (event.start_time is None) != (other.start_time is None):
+            return False
+        if event.start_time is not None:
+            if abs((event.start_time - other.start_time).total_seconds()) > self.time_tolerance_seconds:
+                return False
+        return self._titles_match(_title_tokens(event), _title_tokens(other)) and self._locations_match(
+            _location_tokens(event), _location_tokens(other)
+        )
+
+    def _find_cluster(self, event: Event, bucket: Optional[int]) -> Optional[int]:
+        if bucket is None:
+            neighbours: List[Optional[int]] = [None]
+        else:
+            neighbours = list(range(bucket - self._bucket_radius, bucket + self._bucket_radius + 1))
+        for key in neighbours:
+            for cluster_id in self._buckets.get(key, ()):
+                if any(self._is_same(event, member) for member in self._clusters[cluster_id]):
+                    return cluster_id
+        return None
+
+    def add(self, event: Event) -> bool:
+        """Adds an event; returns True if it started a new cluster (i.e. is not a duplicate)."""
+        bucket = _hour_bucket(event)
+        cluster_id = self._find_cluster(event, bucket)
+        if cluster_id is None:
+            self._buckets.setdefault(bucket, []).append(len(self._clusters))
+            self._clusters.append([event])
+            return True
+        self._clusters[cluster_id].append(event)
+        self.duplicates += 1
+        return False
+
+    @staticmethod
+    def _merge(members: List[Event]) -> Event:
+        best = max(members, key=_richness)
+        update: Dict[str, object] = {}
+        for field in ("start_time", "end_time", "location", "url"):
+            if getattr(best, field) is None:
+                update[field] = next((getattr(m, field) for m in members if getattr(m, field) is not None), None)
+        descriptions = [m.description for m in members if m.description]
+        if descriptions:
+            update["description"] = max(descriptions, key=len)
+        sources: List[str] = []
+        for member in members:
+            for source in member.sources or [member.source]:
+                if source not in sources:
+                    sources.append(source)
+        update["sources"] = sources
+        return best.model_copy(update=update)
+
+    def results(self) -> List[Event]:
+        """One merged event per cluster, in order of first appearance."""
+        return [members[0] if len(members) == 1 else self._merge(members) for members in self._clusters]
+
+
+def deduplicate_events(events: List[Event]) -> List[Event]:
+    """Merges events reported by several sources into one event each."""
+    dedup = EventDeduplicator()
+    for event in events:
+        dedup.add(event)
+    merged = dedup.results()
+    if dedup.duplicates:
+        logger.info(f"{dedup.duplicates} doppelte Termine zusammengeführt, {len(merged)} Termine verbleiben.")
+    return merged
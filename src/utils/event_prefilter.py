@@ -0,0 +1,109 @@
+"""Deterministic pre-filter that runs before the LLM based event scoring."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.data_models import Event
+from src.utils.text_utils import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+class PrefilterResult:
+    """Outcome of :meth:`EventPrefilter.apply`."""
+
+    def __init__(self, events: List[Event], accepted: List[Event], stats: Dict[str, int]):
+        # Alle Events, die den Vorfilter passiert haben (in ursprünglicher Reihenfolge)
+        self.events = events
+        # Über die Allow-Liste direkt übernommene Events (ohne LLM-Bewertung)
+        self.accepted = accepted
+        self.stats = stats
+        accepted_ids = {id(evt) for evt in accepted}
+        # Events, die noch vom LLM bewertet werden müssen
+        self.candidates = [evt for evt in events if id(evt) not in accepted_ids]
+
+    @property
+    def skipped(self) -> int:
+        """Number of events that do not need an LLM score."""
+        return self.stats["total"] - len(self.candidates)
+
+    def merge(self, scored: Iterable[Event]) -> List[Event]:
+        """Accepted events plus the scored candidates that passed, in the original order."""
+        kept = {id(evt) for evt in scored}
+        kept.update(id(evt) for evt in self.accepted)
+        return [evt for evt in self.events if id(evt) in kept]
+
+
+class EventPrefilter:
+    """
+    Cheap filter cascade in front of the EventFilterAgent.
+
+    In this order it drops events that are already over or start more than
+    ``max_days_ahead`` days from now, duplicates across sources (same
+    normalised title, date and location) and events containing a deny
+    keyword. Events containing an allow keyword are accepted without LLM
+    scoring. Keywords are matched as whole words on the normalised title
+    and description; events without start time are kept.
+
+    Args:
+        max_days_ahead: Time window for upcoming events (None = unlimited).
+        allow_keywords: Keywords that accept an event without scoring.
+        deny_keywords: Keywords that drop an event.
+    """
+
+    def __init__(
+        self,
+        max_days_ahead: Optional[float] = 14,
+        allow_keywords: Optional[Iterable[str]] = None,
+        deny_keywords: Optional[Iterable[str]] = None,
+    ):
+        self.max_days_ahead = max_days_ahead
+        self.allow_keywords = [kw for kw in (normalize_text(k) for k in allow_keywords or []) if kw]
+        self.deny_keywords = [kw for kw in (normalize_text(k) for k in deny_keywords or []) if kw]
+
+    @staticmethod
+    def dedup_key(event: Event) -> Tuple[str, str, str]:
+        day = event.start_time.date().isoformat() if event.start_time else ""
+        return normalize_text(event.summary), day, normalize_text(event.location)
+
+    @staticmethod
+    def _matches(text: str, keywords: List[str]) -> bool:
+        padded = f" {text} "
+        return any(f" {kw} " in padded for kw in keywords)
+
+    def apply(self, events: List[Event], now: Optional[datetime] = None) -> PrefilterResult:
+        now = now or datetime.now(timezone.utc)
+        horizon = now + timedelta(days=self.max_days_ahead) if self.max_days_ahead else None
+        stats = {"total": len(events), "past": 0, "too_far_ahead": 0, "duplicates": 0, "denied": 0, "allowed": 0}
+        kept: List[Event] = []
+        accepted: List[Event] = []
+        seen = set()
+        for event in events:
+            if event.start_time is not None:
+                if (event.end_time or event.start_time) < now:
+                    stats["past"] += 1
+                    continue
+                if horizon is not None and event.start_time > horizon:
+                    stats["too_far_ahead"] += 1
+                    continue
+            key = self.dedup_key(event)
+            if key in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(key)
+            text = normalize_text(f"{event.summary} {event.description or ''}")
+            if self.deny_keywords and self._matches(text, self.deny_keywords):
+                stats["denied"] += 1
+                continue
+            kept.append(event)
+            if self.allow_keywords and self._matches(text, self.allow_keywords):
+                stats["allowed"] += 1
+                accepted.append(event)
+        result = PrefilterResult(kept, accepted, stats)
+        logger.info(
+            f"Event-Vorfilter: {len(result.candidates)} von {len(events)} Events zur LLM-Bewertung "
+            f"(vergangen {stats['past']}, zu weit entfernt {stats['too_far_ahead']}, Duplikate {stats['duplicates']}, "
+            f"Deny-Liste {stats['denied']}, Allow-Liste {stats['allowed']})."
+        )
+        return result
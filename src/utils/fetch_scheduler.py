@@ -0,0 +1,241 @@
+"""Concurrent scheduler for the data fetchers of a pipeline run."""
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FetchScheduler:
+    """Runs independent fetch jobs in a bounded thread pool.
+
+    Every job gets its own deadline (``source_timeout``) and the whole batch
+    is bounded by ``global_timeout``. Jobs that miss their deadline are
+    abandoned: the scheduler returns the results collected so far and the
+    ``default`` value for every job that did not finish in time. Python
+    threads cannot be killed, so late jobs keep running in the background
+    until their own network timeouts fire, but nobody waits for them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        source_timeout: Optional[float] = 60.0,
+        global_timeout: Optional[float] = 120.0,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.source_timeout = source_timeout
+        self.global_timeout = global_timeout
+        self.timed_out: List[str] = []
+        self.failed: List[str] = []
+        self.durations: Dict[str, float] = {}
+
+    def run(self, jobs: Dict[str, Callable[[], Any]], default: Any = None) -> Dict[str, Any]:
+        """Execute ``jobs`` concurrently and return ``{name: result}``.
+
+        Args:
+            jobs: Mapping of a job name (e.g. the fetcher's source name) to a
+                callable without arguments.
+            default: Value used for jobs that fail or miss a deadline. A fresh
+                empty list is used when ``default`` is ``None``.
+
+        Returns:
+            A dict containing an entry for every job name, in the order of
+            ``jobs``.
+        """
+        self.timed_out = []
+        self.failed = []
+        self.durations = {}
+        results: Dict[str, Any] = {}
+        if not jobs:
+            return results
+
+        start = time.monotonic()
+        global_deadline = start + self.global_timeout if self.global_timeout else None
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)), thread_name_prefix="fetch"
+        )
+        started_at: Dict[str, float] = {}
+        pending: Dict[Future, str] = {}
+        for name, job in jobs.items():
+            # Kontext mitgeben, damit Messungen der Jobs der aufrufenden Stage zugeordnet werden
+            pending[executor.submit(contextvars.copy_context().run, self._timed_call, name, job, started_at)] = name
+
+        try:
+            while pending:
+                now = time.monotonic()
+                deadline = self._next_deadline(pending.values(), started_at, global_deadline)
+                timeout = max(0.0, deadline - now) if deadline is not None else None
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as exc:
+                        logger.error("Fetch-Job '%s' fehlgeschlagen: %s", name, exc, exc_info=True)
+                        self.failed.append(name)
+
+                now = time.monotonic()
+                if global_deadline is not None and now >= global_deadline:
+                    for future, name in pending.items():
+                        future.cancel()
+                        self.timed_out.append(name)
+                    if pending:
+                        logger.warning(
+                            "Globales Fetch-Timeout von %ss erreicht. Fahre ohne %s fort.",
+                            self.global_timeout,
+                            sorted(pending.values()),
+                        )
+                    pending = {}
+                    break
+
+                expired = self._expire_sources(pending.values(), started_at, now)
+                for future, name in list(pending.items()):
+                    if name in expired:
+                        future.cancel()
+                        del pending[future]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            "Fetch-Stufe mit %d Jobs in %.2fs abgeschlossen (%d Timeouts, %d Fehler).",
+            len(jobs),
+            time.monotonic() - start,
+            len(self.timed_out),
+            len(self.failed),
+        )
+        return {
+            name: results[name] if name in results else ([] if default is None else default)
+            for name in jobs
+        }
+
+    def stream(self, jobs: Dict[str, Callable[[], Iterable[Any]]]) -> Iterator[Tuple[str, Any]]:
+        """Consume several item streams concurrently and yield ``(name, item)`` as items arrive.
+
+        Every job returns an iterable (typically a generator that pages
+        through an API); the jobs are iterated in worker threads and their
+        items are handed to the caller immediately, so downstream processing
+        overlaps with the remaining network requests. A stream that exceeds
+        ``source_timeout`` is dropped from then on (items already yielded are
+        kept); ``global_timeout`` ends the whole stream. Workers stop at the
+        next item once the stream has ended or the consumer stopped iterating.
+        """
+        self.timed_out = []
+        self.failed = []
+        self.durations = {}
+        if not jobs:
+            return
+
+        start = time.monotonic()
+        global_deadline = start + self.global_timeout if self.global_timeout else None
+        items: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        stop = threading.Event()
+        started_at: Dict[str, float] = {}
+        active = set(jobs)
+
+        def consume(name: str, job: Callable[[], Iterable[Any]]) -> None:
+            started_at[name] = time.monotonic()
+            try:
+                for item in job():
+                    if stop.is_set() or name not in active:
+                        break
+                    items.put(("item", name, item))
+                items.put(("done", name, None))
+            except Exception as exc:
+                items.put(("error", name, exc))
+            finally:
+                self.durations[name] = time.monotonic() - started_at[name]
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)), thread_name_prefix="fetch"
+        )
+        for name, job in jobs.items():
+            executor.submit(contextvars.copy_context().run, consume, name, job)
+
+        try:
+            while active:
+                now = time.monotonic()
+                if global_deadline is not None and now >= global_deadline:
+                    logger.warning(
+                        "Globales Fetch-Timeout von %ss erreicht. Fahre ohne %s fort.",
+                        self.global_timeout,
+                        sorted(active),
+                    )
+                    self.timed_out.extend(sorted(active))
+                    break
+                active.difference_update(self._expire_sources(sorted(active), started_at, now))
+                if not active:
+                    break
+                deadline = self._next_deadline(active, started_at, global_deadline)
+                try:
+                    kind, name, payload = items.get(timeout=max(0.0, deadline - now) if deadline is not None else None)
+                except queue.Empty:
+                    continue
+                if name not in active:
+                    continue
+                if kind == "item":
+                    yield name, payload
+                elif kind == "error":
+                    logger.error("Fetch-Job '%s' fehlgeschlagen: %s", name, payload, exc_info=payload)
+                    self.failed.append(name)
+                    active.discard(name)
+                else:
+                    active.discard(name)
+        finally:
+            stop.set()
+            active.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(
+                "Fetch-Stream mit %d Jobs in %.2fs abgeschlossen (%d Timeouts, %d Fehler).",
+                len(jobs),
+                time.monotonic() - start,
+                len(self.timed_out),
+                len(self.failed),
+            )
+
+    def _timed_call(self, name: str, job: Callable[[], Any], started_at: Dict[str, float]) -> Any:
+        started_at[name] = time.monotonic()
+        try:
+            return job()
+        finally:
+            self.durations[name] = time.monotonic() - started_at[name]
+
+    def _expire_sources(self, names: Iterable[str], started_at: Dict[str, float], now: float) -> List[str]:
+        """Records and returns the jobs that exceeded ``source_timeout``."""
+        expired = []
+        if not self.source_timeout:
+            return expired
+        for name in names:
+            started = started_at.get(name)
+            if started is not None and now - started >= self.source_timeout:
+                logger.warning(
+                    "Fetch-Job '%s' hat das Timeout von %ss überschritten. Fahre ohne ihn fort.",
+                    name,
+                    self.source_timeout,
+                )
+                self.timed_out.append(name)
+                expired.append(name)
+        return expired
+
+    def _next_deadline(
+        self,
+        names: Iterable[str],
+        started_at: Dict[str, float],
+        global_deadline: Optional[float],
+    ) -> Optional[float]:
+        """Returns the earliest point in time at which a deadline of the given jobs expires."""
+        deadlines = [global_deadline] if global_deadline is not None else []
+        if self.source_timeout:
+            for name in names:
+                if name in started_at:
+                    deadlines.append(started_at[name] + self.source_timeout)
+                else:
+                    # Job wartet noch auf einen freien Worker; regelmäßig neu prüfen.
+                    deadlines.append(time.monotonic() + min(self.source_timeout, 1.0))
+        return min(deadlines) if deadlines else None
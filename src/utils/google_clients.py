@@ -0,0 +1,71 @@
+"""Shared factory for Google API clients (credentials, discovery documents and services)."""
+
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from google.oauth2 import service_account
+from googleapiclient import discovery
+from googleapiclient.discovery_cache import get_static_doc
+
+logger = logging.getLogger(__name__)
+
+_credentials: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_lock = threading.Lock()
+
+
+def get_credentials(credentials_path: str, scopes: Iterable[str]) -> Any:
+    """
+    Loads service account credentials once per key file and scope set.
+
+    Each client passes only the scopes it needs; clients with the same key
+    file and the same scopes share one access token, which google-auth
+    refreshes on expiry.
+    """
+    key = (os.path.abspath(credentials_path), tuple(sorted(set(scopes))))
+    with _lock:
+        credentials = _credentials.get(key)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_file(credentials_path, scopes=list(key[1]))
+            _credentials[key] = credentials
+        return credentials
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service: str, version: str) -> Optional[Dict[str, Any]]:
+    """Parsed discovery document from the static copies shipped with googleapiclient (None if missing)."""
+    raw = get_static_doc(service, version)
+    if raw is None:
+        logger.warning(f"Kein lokales Discovery-Dokument für {service} {version}, es wird online geladen.")
+        return None
+    return json.loads(raw)
+
+
+def build_service(
+    service: str,
+    version: str,
+    credentials_path: str,
+    scopes: Iterable[str],
+) -> Any:
+    """
+    Builds a Google API client from the locally cached discovery document and
+    the shared credentials.
+
+    Each client keeps its own HTTP transport (httplib2 is not thread-safe and
+    the Google fetchers run in parallel), but clients with the same key file
+    and scopes authorise with the same credentials and token.
+    """
+    credentials = get_credentials(credentials_path, scopes)
+    document = get_discovery_document(service, version)
+    if document is None:
+        return discovery.build(service, version, credentials=credentials, cache_discovery=False)
+    return discovery.build_from_document(document, credentials=credentials)
+
+
+def clear_google_client_cache() -> None:
+    with _lock:
+        _credentials.clear()
+    get_discovery_document.cache_clear()
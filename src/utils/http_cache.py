@@ -0,0 +1,204 @@
+"""On-disk cache for HTTP GET responses with conditional revalidation."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from src.utils.config_loader import get_cache_dir, get_env_bool, get_env_float
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """A stored response body together with its validators."""
+
+    def __init__(
+        self,
+        body: bytes,
+        content_type: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fresh_until: Optional[float],
+    ):
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh_until = fresh_until
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return self.fresh_until is not None and self.fresh_until > (now if now is not None else time.time())
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """``If-None-Match``/``If-Modified-Since`` for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPResponseCache:
+    """
+    SQLite-backed cache for response bodies of GET requests.
+
+    Entries are stored with their ``ETag``/``Last-Modified`` validators and an
+    optional freshness deadline. Fresh entries are served without a request;
+    stale entries with validators are revalidated and a ``304 Not Modified``
+    is answered from disk. Entries not used for ``retention_seconds`` are
+    removed. Only a hash of URL, parameters and headers is stored as key,
+    so API keys never end up in the database.
+
+    Args:
+        path: Location of the SQLite database file.
+        retention_seconds: How long unused entries are kept for revalidation.
+        enabled: If False, the cache neither reads nor writes.
+    """
+
+    def __init__(self, path: str, retention_seconds: float = 7 * 24 * 3600, enabled: bool = True):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self.enabled = enabled
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None, headers: Optional[Mapping[str, str]] = None) -> str:
+        payload = json.dumps(
+            {"url": url, "params": dict(params or {}), "headers": {k.lower(): v for k, v in (headers or {}).items()}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY, body BLOB NOT NULL, content_type TEXT, etag TEXT,"
+                " last_modified TEXT, fresh_until REAL, stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT body, content_type, etag, last_modified, fresh_until FROM http_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE http_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+            return CachedResponse(bytes(row[0]), row[1], row[2], row[3], row[4])
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP-Cache konnte nicht gelesen werden ({self.path}): {e}")
+            return None
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        fresh_until = now + ttl_seconds if ttl_seconds else None
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache"
+                    " (key, body, content_type, etag, last_modified, fresh_until, stored_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, sqlite3.Binary(body), content_type, etag, last_modified, fresh_until, now, now),
+                )
+                conn.execute("DELETE FROM http_cache WHERE last_access < ?", (now - self.retention_seconds,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP-Antwort konnte nicht im Cache gespeichert werden ({self.path}): {e}")
+
+    def refresh(self, key: str, ttl_seconds: Optional[float] = None) -> None:
+        """Extends the freshness of an entry after a successful revalidation."""
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "UPDATE http_cache SET fresh_until = ?, last_access = ? WHERE key = ?",
+                    (now + ttl_seconds if ttl_seconds else None, now, key),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP-Cache-Eintrag konnte nicht aktualisiert werden ({self.path}): {e}")
+
+    def record_hit(self, entry: CachedResponse, revalidated: bool) -> None:
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.fresh_hits += 1
+            self.bytes_saved += len(entry.body)
+
+    def record_download(self, size: int) -> None:
+        with self._lock:
+            self.misses += 1
+            self.bytes_downloaded += size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "bytes_saved": self.bytes_saved,
+            "bytes_downloaded": self.bytes_downloaded,
+        }
+
+    def __repr__(self) -> str:
+        return f"<HTTPResponseCache(path='{self.path}', enabled={self.enabled})>"
+
+
+_shared_caches: Dict[Tuple[Any, ...], HTTPResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPResponseCache:
+    """
+    Returns the process-wide HTTP cache configured via environment variables
+    (HTTP_CACHE_ENABLED, HTTP_CACHE_RETENTION_DAYS, NEWSLETTER_CACHE_DIR).
+    """
+    settings = (
+        os.path.join(get_cache_dir(), "http_cache.sqlite"),
+        get_env_float("HTTP_CACHE_RETENTION_DAYS", 7.0) * 24 * 3600,
+        get_env_bool("HTTP_CACHE_ENABLED", True),
+    )
+    with _shared_lock:
+        if settings not in _shared_caches:
+            _shared_caches[settings] = HTTPResponseCache(*settings)
+        return _shared_caches[settings]
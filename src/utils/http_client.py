@@ -0,0 +1,76 @@
+"""Shared, pooled HTTP session for all requests-based data fetchers."""
+
+import logging
+import threading
+from typing import Collection, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.config_loader import get_env_float, get_env_int
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+USER_AGENT = "newsletter-department/1.0 (+https://github.com/lukas328/newsletter_department)"
+
+
+def build_session(
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    backoff_jitter: float = 0.5,
+    backoff_max: float = 30.0,
+    pool_maxsize: int = 10,
+    status_forcelist: Collection[int] = RETRY_STATUS_CODES,
+) -> requests.Session:
+    """
+    Creates a :class:`requests.Session` with keep-alive connection pools per host and
+    automatic retries.
+
+    Failed GET/HEAD requests (connection errors and the status codes in
+    ``status_forcelist``) are retried with exponential backoff plus random
+    jitter. A ``Retry-After`` header from the server takes precedence over the
+    computed backoff. After the last attempt the final response is returned,
+    so callers still see the status via ``raise_for_status()``.
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        backoff_max=backoff_max,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide session, configured via HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR and HTTP_POOL_MAXSIZE.
+    """
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = build_session(
+                max_retries=get_env_int("HTTP_MAX_RETRIES", 3),
+                backoff_factor=get_env_float("HTTP_BACKOFF_FACTOR", 0.5),
+                pool_maxsize=get_env_int("HTTP_POOL_MAXSIZE", 10),
+            )
+            logger.debug("Gemeinsame HTTP-Session erstellt.")
+        return _shared_session
@@ -0,0 +1,178 @@
+"""Persistent, content-addressed cache for LLM results."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.config_loader import get_cache_dir, get_env_bool, get_env_float, get_env_int
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResultCache:
+    """
+    SQLite-backed key/value cache for JSON-serialisable LLM results.
+
+    Entries expire after ``ttl_seconds`` (per entry overridable) and the
+    least recently used entries are evicted once more than ``max_entries``
+    are stored. With ``bypass=True`` lookups always miss but fresh results
+    are still written, which refreshes the cache without disabling it.
+
+    Args:
+        path: Location of the SQLite database file.
+        ttl_seconds: Default lifetime of an entry (None = no expiry).
+        max_entries: Upper bound for the number of stored entries.
+        enabled: If False, the cache neither reads nor writes.
+        bypass: If True, lookups are skipped but results are still stored.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = 24 * 3600,
+        max_entries: int = 5000,
+        enabled: bool = True,
+        bypass: bool = False,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.enabled = enabled
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(agent: str, model_name: Optional[str], temperature: Optional[float], prompt_version: str, inputs: Any) -> str:
+        """Hash over everything that influences the LLM output."""
+        payload = json.dumps(
+            {
+                "agent": agent,
+                "model": model_name,
+                "temperature": temperature,
+                "prompt_version": prompt_version,
+                "inputs": inputs,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL,"
+                " expires_at REAL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value or None on a miss."""
+        if not self.enabled or self.bypass:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                value, expires_at = row
+                if expires_at is not None and expires_at < now:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self.hits += 1
+            return json.loads(value)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"LLM-Cache konnte nicht gelesen werden ({self.path}): {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Stores ``value``; ``ttl_seconds`` overrides the default lifetime."""
+        if not self.enabled or value is None:
+            return
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = now + ttl if ttl else None
+        try:
+            serialized = json.dumps(value, ensure_ascii=False)
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (key, serialized, now, expires_at, now),
+                )
+                self.writes += 1
+                self._evict(conn, now)
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"LLM-Ergebnis konnte nicht im Cache gespeichert werden ({self.path}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += overflow
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes, "evictions": self.evictions}
+
+    def __repr__(self) -> str:
+        return f"<LLMResultCache(path='{self.path}', enabled={self.enabled}, bypass={self.bypass})>"
+
+
+_shared_caches: Dict[Tuple[Any, ...], LLMResultCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResultCache:
+    """
+    Returns the process-wide cache configured via environment variables
+    (LLM_CACHE_ENABLED, LLM_CACHE_BYPASS, LLM_CACHE_TTL_HOURS, LLM_CACHE_MAX_ENTRIES, NEWSLETTER_CACHE_DIR).
+    """
+    ttl_hours = get_env_float("LLM_CACHE_TTL_HOURS", 24.0)
+    settings = (
+        os.path.join(get_cache_dir(), "llm_cache.sqlite"),
+        ttl_hours * 3600 if ttl_hours else None,
+        get_env_int("LLM_CACHE_MAX_ENTRIES", 5000),
+        get_env_bool("LLM_CACHE_ENABLED", True),
+        get_env_bool("LLM_CACHE_BYPASS", False),
+    )
+    with _shared_lock:
+        if settings not in _shared_caches:
+            _shared_caches[settings] = LLMResultCache(*settings)
+        return _shared_caches[settings]
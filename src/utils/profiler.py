@@ -0,0 +1,257 @@
+"""Run-level profiling: wall/CPU time, item counts and LLM token usage per pipeline section."""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """Measurements of one profiled section (a fetcher call, an agent batch, a stage, ...)."""
+
+    def __init__(self, name: str, category: str, parent: Optional["Span"] = None):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.started_at = time.time()
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.items: Optional[int] = None
+        self.llm_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.error: Optional[str] = None
+
+    def add_items(self, count: int) -> None:
+        self.items = (self.items or 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "parent": self.parent.name if self.parent else None,
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "items": self.items,
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "error": self.error,
+        }
+
+
+class RunProfiler:
+    """
+    Collects :class:`Span` objects of one pipeline run.
+
+    Sections are opened with :meth:`section` (or :func:`profile_section` /
+    :func:`profiled` for code that does not know the profiler). CPU time is
+    measured per thread (``time.thread_time``), so sections running in
+    worker threads do not count each other's work; async sections include
+    the CPU time of other coroutines on the same event loop. LLM token usage
+    reported via :func:`record_llm_usage` is added to the innermost open
+    section of the calling context (and to all of its parents).
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        self.started_at = time.time()
+        self.spans: List[Span] = []
+        # LLM-Nutzung außerhalb jeder Section (z.B. in Hintergrund-Threads)
+        self.unattributed = Span("unattributed", "llm")
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def section(self, name: str, category: str = "section", items: Optional[int] = None) -> Iterator[Span]:
+        span = Span(name, category, parent=_current_span.get())
+        if items is not None:
+            span.items = items
+        token = _current_span.set(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            span.wall_seconds = time.perf_counter() - wall_start
+            span.cpu_seconds = time.thread_time() - cpu_start
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Generator wurde in einem anderen Kontext geschlossen
+                _current_span.set(span.parent)
+            with self._lock:
+                self.spans.append(span)
+
+    def record_llm_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
+        span = _current_span.get() or self.unattributed
+        with self._lock:
+            while span is not None:
+                span.llm_calls += 1
+                span.prompt_tokens += prompt_tokens
+                span.completion_tokens += completion_tokens
+                span = span.parent
+
+    @property
+    def wall_seconds(self) -> float:
+        return time.perf_counter() - self._start
+
+    def report(self) -> Dict[str, Any]:
+        """Machine-readable report of the run (JSON-serialisable)."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.started_at)
+            top_level = [s for s in spans if s.parent is None] + [self.unattributed]
+            totals = {
+                "llm_calls": sum(s.llm_calls for s in top_level),
+                "prompt_tokens": sum(s.prompt_tokens for s in top_level),
+                "completion_tokens": sum(s.completion_tokens for s in top_level),
+            }
+            return {
+                "run_id": self.run_id,
+                "started_at": datetime.fromtimestamp(self.started_at, tz=timezone.utc).isoformat(),
+                "wall_seconds": round(self.wall_seconds, 4),
+                "totals": totals,
+                "unattributed_llm": self.unattributed.to_dict(),
+                "spans": [s.to_dict() for s in spans],
+            }
+
+    def summary_table(self, limit: int = 30) -> str:
+        """Human-readable table of the most expensive sections by wall time (equal names aggregated)."""
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        with self._lock:
+            for span in self.spans:
+                group = groups.setdefault(
+                    (span.name, span.category),
+                    {"calls": 0, "wall": 0.0, "cpu": 0.0, "items": None, "llm": 0, "tokens": 0},
+                )
+                group["calls"] += 1
+                group["wall"] += span.wall_seconds
+                group["cpu"] += span.cpu_seconds
+                if span.items is not None:
+                    group["items"] = (group["items"] or 0) + span.items
+                group["llm"] += span.llm_calls
+                group["tokens"] += span.prompt_tokens + span.completion_tokens
+        ranked = sorted(groups.items(), key=lambda kv: kv[1]["wall"], reverse=True)[:limit]
+        header = (
+            f"{'Section':<40} {'Kategorie':<8} {'n':>4} {'Wall s':>8} {'CPU s':>8} "
+            f"{'Items':>6} {'LLM':>5} {'Tokens':>9}"
+        )
+        lines = [header, "-" * len(header)]
+        for (name, category), group in ranked:
+            name = name if len(name) <= 40 else name[:37] + "..."
+            items = "" if group["items"] is None else str(group["items"])
+            lines.append(
+                f"{name:<40} {category:<8} {group['calls']:>4} {group['wall']:>8.2f} {group['cpu']:>8.2f} "
+                f"{items:>6} {group['llm']:>5} {group['tokens']:>9}"
+            )
+        return "\n".join(lines)
+
+    def write_report(self, directory: str, extra: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Writes the JSON report (plus the ``extra`` top-level keys) to
+        ``directory/profile_<run_id>.json`` and returns the path.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"profile_{self.run_id}.json")
+        report = self.report()
+        report.update(extra or {})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        return path
+
+    @contextmanager
+    def activate(self) -> Iterator["RunProfiler"]:
+        """Makes this profiler the target of :func:`profile_section` and :func:`record_llm_usage`."""
+        global _active_profiler
+        previous = _active_profiler
+        _active_profiler = self
+        try:
+            yield self
+        finally:
+            _active_profiler = previous
+
+    def __repr__(self) -> str:
+        return f"<RunProfiler(run_id='{self.run_id}', spans={len(self.spans)})>"
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("profiler_span", default=None)
+# Prozessweit, damit auch Worker-Threads des Stage-Graphs und Fetch-Schedulers messen
+_active_profiler: Optional[RunProfiler] = None
+
+
+def get_active_profiler() -> Optional[RunProfiler]:
+    return _active_profiler
+
+
+@contextmanager
+def profile_section(name: str, category: str = "section", items: Optional[int] = None) -> Iterator[Optional[Span]]:
+    """Opens a section on the active profiler; yields None (and measures nothing) if no run is profiled."""
+    profiler = _active_profiler
+    if profiler is None:
+        yield None
+        return
+    with profiler.section(name, category, items) as span:
+        yield span
+
+
+def record_llm_usage(prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+    """Adds the token usage of one LLM call to the current section of the active profiler."""
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.record_llm_usage(int(prompt_tokens or 0), int(completion_tokens or 0))
+
+
+def _section_name(name: Optional[str], func: Callable[..., Any], args: tuple) -> str:
+    if name:
+        return name
+    owner = args[0] if args else None
+    label = getattr(owner, "source_name", None) or (type(owner).__name__ if owner is not None else "")
+    return f"{label}.{func.__name__}" if label else func.__qualname__
+
+
+def profiled(name: Optional[str] = None, category: str = "section") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that profiles every call of a function or method.
+
+    Without ``name`` the section is named after the instance's ``source_name``
+    (fetchers) or class and the method. List results set the item count.
+    Coroutine functions are supported.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with profile_section(_section_name(name, func, args), category) as span:
+                    result = await func(*args, **kwargs)
+                    if span is not None and isinstance(result, list):
+                        span.items = len(result)
+                    return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with profile_section(_section_name(name, func, args), category) as span:
+                result = func(*args, **kwargs)
+                if span is not None and isinstance(result, list):
+                    span.items = len(result)
+                return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,92 @@
+"""Token-bucket rate limiting for calls against the OpenAI API."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token estimate (about four characters per token for German/English text)."""
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that refills continuously.
+
+    :meth:`reserve` never blocks; it takes the tokens immediately (the level
+    may become negative) and returns how long the caller has to wait until
+    the reservation is covered. This lets the same bucket serve blocking and
+    asyncio callers.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._level = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = self._clock()
+            self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            self._level -= amount
+            if self._level >= 0:
+                return 0.0
+            return -self._level / self.refill_per_second
+
+
+class RateLimiter:
+    """
+    Limits requests per minute and tokens per minute.
+
+    Args:
+        requests_per_minute: Maximum number of requests per minute (None = unlimited).
+        tokens_per_minute: Maximum number of (estimated) tokens per minute (None = unlimited).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0, clock) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0, clock) if tokens_per_minute else None
+
+    def _reserve(self, tokens: int) -> float:
+        wait = 0.0
+        if self._requests:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens and tokens:
+            wait = max(wait, self._tokens.reserve(tokens))
+        if wait > 0:
+            logger.debug("Rate-Limit erreicht, warte %.2fs.", wait)
+        return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Blocks until a request with ``tokens`` estimated tokens may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Asyncio variant of :meth:`acquire`."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter(rpm={self.requests_per_minute}, tpm={self.tokens_per_minute})>"
@@ -0,0 +1,334 @@
+"""
+Compact columnar snapshots of the Pydantic models in ``src.models.data_models``.
+
+A snapshot stores every list of models as a table with one typed column per
+field instead of one JSON object per item:
+
+- strings (including URLs and the entries of ``List[str]`` fields) go into a
+  single string dictionary shared by all tables, so repeated values such as
+  ``source_name``, ``category`` or ``source`` are stored once and referenced
+  by index,
+- datetimes are stored as microseconds since the epoch plus UTC offset,
+  floats, ints and bools as fixed-size ``array`` columns,
+- everything else (e.g. ``llm_processing_details``) as one JSON array per
+  column.
+
+Surrounding structure (dicts, single models, scalars) is kept in a small JSON
+header. The body is zlib-compressed. Only the standard library is used.
+
+``loads(data, trusted=True)`` builds the models like ``model_construct``
+instead of re-running validation. Use it only for snapshots this process
+wrote itself (e.g. checkpoints); the default path validates every item.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from copy import copy
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, HttpUrl, TypeAdapter
+
+from src.models.data_models import Artwork, Birthday, Event, ProcessedArticle, Quote, RawArticle, TodoItem, WeatherInfo
+
+MAGIC = b"NLSNAP"
+VERSION = 1
+
+MODEL_TYPES: Dict[str, Type[BaseModel]] = {
+    cls.__name__: cls
+    for cls in (RawArticle, ProcessedArticle, Event, Birthday, WeatherInfo, Quote, TodoItem, Artwork)
+}
+
+_NULL_INT = -(2 ** 63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_LENGTH = struct.Struct("<I")
+_SWAP = sys.byteorder != "little"
+_URLS = TypeAdapter(List[Optional[HttpUrl]])
+
+
+def _column_kind(annotation: Any) -> str:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    if annotation is HttpUrl:
+        return "url"
+    if annotation is str:
+        return "str"
+    if annotation is datetime:
+        return "datetime"
+    if annotation is bool:
+        return "bool"
+    if annotation is int:
+        return "int"
+    if annotation is float:
+        return "float"
+    if get_origin(annotation) is list and get_args(annotation) == (str,):
+        return "strlist"
+    return "json"
+
+
+_KINDS: Dict[Type[BaseModel], List[Tuple[str, str]]] = {
+    model: [(name, _column_kind(field.annotation)) for name, field in model.model_fields.items()]
+    for model in MODEL_TYPES.values()
+}
+
+
+def _pack(values: array) -> bytes:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+class _Writer:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.tables: List[Dict[str, Any]] = []
+        self.sections: List[bytes] = []
+
+    def string_indices(self, values: Iterable[Any]) -> array:
+        """Index + 1 of every value in the string dictionary (0 = None)."""
+        strings = self.strings
+        return array("I", [0 if v is None else strings.setdefault(str(v), len(strings)) + 1 for v in values])
+
+    def table(self, models: Sequence[BaseModel]) -> int:
+        model = type(models[0])
+        columns = _KINDS[model]
+        for name, kind in columns:
+            values = [getattr(item, name) for item in models]
+            self.sections.extend(self._column(kind, values))
+        self.tables.append({"model": model.__name__, "rows": len(models), "columns": columns})
+        return len(self.tables) - 1
+
+    def _column(self, kind: str, values: List[Any]) -> List[bytes]:
+        if kind in ("str", "url"):
+            return [_pack(self.string_indices(values))]
+        if kind == "strlist":
+            flat = self.string_indices(v for items in values for v in items)
+            return [_pack(array("I", [len(items) for items in values])), _pack(flat)]
+        if kind == "datetime":
+            micros = array("q")
+            offsets = array("i")
+            # Zeitstempel wiederholen sich häufig (z.B. minutengenau bei NewsAPI)
+            cache: Dict[datetime, int] = {}
+            for v in values:
+                if v is None:
+                    micros.append(_NULL_INT)
+                    offsets.append(0)
+                    continue
+                if v.tzinfo is None:
+                    v = v.replace(tzinfo=timezone.utc)
+                us = cache.get(v)
+                if us is None:
+                    delta = v - _EPOCH
+                    us = cache[v] = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+                micros.append(us)
+                offsets.append(int(v.utcoffset().total_seconds()))
+            return [_pack(micros), _pack(offsets)]
+        if kind == "float":
+            return [_pack(array("d", [float("nan") if v is None else v for v in values]))]
+        if kind == "int":
+            return [_pack(array("q", [_NULL_INT if v is None else v for v in values]))]
+        if kind == "bool":
+            return [_pack(array("b", [-1 if v is None else int(v) for v in values]))]
+        return [json.dumps(values, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")]
+
+    def encode(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            self._check(type(value))
+            return {"__table__": self.table([value]), "single": True}
+        if isinstance(value, (list, tuple)):
+            if value and all(type(item) is type(value[0]) for item in value) and isinstance(value[0], BaseModel):
+                self._check(type(value[0]))
+                return {"__table__": self.table(value)}
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            return {"__dict__": {str(key): self.encode(item) for key, item in value.items()}}
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise TypeError(f"Werte vom Typ {type(value).__name__} können nicht in einem Snapshot gespeichert werden.")
+
+    @staticmethod
+    def _check(model: Type[BaseModel]) -> None:
+        if model not in _KINDS:
+            raise TypeError(f"Modell {model.__name__} wird von Snapshots nicht unterstützt.")
+
+
+def dumps(value: Any, compress_level: int = 1) -> bytes:
+    """
+    Serialises models, lists of models and dicts/lists of those (plus JSON
+    scalars) into a snapshot.
+    """
+    writer = _Writer()
+    tree = writer.encode(value)
+    text = "".join(writer.strings)
+    string_lengths = _pack(array("I", [len(s) for s in writer.strings]))
+    string_blob = text.encode("utf-8")
+    sections = [string_lengths, string_blob] + writer.sections
+    header = json.dumps(
+        {"tree": tree, "tables": writer.tables, "sections": [len(s) for s in sections]},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    body = b"".join([_LENGTH.pack(len(header)), header] + sections)
+    return MAGIC + bytes([VERSION]) + zlib.compress(body, compress_level)
+
+
+def _construct(model: Type[BaseModel], values: Dict[str, Any], defaults: Dict[str, Any]) -> BaseModel:
+    """
+    Same result as ``model.model_construct(**values)`` for the plain models
+    of this project (no private attributes, no extras), without its
+    per-call bookkeeping.
+    """
+    instance = model.__new__(model)
+    fields_set = set(values)
+    if defaults:
+        values.update((name, copy(default)) for name, default in defaults.items())
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+class _Reader:
+    def __init__(self, data: bytes, trusted: bool):
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Keine Snapshot-Datei (ungültige Signatur).")
+        if data[len(MAGIC)] != VERSION:
+            raise ValueError(f"Nicht unterstützte Snapshot-Version {data[len(MAGIC)]}.")
+        try:
+            body = zlib.decompress(data[len(MAGIC) + 1:])
+        except zlib.error as e:
+            raise ValueError(f"Snapshot ist beschädigt: {e}") from e
+        (header_length,) = _LENGTH.unpack_from(body)
+        offset = _LENGTH.size + header_length
+        self.header = json.loads(body[_LENGTH.size:offset])
+        self.trusted = trusted
+        self._sections: List[bytes] = []
+        for length in self.header["sections"]:
+            self._sections.append(body[offset:offset + length])
+            offset += length
+        self._next = 0
+        lengths = _unpack("I", self._section())
+        text = self._section().decode("utf-8")
+        self.strings: List[Any] = [None]
+        position = 0
+        for length in lengths:
+            self.strings.append(text[position:position + length])
+            position += length
+        self.tables = [self._table(table) for table in self.header["tables"]]
+
+    def _section(self) -> bytes:
+        section = self._sections[self._next]
+        self._next += 1
+        return section
+
+    def _table(self, table: Dict[str, Any]) -> List[BaseModel]:
+        model = MODEL_TYPES[table["model"]]
+        current = dict(_KINDS[model])
+        # Hat sich ein Feldtyp seit dem Schreiben geändert, wird doch validiert
+        trusted = self.trusted and all(current.get(name, kind) == kind for name, kind in table["columns"])
+        names = []
+        columns = []
+        for name, kind in table["columns"]:
+            values = self._column(kind, trusted)
+            if name in current:
+                names.append(name)
+                columns.append(values)
+        if not trusted:
+            return [model.model_validate(dict(zip(names, row))) for row in zip(*columns)]
+        # Felder, die das Modell inzwischen zusätzlich hat, mit ihren Defaults auffüllen
+        defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if name not in names
+        }
+        return [_construct(model, dict(zip(names, row)), defaults) for row in zip(*columns)]
+
+    def _column(self, kind: str, trusted: bool) -> List[Any]:
+        strings = self.strings
+        if kind == "str":
+            return [strings[i] for i in _unpack("I", self._section())]
+        if kind == "url":
+            values = [strings[i] for i in _unpack("I", self._section())]
+            # Eine Validierung für die ganze Spalte ist deutlich billiger als HttpUrl() pro Wert
+            return _URLS.validate_python(values) if trusted else values
+        if kind == "strlist":
+            lengths = _unpack("I", self._section())
+            flat = [strings[i] for i in _unpack("I", self._section())]
+            values = []
+            position = 0
+            for length in lengths:
+                values.append(flat[position:position + length])
+                position += length
+            return values
+        if kind == "datetime":
+            micros = _unpack("q", self._section())
+            offsets = _unpack("i", self._section())
+            zones: Dict[int, timezone] = {0: timezone.utc}
+            # datetime ist unveränderlich, gleiche Zeitstempel können dasselbe Objekt nutzen
+            cache: Dict[Tuple[int, int], datetime] = {}
+            values = []
+            for key in zip(micros, offsets):
+                value = cache.get(key)
+                if value is None:
+                    us, offset = key
+                    if us == _NULL_INT:
+                        values.append(None)
+                        continue
+                    value = _EPOCH + timedelta(microseconds=us)
+                    if offset:
+                        zone = zones.get(offset) or zones.setdefault(offset, timezone(timedelta(seconds=offset)))
+                        value = value.astimezone(zone)
+                    cache[key] = value
+                values.append(value)
+            return values
+        if kind == "float":
+            return [None if v != v else v for v in _unpack("d", self._section())]
+        if kind == "int":
+            return [None if v == _NULL_INT else v for v in _unpack("q", self._section())]
+        if kind == "bool":
+            return [None if v < 0 else bool(v) for v in _unpack("b", self._section())]
+        return json.loads(self._section())
+
+    def decode(self, node: Any) -> Any:
+        if isinstance(node, list):
+            return [self.decode(item) for item in node]
+        if isinstance(node, dict):
+            if "__table__" in node:
+                rows = self.tables[node["__table__"]]
+                return rows[0] if node.get("single") else rows
+            if "__dict__" in node:
+                return {key: self.decode(item) for key, item in node["__dict__"].items()}
+        return node
+
+
+def loads(data: bytes, trusted: bool = False) -> Any:
+    """
+    Reads a snapshot written by :func:`dumps`.
+
+    Args:
+        data: The snapshot bytes.
+        trusted: Skip model validation (``model_construct``). Only for
+            snapshots written by this application.
+
+    Raises:
+        ValueError: If the data is not a (supported) snapshot or a model fails validation.
+    """
+    try:
+        reader = _Reader(data, trusted)
+    except (struct.error, IndexError, KeyError) as e:
+        raise ValueError(f"Snapshot ist beschädigt: {e}") from e
+    return reader.decode(reader.header["tree"])
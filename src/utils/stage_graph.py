@@ -0,0 +1,184 @@
+"""Small dependency-aware executor for the stages of the newsletter pipeline."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from src.utils.profiler import profile_section
+
+logger = logging.getLogger(__name__)
+
+
+class StageExecutionError(RuntimeError):
+    """Raised when a stage of a :class:`StageGraph` fails."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Stage '{stage}' fehlgeschlagen: {error}")
+        self.stage = stage
+        self.error = error
+
+
+class Stage:
+    """A single node of a :class:`StageGraph`."""
+
+    def __init__(self, name: str, func: Callable[..., Any], depends_on: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+
+    def __repr__(self) -> str:
+        return f"<Stage(name='{self.name}', depends_on={self.depends_on})>"
+
+
+class StageGraph:
+    """
+    Runs stages as soon as all of their dependencies are done.
+
+    Each stage function receives the results of its dependencies as keyword
+    arguments named after the dependency, e.g. a stage ``categorize`` that
+    depends on ``summarize`` is called as ``func(summarize=<result>)``.
+    Independent branches run concurrently in a thread pool. Results and
+    wall-clock timings of every stage are kept on the graph, so a single
+    stage can be re-run later with the same inputs via :meth:`rerun`.
+
+    ``on_result(name, result)`` is called after every successful stage
+    execution, e.g. to persist checkpoints. Errors raised by the callback
+    are logged and do not fail the stage.
+    """
+
+    def __init__(self, max_workers: int = 4, on_result: Optional[Callable[[str, Any], None]] = None):
+        self.max_workers = max(1, max_workers)
+        self.on_result = on_result
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add_stage(self, name: str, func: Callable[..., Any], depends_on: Iterable[str] = ()) -> "StageGraph":
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' ist bereits definiert.")
+        deps = list(depends_on)
+        for dep in deps:
+            if dep not in self.stages:
+                raise ValueError(f"Stage '{name}' hängt von unbekannter Stage '{dep}' ab.")
+        self.stages[name] = Stage(name, func, deps)
+        return self
+
+    def dependents(self, name: str) -> List[str]:
+        """Returns all stages that (transitively) depend on ``name`` in definition order."""
+        affected: Set[str] = {name}
+        ordered: List[str] = []
+        for stage in self.stages.values():
+            if any(dep in affected for dep in stage.depends_on):
+                affected.add(stage.name)
+                ordered.append(stage.name)
+        return ordered
+
+    def run(self, preloaded: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Executes the graph.
+
+        Args:
+            preloaded: Optional results for stages that must not be executed
+                again. Stages that are only needed to produce preloaded
+                results are skipped as well.
+
+        Returns:
+            The results of all executed or preloaded stages.
+
+        Raises:
+            StageExecutionError: If a stage raises. Stages that are already
+                running are allowed to finish, no new stages are started.
+        """
+        self.results = dict(preloaded or {})
+        self.timings = {}
+        needed = self._needed_stages(set(self.results))
+        remaining = {name: set(self.stages[name].depends_on) for name in needed}
+        failure: Optional[StageExecutionError] = None
+        start = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            running: Dict[Future, str] = {}
+            while remaining or running:
+                if failure is None:
+                    ready = [
+                        name for name, deps in remaining.items()
+                        if all(dep in self.results for dep in deps)
+                    ]
+                    for name in ready:
+                        del remaining[name]
+                        running[executor.submit(self._execute, name)] = name
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as exc:
+                        logger.error("Stage '%s' fehlgeschlagen: %s", name, exc)
+                        if failure is None:
+                            failure = StageExecutionError(name, exc)
+
+        logger.info(
+            "Stage-Graph in %.2fs ausgeführt. Laufzeiten: %s",
+            time.monotonic() - start,
+            ", ".join(f"{name}={secs:.2f}s" for name, secs in self.timings.items()),
+        )
+        if failure is not None:
+            raise failure from failure.error
+        return self.results
+
+    def rerun(self, name: str, downstream: bool = False) -> Any:
+        """
+        Executes a single stage again with the stored results of its dependencies.
+
+        Args:
+            name: The stage to re-run.
+            downstream: If True, all stages depending on ``name`` are re-run too.
+
+        Returns:
+            The new result of ``name``.
+        """
+        if name not in self.stages:
+            raise KeyError(f"Unbekannte Stage '{name}'.")
+        missing = [dep for dep in self.stages[name].depends_on if dep not in self.results]
+        if missing:
+            raise RuntimeError(f"Stage '{name}' kann nicht erneut ausgeführt werden, es fehlen Ergebnisse von {missing}.")
+        self.results[name] = self._execute(name)
+        if downstream:
+            for dependent in self.dependents(name):
+                self.results[dependent] = self._execute(dependent)
+        return self.results[name]
+
+    def _execute(self, name: str) -> Any:
+        stage = self.stages[name]
+        kwargs = {dep: self.results[dep] for dep in stage.depends_on}
+        logger.debug("Starte Stage '%s'.", name)
+        stage_start = time.monotonic()
+        try:
+            with profile_section(name, "stage") as span:
+                result = stage.func(**kwargs)
+                if span is not None and isinstance(result, list):
+                    span.items = len(result)
+        finally:
+            self.timings[name] = time.monotonic() - stage_start
+            logger.info("Stage '%s' nach %.2fs beendet.", name, self.timings[name])
+        if self.on_result is not None:
+            try:
+                self.on_result(name, result)
+            except Exception as exc:
+                logger.warning("Ergebnis-Callback für Stage '%s' fehlgeschlagen: %s", name, exc)
+        return result
+
+    def _needed_stages(self, available: Set[str]) -> List[str]:
+        """Stages that have to run so that every final stage has a result, in definition order."""
+        needed: Set[str] = set()
+        # Die Definitionsreihenfolge ist topologisch; rückwärts von den End-Stages aus prüfen.
+        for name in reversed(list(self.stages)):
+            if name in available:
+                continue
+            dependents = [s.name for s in self.stages.values() if name in s.depends_on]
+            if not dependents or any(dep in needed for dep in dependents):
+                needed.add(name)
+        return [name for name in self.stages if name in needed]
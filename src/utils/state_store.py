@@ -0,0 +1,153 @@
+"""Persisted fetch state for incremental ("since last run") pipeline runs."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.data_models import ProcessedArticle
+from src.utils.article_dedup import canonicalize_url
+from src.utils.config_loader import get_cache_dir, get_env_float
+
+logger = logging.getLogger(__name__)
+
+
+def article_key(url: Optional[Any], title: Optional[str] = None) -> str:
+    """Stable identity of an article: hash of its canonical URL (or title if there is no URL)."""
+    identity = canonicalize_url(str(url)) if url else f"title:{(title or '').strip().lower()}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class FetchStateStore:
+    """
+    SQLite store for watermarks and already processed articles.
+
+    Per fetcher configuration it keeps the newest ``published_at`` seen so far
+    and the keys of all emitted articles, so the next run only asks for newer
+    items. Processed articles are stored as JSON, so incremental runs can
+    merge fresh results with those of earlier runs. Entries older than
+    ``retention_seconds`` are pruned.
+    """
+
+    def __init__(self, path: str, retention_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                " fetcher_key TEXT PRIMARY KEY, newest_published_at REAL, updated_at REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS seen_articles ("
+                " fetcher_key TEXT NOT NULL, article_key TEXT NOT NULL, seen_at REAL NOT NULL,"
+                " PRIMARY KEY (fetcher_key, article_key));"
+                "CREATE TABLE IF NOT EXISTS processed_articles ("
+                " article_key TEXT PRIMARY KEY, payload TEXT NOT NULL, published_at REAL, stored_at REAL NOT NULL);"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_watermark(self, fetcher_key: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT newest_published_at FROM watermarks WHERE fetcher_key = ?", (fetcher_key,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromtimestamp(row[0], tz=timezone.utc)
+
+    def seen_keys(self, fetcher_key: str) -> Set[str]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT article_key FROM seen_articles WHERE fetcher_key = ?", (fetcher_key,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def record_fetch(self, fetcher_key: str, newest_published_at: Optional[datetime], keys: Iterable[str]) -> None:
+        """Advances the watermark (never backwards) and marks ``keys`` as seen."""
+        now = time.time()
+        newest = newest_published_at.timestamp() if newest_published_at else None
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO watermarks (fetcher_key, newest_published_at, updated_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(fetcher_key) DO UPDATE SET"
+                " newest_published_at = MAX(COALESCE(newest_published_at, excluded.newest_published_at),"
+                " COALESCE(excluded.newest_published_at, newest_published_at)),"
+                " updated_at = excluded.updated_at",
+                (fetcher_key, newest, now),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen_articles (fetcher_key, article_key, seen_at) VALUES (?, ?, ?)",
+                [(fetcher_key, key, now) for key in keys],
+            )
+            conn.execute("DELETE FROM seen_articles WHERE seen_at < ?", (now - self.retention_seconds,))
+            conn.commit()
+
+    def save_processed(self, articles: Iterable[ProcessedArticle]) -> None:
+        now = time.time()
+        rows: List[Tuple[str, str, Optional[float], float]] = [
+            (
+                article_key(article.url, article.title),
+                article.model_dump_json(),
+                article.published_at.timestamp() if article.published_at else None,
+                now,
+            )
+            for article in articles
+        ]
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO processed_articles (article_key, payload, published_at, stored_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("DELETE FROM processed_articles WHERE stored_at < ?", (now - self.retention_seconds,))
+            conn.commit()
+
+    def load_processed(self, since: datetime, exclude: Optional[Set[str]] = None) -> List[ProcessedArticle]:
+        """Processed articles published (or, without date, stored) after ``since``, newest first."""
+        threshold = since.timestamp()
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT article_key, payload FROM processed_articles"
+                " WHERE COALESCE(published_at, stored_at) >= ? ORDER BY COALESCE(published_at, stored_at) DESC",
+                (threshold,),
+            ).fetchall()
+        articles: List[ProcessedArticle] = []
+        for key, payload in rows:
+            if exclude and key in exclude:
+                continue
+            try:
+                articles.append(ProcessedArticle.model_validate_json(payload))
+            except ValueError as e:
+                logger.warning(f"Gespeicherter Artikel {key} konnte nicht gelesen werden: {e}")
+        return articles
+
+    def __repr__(self) -> str:
+        return f"<FetchStateStore(path='{self.path}')>"
+
+
+_shared_stores: Dict[Tuple[Any, ...], FetchStateStore] = {}
+_shared_lock = threading.Lock()
+
+
+def get_state_store() -> FetchStateStore:
+    """Process-wide store under NEWSLETTER_CACHE_DIR (retention via NEWS_STATE_RETENTION_DAYS)."""
+    settings = (
+        os.path.join(get_cache_dir(), "fetch_state.sqlite"),
+        get_env_float("NEWS_STATE_RETENTION_DAYS", 7.0) * 24 * 3600,
+    )
+    with _shared_lock:
+        if settings not in _shared_stores:
+            _shared_stores[settings] = FetchStateStore(*settings)
+        return _shared_stores[settings]
@@ -0,0 +1,27 @@
+"""Small text normalisation helpers shared by the deduplication and filter stages."""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercases, applies NFKC normalisation and collapses punctuation and whitespace."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(_TOKEN_RE.findall(text))
+
+
+def tokenize(text: Optional[str], min_length: int = 1) -> List[str]:
+    """Splits a text into normalised word tokens."""
+    return [tok for tok in normalize_text(text).split() if len(tok) >= min_length]
+
+
+def shingles(tokens: List[str], size: int = 3) -> List[str]:
+    """Word n-grams of ``size`` tokens; short texts fall back to the single tokens."""
+    if len(tokens) < size:
+        return list(tokens)
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
@@ -0,0 +1,200 @@
+"""Central ledger for LLM token usage, latency and cost of a pipeline run."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.profiler import record_llm_usage
+
+logger = logging.getLogger(__name__)
+
+
+def parse_prices(raw: Optional[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Parses ``"model:input:output,..."`` (USD per million tokens), e.g.
+    ``"gpt-4o-mini:0.15:0.6"``. Invalid entries are ignored with a warning.
+    """
+    prices: Dict[str, Tuple[float, float]] = {}
+    for entry in (raw or "").split(","):
+        if not entry.strip():
+            continue
+        try:
+            model, prompt_price, completion_price = (part.strip() for part in entry.rsplit(":", 2))
+            prices[model] = (float(prompt_price), float(completion_price))
+        except ValueError:
+            logger.warning(f"Ungültiger Preis-Eintrag '{entry}' ignoriert (erwartet 'modell:input:output').")
+    return prices
+
+
+class UsageRecord:
+    """A single LLM call."""
+
+    def __init__(
+        self,
+        agent: str,
+        model: Optional[str],
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_seconds: Optional[float] = None,
+    ):
+        self.agent = agent
+        self.model = model or "unbekannt"
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.latency_seconds = latency_seconds
+        self.timestamp = time.time()
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class UsageLedger:
+    """
+    Collects the usage of every LLM call of a run and aggregates it per
+    agent and per model.
+
+    With ``token_budget`` the ledger also answers whether further optional
+    work still fits (:meth:`can_afford`); callers use that to cut off
+    low-priority calls before the budget runs out. Calls that are already
+    running are never interrupted, so the budget can be exceeded slightly.
+
+    Args:
+        token_budget: Maximum prompt+completion tokens per run (None = unlimited).
+        prices: USD per million prompt/completion tokens per model (see :func:`parse_prices`).
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, prices: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.token_budget = token_budget or None
+        self.prices = prices or {}
+        self.records: List[UsageRecord] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        agent: str,
+        model: Optional[str],
+        prompt_tokens: Optional[int],
+        completion_tokens: Optional[int],
+        latency_seconds: Optional[float] = None,
+    ) -> UsageRecord:
+        entry = UsageRecord(agent, model, int(prompt_tokens or 0), int(completion_tokens or 0), latency_seconds)
+        with self._lock:
+            self.records.append(entry)
+        return entry
+
+    @property
+    def total_tokens(self) -> int:
+        with self._lock:
+            return sum(r.total_tokens for r in self.records)
+
+    def remaining_tokens(self) -> Optional[int]:
+        """Tokens left in the budget (None without budget, never negative)."""
+        if self.token_budget is None:
+            return None
+        return max(0, self.token_budget - self.total_tokens)
+
+    def can_afford(self, estimated_tokens: int) -> bool:
+        remaining = self.remaining_tokens()
+        return remaining is None or estimated_tokens <= remaining
+
+    def average_tokens_per_call(self, agent: str) -> Optional[float]:
+        """Average tokens of the calls of ``agent`` in this run (None if there were none)."""
+        with self._lock:
+            calls = [r.total_tokens for r in self.records if r.agent == agent]
+        return sum(calls) / len(calls) if calls else None
+
+    def cost(self, record: UsageRecord) -> Optional[float]:
+        price = self.prices.get(record.model)
+        if price is None:
+            return None
+        return (record.prompt_tokens * price[0] + record.completion_tokens * price[1]) / 1_000_000
+
+    def _aggregate(self, attribute: str) -> Dict[str, Dict[str, Any]]:
+        groups: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            group = groups.setdefault(
+                getattr(record, attribute),
+                {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency_seconds": 0.0, "cost_usd": None},
+            )
+            group["calls"] += 1
+            group["prompt_tokens"] += record.prompt_tokens
+            group["completion_tokens"] += record.completion_tokens
+            group["latency_seconds"] += record.latency_seconds or 0.0
+            cost = self.cost(record)
+            if cost is not None:
+                group["cost_usd"] = (group["cost_usd"] or 0.0) + cost
+        return groups
+
+    def by_agent(self) -> Dict[str, Dict[str, Any]]:
+        return self._aggregate("agent")
+
+    def by_model(self) -> Dict[str, Dict[str, Any]]:
+        return self._aggregate("model")
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-run totals plus the aggregation per agent and per model (JSON-serialisable)."""
+        by_model = self.by_model()
+        costs = [group["cost_usd"] for group in by_model.values() if group["cost_usd"] is not None]
+        with self._lock:
+            calls = len(self.records)
+        return {
+            "calls": calls,
+            "total_tokens": self.total_tokens,
+            "token_budget": self.token_budget,
+            "cost_usd": sum(costs) if costs else None,
+            "by_agent": self.by_agent(),
+            "by_model": by_model,
+        }
+
+    @contextmanager
+    def activate(self) -> Iterator["UsageLedger"]:
+        """Makes this ledger the target of :func:`record_llm_call` for the duration of a run."""
+        global _active_ledger
+        previous = _active_ledger
+        _active_ledger = self
+        try:
+            yield self
+        finally:
+            _active_ledger = previous
+
+    def __repr__(self) -> str:
+        return f"<UsageLedger(calls={len(self.records)}, budget={self.token_budget})>"
+
+
+_active_ledger: Optional[UsageLedger] = None
+
+
+def get_active_ledger() -> Optional[UsageLedger]:
+    return _active_ledger
+
+
+def record_llm_call(
+    agent: str,
+    model: Optional[str],
+    prompt_tokens: Optional[int],
+    completion_tokens: Optional[int],
+    latency_seconds: Optional[float] = None,
+) -> None:
+    """Books one LLM call in the active ledger and the active run profile."""
+    ledger = _active_ledger
+    if ledger is not None:
+        ledger.record(agent, model, prompt_tokens, completion_tokens, latency_seconds)
+    record_llm_usage(prompt_tokens, completion_tokens)
+
+
+def record_openai_usage(agent: str, model: Optional[str], usage: Any, latency_seconds: Optional[float] = None) -> None:
+    """Books the ``usage`` object of an OpenAI response (Responses or Chat Completions API)."""
+    if usage is None:
+        return
+    prompt = getattr(usage, "input_tokens", None)
+    if prompt is None:
+        prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "output_tokens", None)
+    if completion is None:
+        completion = getattr(usage, "completion_tokens", None)
+    record_llm_call(agent, model, prompt, completion, latency_seconds)
@@ -1,5 +1,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure project root is on sys.path so tests can import the src package
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Persistent caches of a test run live in a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("NEWSLETTER_CACHE_DIR", str(cache_dir))
+    return cache_dir
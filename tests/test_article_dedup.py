@@ -0,0 +1,53 @@
+import time
+
+from src.models.data_models import RawArticle
+from src.utils.article_dedup import canonicalize_url, deduplicate_articles
+
+
+def test_canonicalize_url_strips_tracking_and_variants():
+    a = canonicalize_url("http://www.example.com/news/story/?utm_source=x&id=5#top")
+    b = canonicalize_url("https://m.example.com/news/story?id=5&fbclid=abc")
+    assert a == b == "https://example.com/news/story?id=5"
+    assert canonicalize_url(None) is None
+
+
+def test_near_duplicates_are_clustered_and_sources_attached():
+    description = (
+        "Die Stadt Zürich hat am Montag ein neues Förderprogramm für erneuerbare Energien "
+        "vorgestellt, das bis 2030 rund 200 Millionen Franken umfassen soll."
+    )
+    articles = [
+        RawArticle(title="Zürich startet Förderprogramm für Solarenergie", description=description,
+                   url="https://a.example/solar?utm_source=feed", source_name="Quelle A"),
+        RawArticle(title="Zürich startet Förderprogramm für Solarenergie", description=description + " Mehr dazu.",
+                   url="https://b.example/zh-solar", source_name="Quelle B", content_snippet="Ausführlicher Text"),
+        RawArticle(title="Anderes Thema", description="Ein völlig anderer Bericht über Fussball in Basel.",
+                   url="https://a.example/fussball", source_name="Quelle A"),
+        RawArticle(title="Kopie", description="Kopie mit gleicher URL", url="https://www.a.example/fussball/", source_name="Quelle C"),
+    ]
+
+    result = deduplicate_articles(articles)
+
+    assert len(result) == 2
+    solar, football = result
+    # Der reichhaltigere Artikel wird Repräsentant, die anderen Quellen werden angehängt
+    assert solar.source_name == "Quelle B"
+    assert solar.related_sources == ["Quelle A"]
+    assert solar.related_urls == ["https://a.example/solar?utm_source=feed"]
+    assert football.related_sources == ["Quelle C"]
+
+
+def test_dedup_is_fast_for_thousands_of_articles():
+    articles = [
+        RawArticle(
+            title=f"Meldung Nummer {i} über Thema {i % 97}",
+            description=f"Bericht {i} mit individuellem Inhalt zu Ereignis {i * 7919} in Region {i % 13}.",
+            url=f"https://news.example/{i}",
+            source_name=f"Quelle {i % 3}",
+        )
+        for i in range(3000)
+    ]
+    start = time.perf_counter()
+    result = deduplicate_articles(articles + articles[:500])
+    assert time.perf_counter() - start < 3.0
+    assert len(result) == 3000
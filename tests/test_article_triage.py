@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models.data_models import ProcessedArticle, RawArticle
+from src.orchestrator import NewsletterOrchestrator
+from src.utils.article_triage import ArticleTriage, parse_source_weights
+from src.utils.state_store import article_key
+
+NOW = datetime(2025, 6, 4, 12, 0, tzinfo=timezone.utc)
+CATEGORIES = ["IT & AI", "Welt und Politik", "Wirtschaft"]
+
+
+def make_article(title, hours_old=1, source="Blog", description=None, related=()):
+    return RawArticle(
+        title=title,
+        description=description,
+        published_at=NOW - timedelta(hours=hours_old),
+        source_name=source,
+        related_sources=list(related),
+    )
+
+
+def test_triage_ranks_by_relevance_recency_and_source():
+    articles = [
+        make_article("Rezept für Apfelkuchen", description="Backen mit Zucker"),
+        make_article("Weltpolitik am Gipfel in Genf", description="Politik und Diplomatie", source="NZZ"),
+        make_article("Wirtschaft wächst kräftig", hours_old=2, related=["SRF", "FT"]),
+        make_article("Wirtschaft: alte Meldung", hours_old=96),
+        make_article("Gartentipps für den Sommer", source="NZZ"),
+    ]
+    triage = ArticleTriage(2, CATEGORIES, source_weights=parse_source_weights(["nzz=1.5", "kaputt"]))
+
+    result = triage.apply(articles, now=NOW)
+
+    # Reihenfolge der behaltenen Artikel bleibt erhalten
+    assert [a.title for a in result.kept] == ["Weltpolitik am Gipfel in Genf", "Wirtschaft wächst kräftig"]
+    assert result.avoided_summaries == 3
+    assert result.stats == {"total": 5, "kept": 2, "avoided_summarizer_calls": 3}
+    # Gleicher Inhalt, aber vier Tage alt
+    assert result.scores[3] < result.scores[2]
+
+
+def test_keywords_extend_the_categories():
+    articles = [make_article("Neue KI-Chips vorgestellt"), make_article("Stau am Gotthard")]
+    assert ArticleTriage(1, CATEGORIES, keywords=["KI"]).apply(articles, now=NOW).kept[0].title.startswith("Neue KI")
+
+
+class DummySummarizer:
+    def __init__(self, failing=()):
+        self.received = []
+        self.failing = set(failing)
+
+    def process_batch(self, articles):
+        self.received = articles
+        return [
+            ProcessedArticle(
+                title=a.title, url=a.url, summary="s",
+                llm_processing_details={"summary_failed": True} if a.title in self.failing else {},
+            )
+            for a in articles
+        ]
+
+
+class RecordingStore:
+    def save_processed(self, articles):
+        self.saved = list(articles)
+
+
+class RecordingFetcher:
+    def commit_state(self, failed_keys=None):
+        self.failed = set(failed_keys)
+
+
+def test_orchestrator_summarizes_only_triaged_articles(monkeypatch):
+    monkeypatch.setenv("NEWS_TRIAGE_TOP_K", "2")
+    monkeypatch.setenv("NEWS_PREFETCH_SUMMARIES", "true")
+    monkeypatch.setenv("PIPELINE_CHECKPOINT_DIR", "")
+    orch = NewsletterOrchestrator()
+    assert orch.article_triage is not None and not orch.prefetch_summaries
+
+    orch.summarizer = DummySummarizer()
+    articles = [make_article(f"Meldung {i}", hours_old=i) for i in range(5)]
+    summarized = orch._summarize_articles(orch._triage_articles(articles))
+
+    assert len(orch.summarizer.received) == len(summarized) == 2
+    assert orch.triage_stats["avoided_summarizer_calls"] == 3
+
+
+def test_only_failed_summaries_are_fetched_again(monkeypatch):
+    monkeypatch.setenv("NEWS_TRIAGE_TOP_K", "2")
+    monkeypatch.setenv("PIPELINE_CHECKPOINT_DIR", "")
+    orch = NewsletterOrchestrator()
+    orch.summarizer = DummySummarizer(failing={"Meldung 1"})
+    orch.state_store = RecordingStore()
+    fetcher = RecordingFetcher()
+    orch.news_api_fetchers = [fetcher]
+    articles = [
+        make_article(f"Meldung {i}", hours_old=i).model_copy(update={"url": f"https://news.example/{i}"})
+        for i in range(5)
+    ]
+
+    orch._record_article_history(orch._summarize_articles(orch._triage_articles(articles)))
+
+    # Von der Triage verworfene Artikel gelten als gesehen, nur die fehlgeschlagene Zusammenfassung nicht
+    assert [a.title for a in orch.summarizer.received] == ["Meldung 0", "Meldung 1"]
+    assert fetcher.failed == {article_key("https://news.example/1")}
+    assert [a.title for a in orch.state_store.saved] == ["Meldung 0"]
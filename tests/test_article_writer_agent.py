@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.agents.llm_processors.article_writer_agent import ArticleWriterAgent
+from src.models.data_models import ProcessedArticle
+
+
+class DummySyncClient:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class DummyStream:
+    def __init__(self, title):
+        self.events = [
+            SimpleNamespace(type="response.created"),
+            SimpleNamespace(type="response.output_text.delta", delta="Text "),
+            SimpleNamespace(type="response.output_text.delta", delta=title),
+        ]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self.events:
+            await asyncio.sleep(0)
+            yield event
+
+
+class DummyAsyncClient:
+    active = 0
+    max_active = 0
+
+    def __init__(self, *args, **kwargs):
+        self.responses = SimpleNamespace(create=self._create)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _create(self, model=None, tools=None, input=None, temperature=None, stream=False):
+        DummyAsyncClient.active += 1
+        DummyAsyncClient.max_active = max(DummyAsyncClient.max_active, DummyAsyncClient.active)
+        try:
+            title = input.split("Titel: ")[1].split("\n")[0]
+            # Der erste Artikel braucht am längsten
+            await asyncio.sleep(0.1 if title == "A0" else 0.01)
+            if stream:
+                return DummyStream(title)
+            return SimpleNamespace(output_text=f"Text {title}")
+        finally:
+            DummyAsyncClient.active -= 1
+
+
+def _make_agent(monkeypatch, **kwargs):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    monkeypatch.setattr("src.agents.llm_processors.article_writer_agent.OpenAI", DummySyncClient)
+    monkeypatch.setattr("src.agents.llm_processors.article_writer_agent.AsyncOpenAI", DummyAsyncClient)
+    DummyAsyncClient.max_active = 0
+    return ArticleWriterAgent(**kwargs)
+
+
+def test_concurrent_streaming_batch_reports_finished_articles_early(monkeypatch, caplog):
+    caplog.set_level("INFO", logger="src.agents.llm_processors.article_writer_agent")
+    agent = _make_agent(monkeypatch, max_concurrency=2, stream=True)
+    articles = [ProcessedArticle(title=f"A{i}", summary="s") for i in range(3)]
+    finished = []
+
+    texts = agent.process_batch(articles, on_article_done=lambda i, art, text: finished.append(art.title))
+
+    assert texts == ["Text A0", "Text A1", "Text A2"]
+    assert finished[0] != "A0"
+    assert DummyAsyncClient.max_active == 2
+    assert agent.last_batch_timings["time_to_first_token"] <= agent.last_batch_timings["time_to_first_article"]
+    assert "erstes Token nach" in caplog.text
+
+
+def test_cached_articles_skip_the_request(monkeypatch):
+    agent = _make_agent(monkeypatch, max_concurrency=2)
+    articles = [ProcessedArticle(title=f"A{i}", summary="s") for i in range(2)]
+    agent.process_batch(articles)
+
+    calls = []
+    monkeypatch.setattr(DummyAsyncClient, "_create", lambda self, **kw: calls.append(kw))
+    assert agent.process_batch(articles) == ["Text A0", "Text A1"]
+    assert calls == []
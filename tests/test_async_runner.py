@@ -0,0 +1,29 @@
+import asyncio
+import contextvars
+
+import pytest
+
+from src.utils.async_runner import run_coroutine
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+async def current_loop_and_context():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop(), request_id.get()
+
+
+def test_calls_share_one_loop_and_see_the_callers_context():
+    request_id.set("abc")
+    first_loop, seen = run_coroutine(current_loop_and_context())
+    second_loop, _ = run_coroutine(current_loop_and_context())
+    assert first_loop is second_loop and not first_loop.is_closed()
+    assert seen == "abc"
+
+
+def test_exceptions_are_raised_to_the_caller():
+    async def broken():
+        raise ValueError("kaputt")
+
+    with pytest.raises(ValueError):
+        run_coroutine(broken())
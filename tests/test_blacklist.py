@@ -2,15 +2,32 @@ from src.orchestrator import NewsletterOrchestrator
 from src.models.data_models import RawArticle
 
 
-def test_filter_blacklisted_sources():
-    orch = object.__new__(NewsletterOrchestrator)
-    orch.source_blacklist = ["badsource"]
+class DummyFetcher:
+    source_name = "Dummy"
+
+    def __init__(self, articles):
+        self.articles = articles
+
+    def fetch_data(self):
+        return self.articles
 
+
+def test_filter_blacklisted_sources():
     articles = [
         RawArticle(title="a", source_name="Good", source_id="good"),
         RawArticle(title="b", source_name="BadSource", source_id="badsource"),
         RawArticle(title="c", source_name="Another", source_id="other"),
     ]
-    filtered = orch._filter_blacklisted_sources(articles)
+    orch = object.__new__(NewsletterOrchestrator)
+    orch.source_blacklist = ["badsource"]
+    orch.news_api_fetchers = [DummyFetcher(articles)]
+    orch.dedup_max_distance = -1
+    orch.prefetch_summaries = False
+    orch.summarizer = None
+    orch.state_store = None
+    orch.fetch_max_workers = 1
+    orch.fetch_source_timeout = orch.fetch_global_timeout = 5
+
+    filtered = orch._collect_news_articles()
     assert len(filtered) == 2
     assert all(a.source_id != "badsource" for a in filtered)
@@ -0,0 +1,67 @@
+from src.agents.llm_processors.categorizer_agent import CategorizerAgent
+from src.models.data_models import ProcessedArticle
+
+
+class DummyChain:
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.inputs = []
+
+    def invoke(self, inputs, *args, **kwargs):
+        self.inputs.append(inputs)
+        return self.outputs[len(self.inputs) - 1]
+
+
+def _articles(count):
+    return [
+        ProcessedArticle(title=f"Titel {i}", summary=f"Eine Zusammenfassung des Artikels Nummer {i}.")
+        for i in range(count)
+    ]
+
+
+def test_batch_mode_packs_articles_and_retries_missing(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = CategorizerAgent(categories=["IT & AI", "Wirtschaft"], batch_token_budget=4000)
+    agent.batch_chain = DummyChain([[
+        {"id": 0, "category": "IT & AI", "importance": 8},
+        {"id": 2, "category": "Erfunden", "importance": 3},
+    ]])
+    agent.chain = DummyChain([{"category": "Wirtschaft", "importance": 5}])
+
+    articles = agent.process_batch(_articles(3))
+
+    assert len(agent.batch_chain.inputs) == 1
+    assert "[ID 2]" in agent.batch_chain.inputs[0]["articles_block"]
+    assert [a.category for a in articles] == ["IT & AI", "Wirtschaft", "Unkategorisiert"]
+    assert [a.relevance_score for a in articles] == [8.0, 5.0, 3.0]
+    # Nur der fehlende Artikel wurde einzeln nachkategorisiert
+    assert agent.chain.inputs[0]["title"] == "Titel 1"
+
+
+def test_batches_respect_token_budget(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = CategorizerAgent(categories=["IT & AI"], batch_token_budget=400, max_batch_size=10)
+    batches = agent._build_batches(_articles(12))
+    assert len(batches) > 1
+    assert sorted(i for batch in batches for i in batch) == list(range(12))
+    assert all(len(batch) <= 10 for batch in batches)
+
+
+def test_cached_categories_are_reused_per_article(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = CategorizerAgent(categories=["IT & AI", "Wirtschaft"], batch_token_budget=4000)
+    agent.batch_chain = DummyChain([
+        [{"id": 0, "category": "IT & AI", "importance": 8}, {"id": 1, "category": "Wirtschaft", "importance": 4}],
+        [{"id": 0, "category": "Wirtschaft", "importance": 6}],
+    ])
+    agent.process_batch(_articles(2))
+
+    # Neuer Artikel vor einem bekannten: die IDs verschieben sich, der Cache trifft trotzdem
+    articles = [ProcessedArticle(title="Neu", summary="Eine ganz neue Zusammenfassung.")] + _articles(2)
+    agent.process_batch(articles)
+
+    assert len(agent.batch_chain.inputs) == 2
+    assert "Neu" in agent.batch_chain.inputs[1]["articles_block"]
+    assert "Titel 0" not in agent.batch_chain.inputs[1]["articles_block"]
+    assert [a.category for a in articles] == ["Wirtschaft", "IT & AI", "Wirtschaft"]
+    assert [a.relevance_score for a in articles] == [6.0, 8.0, 4.0]
@@ -0,0 +1,138 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
+from src.models.data_models import Birthday, ProcessedArticle, RawArticle, WeatherInfo
+from src.orchestrator import NewsletterOrchestrator
+from src.utils.checkpoints import CheckpointStore
+from src.utils.state_store import FetchStateStore, article_key
+from src.utils.stage_graph import StageExecutionError
+
+
+def test_round_trip_and_pruning(tmp_path):
+    store = CheckpointStore(str(tmp_path), keep_runs=2, retention_seconds=None)
+    raw = [RawArticle(title="A", url="https://example.com/a", published_at="2025-01-01T10:00:00Z", related_sources=["X"])]
+    extras = {
+        "birthdays": [Birthday(name="Anna", date_month=1, date_day=2, source="Sheet")],
+        "todos": [],
+        "weather": WeatherInfo(location="Zürich", temperature_celsius=3.5, condition="Nebel"),
+        "quote": None,
+    }
+    store.save("run-1", "news_fetch", raw)
+    store.save("run-1", "extras_fetch", extras)
+
+    loaded = store.load("run-1")
+    assert loaded["news_fetch"] == raw
+    assert loaded["extras_fetch"] == extras
+    assert store.load("run-1", ["news_fetch"]).keys() == {"news_fetch"}
+    assert store.load("unbekannt") == {}
+    with pytest.raises(ValueError):
+        store.run_dir(os.path.join("..", "x"))
+
+    for run_id, mtime in (("run-1", 1), ("run-2", 2), ("run-3", 3)):
+        store.save(run_id, "summarize", [])
+        os.utime(tmp_path / run_id, (mtime, mtime))
+    store.prune(keep="run-1")
+    assert sorted(store.runs()) == ["run-1", "run-3"]
+    assert store.latest_run_id() == "run-3"
+
+    # Alte Läufe verfallen auch unterhalb von keep_runs
+    store.keep_runs, store.retention_seconds = 5, 3600
+    store.save("run-4", "summarize", [])
+    store.prune()
+    assert store.runs() == ["run-4"]
+
+
+def test_resume_skips_completed_stages(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_PROFILE_DIR", "")
+    calls = []
+
+    def stage(name, result):
+        def run(*args):
+            calls.append(name)
+            return result
+        return run
+
+    orch = object.__new__(NewsletterOrchestrator)
+    orch.pipeline_max_workers = 1
+    orch.checkpoint_store = CheckpointStore(str(tmp_path))
+    article = ProcessedArticle(title="T", summary="S", category="IT & AI")
+    orch._collect_news_articles = stage("news_fetch", [RawArticle(title="T")])
+    orch._summarize_articles = stage("summarize", [article])
+    orch._categorize_articles = stage("categorize", [article])
+    orch._merge_article_history = stage("history", [article])
+    orch._fetch_event_sources = stage("events_fetch", [])
+    orch._prefilter_events = stage("event_prefilter", None)
+    orch._filter_events = stage("event_filter", [])
+    orch._fetch_extra_sources = stage("extras_fetch", {"birthdays": []})
+    orch._compose_newsletter = stage("compose", "newsletter.txt")
+
+    def broken_write(articles):
+        raise RuntimeError("Schreiben fehlgeschlagen")
+
+    orch._write_top_articles = broken_write
+    orch._record_article_history = lambda articles: articles
+    with pytest.raises(StageExecutionError):
+        orch.run_pipeline()
+    failed_run = orch.run_id
+    assert "categorize" in orch.checkpoint_store.stages(failed_run)
+    assert "write" not in orch.checkpoint_store.stages(failed_run)
+
+    calls.clear()
+    orch._write_top_articles = stage("write", [article])
+    assert orch.run_pipeline(resume_run_id="latest") == "newsletter.txt"
+    assert orch.run_id == failed_run
+    assert calls == ["history", "write", "compose"]
+    assert "write" in orch.checkpoint_store.stages(failed_run)
+
+    # Wiederholte Stages landen im Profil des Laufs
+    calls.clear()
+    assert orch.rerun_stage("compose") == "newsletter.txt"
+    assert calls == ["compose"]
+    assert [span.name for span in orch.profiler.spans].count("compose") == 2
+
+
+def test_resumed_run_confirms_the_checkpointed_news_fetch(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWSAPI_API_KEY", "dummy")
+    state_store = FetchStateStore(str(tmp_path / "state.sqlite"))
+    published = datetime(2030, 1, 2, 10, 0, tzinfo=timezone.utc)
+    key = article_key("https://news.example/1")
+
+    def make_orchestrator():
+        orch = object.__new__(NewsletterOrchestrator)
+        orch.checkpoint_store = CheckpointStore(str(tmp_path / "checkpoints"))
+        orch.state_store = state_store
+        orch.news_api_fetchers = [NewsAPIFetcher(query="test", state_store=state_store)]
+        return orch
+
+    failed = make_orchestrator()
+    failed.run_id = "run-1"
+    failed.news_api_fetchers[0]._pending[key] = published
+    failed._save_checkpoint("news_fetch", [RawArticle(title="A", url="https://news.example/1")])
+
+    # Der fortgesetzte Lauf ruft nichts neu ab, bestätigt aber die Artikel des gesicherten Abrufs
+    resumed = make_orchestrator()
+    assert "news_fetch" in resumed._load_checkpoints("run-1")
+    resumed._record_article_history([])
+    fetcher = resumed.news_api_fetchers[0]
+    assert state_store.seen_keys(fetcher.state_key) == {key}
+    assert state_store.get_watermark(fetcher.state_key) == published
+
+
+def test_failed_epub_generation_fails_the_compose_stage(monkeypatch):
+    from src.utils import epub_utils
+
+    def broken_epub(*args, **kwargs):
+        raise OSError("Datenträger voll")
+
+    monkeypatch.setenv("NEWSLETTER_OUTPUT_FORMAT", "epub")
+    monkeypatch.setattr(epub_utils, "generate_epub", broken_epub)
+    orch = object.__new__(NewsletterOrchestrator)
+    orch.top_article_count = 3
+    extras = {"birthdays": [], "todos": [], "weather": [], "quote": []}
+
+    # Die Stage schlägt fehl, statt den Fehler zu schlucken, damit --resume sie wiederholen kann
+    with pytest.raises(OSError):
+        orch._compose_newsletter([ProcessedArticle(title="T", summary="S")], [], extras)
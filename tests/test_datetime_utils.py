@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models.data_models import RawArticle, ensure_timezone_aware
+from src.utils.datetime_utils import clear_parse_cache, parse_cache_info, parse_datetime, parse_datetimes
+
+
+def test_parse_common_shapes():
+    utc = datetime(2025, 6, 4, 10, 0, tzinfo=timezone.utc)
+    assert parse_datetime("2025-06-04T10:00:00Z") == utc
+    assert parse_datetime("2025-06-04T10:00:00.250Z") == utc.replace(microsecond=250000)
+    assert parse_datetime("2025-06-04 10:00:00") == utc
+    assert parse_datetime("2025-06-04T12:00:00+0200") == utc
+    assert parse_datetime("2025-06-04T12:00:00+02:00").utcoffset() == timedelta(hours=2)
+    assert parse_datetime("04.06.2025 10:00") == utc
+    assert parse_datetime("Wed, 04 Jun 2025 10:00:00 GMT") == utc
+    assert parse_datetime("4. Juni 2025") is None
+
+
+def test_naive_datetime_becomes_utc():
+    naive = datetime(2025, 6, 4, 10, 0)
+    assert ensure_timezone_aware(naive).tzinfo == timezone.utc
+    assert ensure_timezone_aware(None) is None
+    assert ensure_timezone_aware(42) is None
+
+
+def test_repeated_strings_hit_the_cache():
+    clear_parse_cache()
+    values = ["2025-06-04T10:00:00Z", "2025-06-04T10:00:00Z", None, "kaputt", "kaputt"]
+    parsed = parse_datetimes(values)
+    assert parsed[0] is parsed[1]
+    assert parsed[2] is None and parsed[3] is None and parsed[4] is None
+    assert parse_cache_info().misses == 2
+    RawArticle(title="x", published_at="2025-06-04T10:00:00Z")
+    assert parse_cache_info().hits == 1
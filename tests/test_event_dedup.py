@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models.data_models import Event
+from src.utils.event_dedup import deduplicate_events
+
+START = datetime(2024, 5, 3, 19, 0, tzinfo=timezone.utc)
+
+
+def test_same_event_from_several_sources_is_merged():
+    events = [
+        Event(summary="Zurich AI Meetup", start_time=START, location="Impact Hub", source="Eventbrite"),
+        Event(
+            summary="Zurich AI Meetup: LLMs in Production",
+            start_time=START + timedelta(minutes=30),
+            location="Impact Hub Zürich, Sihlquai 131",
+            description="Talks und Networking rund um LLMs.",
+            url="https://example.com/ai-meetup",
+            source="OpenAI Link Search",
+        ),
+        Event(summary="Zurich AI Meetup", start_time=START, location="Kaufleuten", source="OpenAI Web Search"),
+        Event(summary="Zurich AI Meetup", start_time=START + timedelta(days=7), source="Eventbrite"),
+        Event(summary="Jazz Night", start_time=START, location="Impact Hub", source="Eventbrite"),
+    ]
+
+    merged = deduplicate_events(events)
+
+    assert [e.summary for e in merged] == [
+        "Zurich AI Meetup: LLMs in Production",
+        "Zurich AI Meetup",
+        "Zurich AI Meetup",
+        "Jazz Night",
+    ]
+    first = merged[0]
+    assert first.sources == ["Eventbrite", "OpenAI Link Search"]
+    assert str(first.url) == "https://example.com/ai-meetup"
+    assert merged[1].location == "Kaufleuten"
+    assert merged[2].start_time == START + timedelta(days=7)
+    assert merged[3].sources == []
@@ -18,3 +18,62 @@ def test_event_filter(monkeypatch):
     filtered = agent.process_batch(events)
     assert len(filtered) == 1
     assert filtered[0].summary == "A"
+
+
+class DummyBatchChain:
+    def __init__(self, output):
+        self.output = output
+        self.calls = 0
+
+    def invoke(self, *args, **kwargs):
+        self.calls += 1
+        return self.output
+
+
+def test_batch_scoring_falls_back_and_caches_scores(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = EventFilterAgent(batch_size=10)
+    agent.batch_chain = DummyBatchChain([{"index": 0, "score": 8}, {"index": 1, "score": "n/a"}, {"index": 2, "score": 2}])
+    agent.chain = DummyChain(["9"])
+    events = [Event(summary=name, location="Zürich", source="x") for name in ("A", "B", "C")]
+
+    filtered = agent.process_batch(events)
+    assert [e.summary for e in filtered] == ["A", "B"]
+    assert agent.batch_chain.calls == 1
+    assert agent.chain.calls == 1
+
+    # Dasselbe Event aus einer anderen Quelle, leicht anders geschrieben: Score aus dem Cache
+    again = [Event(summary="a ", location="zürich", source="Eventbrite")]
+    assert agent.process_batch(again) == again
+    assert agent.batch_chain.calls == 1
+    assert agent.chain.calls == 1
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, tokens=0):
+        self.acquired.append(tokens)
+
+
+def test_single_scoring_clamps_and_keeps_full_description(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    limiter = CountingLimiter()
+    agent = EventFilterAgent(rate_limiter=limiter)
+    prompts = []
+
+    class RecordingChain:
+        def invoke(self, inputs):
+            prompts.append(inputs["event_text"])
+            return " 42 "
+
+    agent.chain = RecordingChain()
+    event = Event(summary="Lang", description="x" * (agent.MAX_DESCRIPTION_CHARS + 100), source="x")
+
+    assert agent._score_event(event) == 10.0
+    assert "x" * (agent.MAX_DESCRIPTION_CHARS + 100) in prompts[0]
+    assert len(limiter.acquired) == 1
+    # Der Score liegt nur einmal im Cache, nicht zusätzlich die Rohantwort des Prompts
+    assert agent._cached_score(event) == 10.0
+    assert agent.cache.get(agent._cache_key({"event_text": prompts[0]})) is None
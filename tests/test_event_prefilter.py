@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models.data_models import Event
+from src.utils.event_prefilter import EventPrefilter
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_event(summary, days, source="x", location="Zürich", description=None):
+    return Event(summary=summary, start_time=NOW + timedelta(days=days), location=location, description=description, source=source)
+
+
+def test_prefilter_cascade():
+    events = [
+        make_event("Yesterday", -1),
+        make_event("Next year", 300),
+        make_event("AI Meetup", 2, source="Eventbrite"),
+        make_event("AI  meetup!", 2, source="OpenAI Link Search", location="zürich"),
+        make_event("Poker Night", 3),
+        make_event("Python Workshop", 4),
+        make_event("Concert", 5),
+        Event(summary="Undated", source="x"),
+    ]
+    prefilter = EventPrefilter(max_days_ahead=14, allow_keywords=["python"], deny_keywords=["poker"])
+
+    result = prefilter.apply(events, now=NOW)
+
+    assert [e.summary for e in result.events] == ["AI Meetup", "Python Workshop", "Concert", "Undated"]
+    assert [e.summary for e in result.accepted] == ["Python Workshop"]
+    assert [e.summary for e in result.candidates] == ["AI Meetup", "Concert", "Undated"]
+    assert result.stats == {"total": 8, "past": 1, "too_far_ahead": 1, "duplicates": 1, "denied": 1, "allowed": 1}
+    assert result.skipped == 5
+
+    scored = [result.candidates[2], result.candidates[0]]
+    assert [e.summary for e in result.merge(scored)] == ["AI Meetup", "Python Workshop", "Undated"]
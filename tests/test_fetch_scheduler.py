@@ -0,0 +1,77 @@
+import time
+
+from src.utils.fetch_scheduler import FetchScheduler
+
+
+def _sleepy(value, seconds):
+    def job():
+        time.sleep(seconds)
+        return value
+    return job
+
+
+def test_jobs_run_concurrently():
+    scheduler = FetchScheduler(max_workers=4, source_timeout=5, global_timeout=5)
+    jobs = {f"job{i}": _sleepy([i], 0.2) for i in range(4)}
+    start = time.monotonic()
+    results = scheduler.run(jobs)
+    elapsed = time.monotonic() - start
+    assert results == {"job0": [0], "job1": [1], "job2": [2], "job3": [3]}
+    assert elapsed < 0.6
+
+
+def test_source_timeout_returns_partial_results():
+    scheduler = FetchScheduler(max_workers=2, source_timeout=0.2, global_timeout=5)
+    results = scheduler.run({"fast": _sleepy(["ok"], 0.01), "slow": _sleepy(["late"], 1.0)})
+    assert results["fast"] == ["ok"]
+    assert results["slow"] == []
+    assert scheduler.timed_out == ["slow"]
+
+
+def test_global_timeout_and_failures():
+    def broken():
+        raise RuntimeError("boom")
+
+    scheduler = FetchScheduler(max_workers=3, source_timeout=None, global_timeout=0.2)
+    start = time.monotonic()
+    results = scheduler.run({"broken": broken, "slow": _sleepy(["late"], 1.0), "fast": _sleepy(["ok"], 0.01)})
+    assert time.monotonic() - start < 0.8
+    assert results == {"broken": [], "slow": [], "fast": ["ok"]}
+    assert scheduler.failed == ["broken"]
+    assert scheduler.timed_out == ["slow"]
+
+
+def test_stream_yields_items_before_slow_sources_finish():
+    def pages(prefix, delay, count):
+        def job():
+            for i in range(count):
+                time.sleep(delay)
+                yield f"{prefix}{i}"
+        return job
+
+    scheduler = FetchScheduler(max_workers=2, source_timeout=5, global_timeout=5)
+    start = time.monotonic()
+    arrivals = []
+    for name, item in scheduler.stream({"fast": pages("f", 0.01, 2), "slow": pages("s", 0.3, 2)}):
+        arrivals.append((item, time.monotonic() - start))
+
+    items = [item for item, _ in arrivals]
+    assert sorted(items) == ["f0", "f1", "s0", "s1"]
+    # Die schnellen Artikel stehen bereit, bevor die langsame Quelle ihre erste Seite liefert
+    assert dict(arrivals)["f1"] < 0.3 <= dict(arrivals)["s0"]
+
+
+def test_stream_drops_sources_that_exceed_their_deadline():
+    def pages(delays):
+        def job():
+            for i, delay in enumerate(delays):
+                time.sleep(delay)
+                yield i
+        return job
+
+    scheduler = FetchScheduler(max_workers=2, source_timeout=0.2, global_timeout=5)
+    items = list(scheduler.stream({"fast": pages([0.01]), "slow": pages([0.05, 0.5])}))
+
+    # Die erste Seite der langsamen Quelle bleibt erhalten, die zweite kommt zu spät
+    assert sorted(items) == [("fast", 0), ("slow", 0)]
+    assert scheduler.timed_out == ["slow"]
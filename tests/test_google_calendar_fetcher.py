@@ -1,4 +1,5 @@
 from src.agents.data_fetchers.google_calendar_fetcher import GoogleCalendarFetcher
+from src.utils.google_clients import clear_google_client_cache
 from google.oauth2 import service_account
 from googleapiclient import discovery
 
@@ -35,7 +36,8 @@ def test_calendar_fetcher(monkeypatch, tmp_path):
 
     monkeypatch.setattr(service_account.Credentials, "from_service_account_file", dummy_from_file)
     monkeypatch.setattr(discovery, "build", lambda *a, **k: DummyService())
-    monkeypatch.setattr("src.agents.data_fetchers.google_calendar_fetcher.build", lambda *a, **k: DummyService())
+    monkeypatch.setattr(discovery, "build_from_document", lambda *a, **k: DummyService())
+    clear_google_client_cache()
 
     fetcher = GoogleCalendarFetcher("creds.json")
     events = fetcher.fetch_data()
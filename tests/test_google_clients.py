@@ -0,0 +1,47 @@
+from google.oauth2 import service_account
+from googleapiclient import discovery
+
+from src.utils import google_clients
+from src.utils.google_clients import build_service, clear_google_client_cache, get_discovery_document
+
+
+def test_services_share_credentials_and_cached_documents(monkeypatch):
+    loaded = []
+    built = []
+
+    def dummy_from_file(path, scopes=None):
+        loaded.append((path, tuple(scopes)))
+        return object()
+
+    monkeypatch.setattr(service_account.Credentials, "from_service_account_file", dummy_from_file)
+    monkeypatch.setattr(discovery, "build_from_document", lambda doc, credentials=None: built.append((doc, credentials)))
+    monkeypatch.setattr(discovery, "build", lambda *a, **k: (_ for _ in ()).throw(AssertionError("network build")))
+    clear_google_client_cache()
+
+    calendar = ["https://www.googleapis.com/auth/calendar.readonly"]
+    build_service("calendar", "v3", "creds.json", calendar)
+    build_service("sheets", "v4", "creds.json", ["https://www.googleapis.com/auth/spreadsheets.readonly"])
+    build_service("calendar", "v3", "creds.json", calendar)
+    build_service("drive", "v3", "creds.json", ["https://www.googleapis.com/auth/drive.file"])
+
+    # Ein Credentials-Objekt je Datei und Scope-Satz; jeder Client erhält nur seine eigenen Scopes
+    assert [scopes for _, scopes in loaded] == [
+        ("https://www.googleapis.com/auth/calendar.readonly",),
+        ("https://www.googleapis.com/auth/spreadsheets.readonly",),
+        ("https://www.googleapis.com/auth/drive.file",),
+    ]
+    assert built[0][1] is built[2][1]
+    assert built[1][1] is not built[0][1] and built[3][1] is not built[0][1]
+    # Discovery-Dokumente werden einmal geparst und wiederverwendet
+    assert built[0][0] is built[2][0]
+    assert built[0][0]["name"] == "calendar" and built[1][0]["name"] == "sheets"
+    assert get_discovery_document.cache_info().misses == 3
+
+
+def test_missing_static_document_falls_back_to_build(monkeypatch):
+    monkeypatch.setattr(service_account.Credentials, "from_service_account_file", lambda path, scopes=None: object())
+    monkeypatch.setattr(google_clients, "get_static_doc", lambda service, version: None)
+    monkeypatch.setattr(discovery, "build", lambda service, version, **kwargs: (service, version, kwargs["cache_discovery"]))
+    clear_google_client_cache()
+
+    assert build_service("unknown", "v1", "creds.json", ["scope"]) == ("unknown", "v1", False)
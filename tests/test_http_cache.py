@@ -0,0 +1,84 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
+from src.agents.data_fetchers.zenquotes_fetcher import ZenQuotesFetcher
+from src.utils import http_client
+from src.utils.http_cache import get_http_cache
+
+BODY = json.dumps({"value": "unchanged"}).encode()
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+
+    def do_GET(self):
+        ETagHandler.requests_seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class RevalidatingFetcher(BaseDataFetcher):
+    http_cache_enabled = True
+
+    def fetch_data(self):
+        return []
+
+
+class FreshFetcher(RevalidatingFetcher):
+    http_cache_ttl_seconds = 3600
+
+
+@pytest.fixture
+def server(monkeypatch):
+    ETagHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(http_client, "_shared_session", http_client.build_session(backoff_factor=0, backoff_jitter=0))
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_is_served_from_disk(server):
+    fetcher = RevalidatingFetcher("Dummy")
+    assert fetcher.http_get_json(f"{server}/data", params={"q": 1}) == {"value": "unchanged"}
+    assert fetcher.http_get_json(f"{server}/data", params={"q": 1}) == {"value": "unchanged"}
+
+    assert ETagHandler.requests_seen == [None, '"v1"']
+    stats = get_http_cache().stats
+    assert stats["revalidated"] == 1
+    assert stats["bytes_saved"] == len(BODY)
+
+
+def test_fresh_entries_skip_the_request(server):
+    fetcher = FreshFetcher("Dummy")
+    fetcher.http_get_json(f"{server}/fresh")
+    response = fetcher.http_get(f"{server}/fresh")
+
+    assert response.json() == {"value": "unchanged"}
+    assert ETagHandler.requests_seen == [None]
+    assert get_http_cache().stats["fresh_hits"] == 1
+
+
+def test_zenquotes_quote_is_valid_until_midnight():
+    ttl = ZenQuotesFetcher().http_cache_ttl()
+    assert 0 < ttl <= 24 * 3600
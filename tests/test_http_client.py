@@ -0,0 +1,65 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
+from src.utils import http_client
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = 0
+
+    def do_GET(self):
+        FlakyHandler.calls += 1
+        if FlakyHandler.calls == 1:
+            body = b"busy"
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+        elif self.path.startswith("/missing"):
+            body = b"not found"
+            self.send_response(404)
+        else:
+            body = json.dumps({"ok": True, "calls": FlakyHandler.calls}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DummyFetcher(BaseDataFetcher):
+    def fetch_data(self):
+        return []
+
+
+@pytest.fixture
+def server(monkeypatch):
+    FlakyHandler.calls = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(http_client, "_shared_session", http_client.build_session(backoff_factor=0, backoff_jitter=0))
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_http_get_json_retries_on_503(server):
+    fetcher = DummyFetcher("Dummy")
+    data = fetcher.http_get_json(f"{server}/data", params={"q": "x"})
+    assert data == {"ok": True, "calls": 2}
+    assert fetcher.http_session is http_client.get_http_session()
+
+
+def test_http_get_raises_for_client_errors(server):
+    fetcher = DummyFetcher("Dummy")
+    fetcher.http_get(f"{server}/warmup")
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetcher.http_get(f"{server}/missing")
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+# Großzügige Obergrenze für den Import des Orchestrators (gemessen ~0.35s, vorher ~1.8s)
+IMPORT_BUDGET_SECONDS = 1.5
+HEAVY_MODULES = ["openai", "langchain_openai", "langchain_core", "googleapiclient", "google.oauth2", "ebooklib"]
+
+
+def _import_report(module: str):
+    """Runs ``python -X importtime`` for ``module`` and returns (cumulative µs per module, loaded heavy modules)."""
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, rest = line.partition(":")
+        _, cum, name = (part.strip() for part in rest.split("|"))
+        cumulative[name] = int(cum)
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return cumulative, loaded
+
+
+def test_orchestrator_import_is_lazy_and_fast():
+    cumulative, loaded = _import_report("src.orchestrator")
+    slowest = sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:10]
+    report = "\n".join(f"{us / 1000:8.1f} ms  {name}" for name, us in slowest)
+    print(f"Import-Zeiten (kumuliert):\n{report}")
+
+    assert loaded == [], f"Schwere Client-Bibliotheken beim Import geladen: {loaded}\n{report}"
+    assert cumulative["src.orchestrator"] / 1_000_000 < IMPORT_BUDGET_SECONDS, report
+
+
+def test_lazy_components_are_built_once_and_only_when_configured(monkeypatch):
+    from src.agents.registry import LazyComponent
+
+    built = []
+
+    class Owner:
+        def _build(self):
+            built.append(1)
+            return object()
+
+        component = LazyComponent(_build, requires=["LAZY_TEST_KEY"], default=())
+
+    monkeypatch.delenv("LAZY_TEST_KEY", raising=False)
+    assert Owner().component == ()
+    assert built == []
+
+    monkeypatch.setenv("LAZY_TEST_KEY", "x")
+    owner = Owner()
+    assert owner.component is owner.component
+    assert built == [1]
+
+    owner.component = "override"
+    assert owner.component == "override"
@@ -0,0 +1,53 @@
+from src.agents.llm_processors.summarizer_agent import SummarizerAgent
+from src.utils.llm_cache import LLMResultCache
+
+
+class CountingChain:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, inputs, *args, **kwargs):
+        self.calls += 1
+        return f"Summary of {inputs['title']}"
+
+
+def test_cache_roundtrip_ttl_and_lru(tmp_path):
+    cache = LLMResultCache(str(tmp_path / "cache.sqlite"), ttl_seconds=60, max_entries=2)
+    key = LLMResultCache.make_key("Agent", "model", 0.2, "1", {"text": "a"})
+    assert key == LLMResultCache.make_key("Agent", "model", 0.2, "1", {"text": "a"})
+    assert key != LLMResultCache.make_key("Agent", "model", 0.2, "2", {"text": "a"})
+
+    assert cache.get(key) is None
+    cache.set(key, {"category": "IT"})
+    assert cache.get(key) == {"category": "IT"}
+
+    cache.set("expired", "x", ttl_seconds=-1)
+    assert cache.get("expired") is None
+
+    cache.set("b", "B")
+    cache.get(key)  # macht 'key' zum zuletzt genutzten Eintrag
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.get(key) == {"category": "IT"}
+    assert cache.evictions == 1
+    assert cache.stats["hits"] == 3
+
+
+def test_bypass_skips_lookup_but_refreshes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    LLMResultCache(path).set("k", "old")
+    bypassing = LLMResultCache(path, bypass=True)
+    assert bypassing.get("k") is None
+    bypassing.set("k", "new")
+    assert LLMResultCache(path).get("k") == "new"
+
+
+def test_processor_reuses_cached_results(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = SummarizerAgent()
+    agent.chain = CountingChain()
+    text = "Ein ausreichend langer Text über ein wichtiges Thema."
+    first = agent.summarize_article_text("Titel", text)
+    second = SummarizerAgent().summarize_article_text("Titel", text)
+    assert first == second == "Summary of Titel"
+    assert agent.chain.calls == 1
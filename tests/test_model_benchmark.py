@@ -0,0 +1,15 @@
+from benchmarks.model_benchmark import BENCHMARKS, compare, run_benchmarks
+
+
+def test_run_benchmarks_covers_every_benchmark():
+    report = run_benchmarks([20], repeats=1)
+    assert set(report["results"]) == set(BENCHMARKS)
+    assert all(values["20"] > 0 for values in report["results"].values())
+
+
+def test_compare_reports_regressions_beyond_tolerance():
+    baseline = {"results": {"httpurl": {"1000": 2.0}, "model_copy": {"1000": 4.0}}}
+    report = {"results": {"httpurl": {"1000": 2.4}, "model_copy": {"1000": 5.5}, "new": {"1000": 1.0}}}
+    regressions = compare(report, baseline, tolerance=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("model_copy @ 1000")
@@ -0,0 +1,65 @@
+import requests
+
+from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
+from src.models.data_models import RawArticle
+
+
+class DummyResp:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self, tokens=0):
+        self.calls += 1
+
+
+def _fake_pages(total, seen_pages):
+    def fake_get(self, url, params=None, **kwargs):
+        page, size = params["page"], params["pageSize"]
+        seen_pages.append(page)
+        first = (page - 1) * size
+        articles = [
+            {"title": f"Artikel {i}", "url": f"https://news.example/{i}", "source": {"name": "Example"}}
+            for i in range(first, min(first + size, total))
+        ]
+        return DummyResp({"status": "ok", "totalResults": total, "articles": articles})
+    return fake_get
+
+
+def test_iter_articles_pages_until_max_articles(monkeypatch):
+    seen_pages = []
+    monkeypatch.setenv("NEWSAPI_API_KEY", "dummy")
+    monkeypatch.setattr(requests.Session, "get", _fake_pages(50, seen_pages))
+    limiter = CountingLimiter()
+    fetcher = NewsAPIFetcher(query="test", page_size=10, max_articles=25, rate_limiter=limiter)
+
+    articles = list(fetcher.iter_articles())
+
+    assert [a.title for a in articles] == [f"Artikel {i}" for i in range(25)]
+    assert all(isinstance(a, RawArticle) for a in articles)
+    assert seen_pages == [1, 2, 3]
+    assert limiter.calls == 3
+
+
+def test_iter_articles_stops_at_total_results(monkeypatch):
+    seen_pages = []
+    monkeypatch.setenv("NEWSAPI_API_KEY", "dummy")
+    monkeypatch.setattr(requests.Session, "get", _fake_pages(12, seen_pages))
+    fetcher = NewsAPIFetcher(query="test", page_size=10, max_articles=100)
+
+    assert len(fetcher.fetch_data()) == 12
+    assert seen_pages == [1, 2]
+    # Ohne max_articles bleibt es bei einer Seite wie bisher
+    assert len(NewsAPIFetcher(query="test", page_size=10).fetch_data()) == 10
@@ -22,3 +22,41 @@ def test_fetch_events(monkeypatch):
     assert len(events) == 1
     assert isinstance(events[0], Event)
     assert events[0].summary == "Link Event"
+
+
+class SlowCountingClient:
+    calls = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    class responses:
+        @staticmethod
+        def create(model=None, tools=None, input=None, temperature=0.2):
+            import time
+            SlowCountingClient.calls.append(input)
+            if "slow.example" in input:
+                time.sleep(1.0)
+            else:
+                time.sleep(0.2)
+            data = '[{"title": "Event", "start_time": "2025-01-02", "url": "http://example.com"}]'
+            return DummyResp(data)
+
+
+def test_sites_are_searched_concurrently_and_cached(monkeypatch):
+    import time
+    SlowCountingClient.calls = []
+    monkeypatch.setattr("src.agents.data_fetchers.openai_link_event_fetcher.OpenAI", SlowCountingClient)
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    urls = ["a.example", "b.example", "c.example", "slow.example"]
+    fetcher = OpenAILinkEventFetcher(urls=urls, max_concurrency=4, site_timeout=0.5)
+
+    start = time.monotonic()
+    events = fetcher.fetch_data()
+    assert time.monotonic() - start < 0.8
+    # Die langsame Seite wird übersprungen, die übrigen Ergebnisse bleiben erhalten
+    assert len(events) == 3
+
+    SlowCountingClient.calls = []
+    assert len(fetcher.fetch_data()) == 3
+    assert len(SlowCountingClient.calls) == 1  # nur die zuvor abgebrochene Seite wird erneut gesucht
@@ -13,7 +13,7 @@ sample_response = {
     ]
 }
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_weather(mock_get):
     mock_get.return_value.json.return_value = sample_response
     mock_get.return_value.raise_for_status.return_value = None
@@ -0,0 +1,48 @@
+import json
+import os
+
+import requests
+
+from benchmarks.mock_server import MockAPIServer, MockConfig
+from benchmarks.pipeline_benchmark import percentile, run_benchmark
+
+
+def test_percentile_nearest_rank():
+    values = [5.0, 1.0, 3.0, 2.0, 4.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 5.0
+    assert percentile([], 50) == 0.0
+
+
+def test_mock_server_answers_like_the_apis():
+    with MockAPIServer(MockConfig(article_count=5)) as server:
+        urls = server.urls()
+        page = requests.get(urls["newsapi"] + "everything", params={"q": "ai", "pageSize": 3, "page": 2}).json()
+        assert page["totalResults"] == 5
+        assert len(page["articles"]) == 2
+
+        prompt = "EVENTS:\n[0]\nA\n\n[1]\nB\nReturn a JSON array of objects with keys \"index\" and \"score\""
+        reply = requests.post(
+            urls["openai"] + "/chat/completions",
+            json={"model": "gpt-test", "messages": [{"role": "user", "content": prompt}]},
+        ).json()
+        scores = json.loads(reply["choices"][0]["message"]["content"])
+        assert [s["index"] for s in scores] == [0, 1]
+        assert reply["usage"]["total_tokens"] > 0
+
+
+def test_mock_server_error_rate():
+    with MockAPIServer(MockConfig(error_rate=1.0)) as server:
+        response = requests.get(server.urls()["zenquotes"])
+    assert response.status_code == 503
+    assert server.error_count == 1
+
+
+def test_run_benchmark_end_to_end():
+    env_before = dict(os.environ)
+    report = run_benchmark([6], repeats=1, trace_memory=False, warmup=False)
+    entry = report["results"][0]
+    assert entry["summarized"] == 6
+    assert entry["llm_calls"] > 0
+    assert {"news_fetch", "summarize", "compose"} <= set(entry["stages"])
+    assert dict(os.environ) == env_before
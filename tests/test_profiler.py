@@ -0,0 +1,44 @@
+import json
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from src.agents.data_fetchers.base_fetcher import BaseDataFetcher
+from src.agents.llm_processors.base_processor import TokenUsageCallback
+from src.utils.profiler import RunProfiler, profile_section
+from src.utils.usage_ledger import record_openai_usage
+
+
+class DummyFetcher(BaseDataFetcher):
+    def fetch_data(self):
+        with profile_section("parse", "step"):
+            record_openai_usage("Dummy", "gpt-test", SimpleNamespace(input_tokens=100, output_tokens=20))
+        return [1, 2, 3]
+
+
+def test_profiler_records_sections_items_and_tokens(tmp_path):
+    profiler = RunProfiler(run_id="test")
+    with profiler.activate():
+        with profile_section("events_fetch", "stage"):
+            assert DummyFetcher("Dummy-Quelle").fetch_data() == [1, 2, 3]
+        TokenUsageCallback().on_llm_end(
+            LLMResult(
+                generations=[[ChatGeneration(message=AIMessage(content="ok"))]],
+                llm_output={"token_usage": {"prompt_tokens": 7, "completion_tokens": 3}},
+            )
+        )
+    # Ohne aktiven Profiler wird nichts gemessen
+    assert DummyFetcher("Dummy-Quelle").fetch_data() == [1, 2, 3]
+
+    spans = {span.name: span for span in profiler.spans}
+    assert set(spans) == {"parse", "Dummy-Quelle.fetch_data", "events_fetch"}
+    fetch = spans["Dummy-Quelle.fetch_data"]
+    assert fetch.category == "fetcher"
+    assert fetch.items == 3
+    assert fetch.parent is spans["events_fetch"]
+    assert spans["events_fetch"].prompt_tokens == 100
+
+    report = json.loads(open(profiler.write_report(str(tmp_path))).read())
+    assert report["totals"] == {"llm_calls": 2, "prompt_tokens": 107, "completion_tokens": 23}
+    assert "Dummy-Quelle.fetch_data" in profiler.summary_table()
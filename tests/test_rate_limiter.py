@@ -0,0 +1,32 @@
+from src.utils.rate_limiter import RateLimiter, TokenBucket, estimate_tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_reservation_and_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=2, refill_per_second=1, clock=clock)
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 1.0  # dritte Anfrage muss eine Sekunde warten
+    clock.now = 3.0
+    assert bucket.reserve(1) == 0.0
+
+
+def test_rate_limiter_uses_strictest_bucket():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, clock=clock)
+    assert limiter._reserve(600) == 0.0
+    # Requests wären noch frei, aber das Token-Budget ist aufgebraucht: 100 Tokens bei 10 Tokens/s
+    assert limiter._reserve(100) == 10.0
+
+
+def test_estimate_tokens():
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens("a" * 400) == 100
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import HttpUrl
+
+from benchmarks.snapshot_benchmark import DATASETS, run_benchmark
+from src.models.data_models import Event, ProcessedArticle, TodoItem, WeatherInfo
+from src.utils import snapshot
+
+
+def _articles():
+    return [
+        ProcessedArticle(
+            title="Eins",
+            url="https://example.com/1",
+            summary="S",
+            category="IT & AI",
+            relevance_score=7.5,
+            source_name="Heise",
+            published_at=datetime(2025, 6, 4, 8, 30, tzinfo=timezone(timedelta(hours=2))),
+            llm_processing_details={"model": "gpt", "tokens": [1, 2]},
+            related_sources=["NZZ", "Heise"],
+        ),
+        ProcessedArticle(title="Zwei", summary="Ä ö 😀", source_name="Heise", relevance_score=None),
+    ]
+
+
+def test_round_trip_trusted_and_validated():
+    value = {
+        "articles": _articles(),
+        "events": [Event(summary="Meetup", start_time="2025-06-05T18:00:00Z", url="https://e.example.com/x", source="Eventbrite")],
+        "weather": WeatherInfo(location="Zürich", temperature_celsius=21.5, condition="Sonnig"),
+        "todos": [TodoItem(content="Einkaufen"), TodoItem(id=3, content="Zahlen")],
+        "empty": [],
+        "meta": ["run", 1, None],
+    }
+    data = snapshot.dumps(value)
+    assert data.startswith(snapshot.MAGIC)
+
+    for trusted in (False, True):
+        loaded = snapshot.loads(data, trusted=trusted)
+        assert loaded == value
+        article = loaded["articles"][0]
+        assert isinstance(article.url, HttpUrl)
+        assert article.published_at.utcoffset() == timedelta(hours=2)
+        assert loaded["articles"][1].url is None and loaded["articles"][1].published_at is None
+        assert article.model_dump_json() == value["articles"][0].model_dump_json()
+        # Listen und Dicts der Modelle dürfen nicht zwischen Instanzen geteilt werden
+        article.related_sources.append("X")
+        assert loaded["articles"][1].related_sources == []
+
+
+def test_invalid_data_raises_value_error():
+    with pytest.raises(ValueError):
+        snapshot.loads(b"kein snapshot")
+    with pytest.raises(ValueError):
+        snapshot.loads(snapshot.dumps(_articles())[:-10])
+    with pytest.raises(TypeError):
+        snapshot.dumps({"x": object()})
+
+
+def test_benchmark_round_trips_every_dataset():
+    report = run_benchmark([20], repeats=1)
+    assert set(report["results"]) == set(DATASETS)
+    formats = report["results"]["ProcessedArticle"]
+    assert formats["snapshot"]["20"]["bytes"] < formats["json_lines"]["20"]["bytes"]
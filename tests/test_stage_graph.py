@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+from src.utils.stage_graph import StageGraph, StageExecutionError
+
+
+def test_independent_branches_overlap_and_join():
+    both_started = threading.Barrier(2, timeout=2)
+    calls = []
+
+    def branch(name, value):
+        def run(**kwargs):
+            both_started.wait()  # schlägt fehl, wenn die Zweige nacheinander laufen
+            calls.append(name)
+            return value
+        return run
+
+    graph = StageGraph(max_workers=2)
+    graph.add_stage("a", branch("a", 1))
+    graph.add_stage("b", branch("b", 2))
+    graph.add_stage("join", lambda a, b: a + b, ["a", "b"])
+    results = graph.run()
+
+    assert results["join"] == 3
+    assert sorted(calls) == ["a", "b"]
+    assert set(graph.timings) == {"a", "b", "join"}
+
+
+def test_rerun_single_stage_and_downstream():
+    counter = {"source": 0}
+
+    def source():
+        counter["source"] += 1
+        return counter["source"]
+
+    graph = StageGraph()
+    graph.add_stage("source", source)
+    graph.add_stage("double", lambda source: source * 2, ["source"])
+    graph.run()
+    assert graph.results["double"] == 2
+
+    assert graph.rerun("double") == 2
+    assert counter["source"] == 1
+
+    graph.rerun("source", downstream=True)
+    assert graph.results["double"] == 4
+
+
+def test_failure_skips_dependents_and_preloaded_stages_are_not_run():
+    def broken():
+        raise ValueError("kaputt")
+
+    graph = StageGraph()
+    graph.add_stage("broken", broken)
+    graph.add_stage("after", lambda broken: "never", ["broken"])
+    with pytest.raises(StageExecutionError) as exc_info:
+        graph.run()
+    assert exc_info.value.stage == "broken"
+    assert "after" not in graph.results
+
+    results = graph.run(preloaded={"broken": "cached"})
+    assert results["after"] == "never"
+
+    results = graph.run(preloaded={"after": "restored"})
+    assert results == {"after": "restored"}
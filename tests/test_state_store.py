@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from src.agents.data_fetchers.newsapi_fetcher import NewsAPIFetcher
+from src.models.data_models import ProcessedArticle
+from src.utils.state_store import FetchStateStore, article_key
+
+
+class DummyResp:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+def test_watermark_only_moves_forward_and_history_roundtrip(tmp_path):
+    store = FetchStateStore(str(tmp_path / "state.sqlite"))
+    now = datetime.now(timezone.utc)
+    store.record_fetch("cfg", now, ["a", "b"])
+    store.record_fetch("cfg", now - timedelta(hours=5), ["c"])
+    assert store.get_watermark("cfg").timestamp() == now.timestamp()
+    assert store.seen_keys("cfg") == {"a", "b", "c"}
+    assert store.get_watermark("other") is None
+
+    old = ProcessedArticle(title="Alt", summary="s", url="https://example.com/old", published_at=now - timedelta(days=3))
+    recent = ProcessedArticle(title="Neu", summary="s", url="https://example.com/new", published_at=now, article_text="Text")
+    store.save_processed([old, recent])
+
+    loaded = store.load_processed(now - timedelta(hours=24))
+    assert [a.title for a in loaded] == ["Neu"]
+    assert loaded[0].article_text == "Text"
+    assert store.load_processed(now - timedelta(hours=24), exclude={article_key(recent.url)}) == []
+
+
+def test_fetcher_skips_articles_from_previous_runs(tmp_path, monkeypatch):
+    requested = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        requested.append(params.get("from"))
+        articles = [
+            {"title": f"Artikel {i}", "url": f"https://news.example/{i}", "publishedAt": f"2030-01-0{i + 1}T10:00:00Z"}
+            for i in range(3)
+        ]
+        return DummyResp({"status": "ok", "totalResults": 3, "articles": articles})
+
+    monkeypatch.setenv("NEWSAPI_API_KEY", "dummy")
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    store = FetchStateStore(str(tmp_path / "state.sqlite"))
+
+    fetcher = NewsAPIFetcher(query="test", page_size=10, state_store=store)
+    assert len(fetcher.fetch_data()) == 3
+    # Ohne Bestätigung (z.B. abgebrochener Lauf) werden die Artikel erneut geliefert
+    assert len(NewsAPIFetcher(query="test", page_size=10, state_store=store).fetch_data()) == 3
+    fetcher.commit_state()
+
+    rerun = NewsAPIFetcher(query="test", page_size=10, state_store=store)
+    assert rerun.fetch_data() == []
+    assert requested[-1] == "2030-01-03T10:00:00"
+
+
+def test_failed_articles_are_fetched_again(tmp_path, monkeypatch):
+    requested = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        requested.append(params.get("from"))
+        articles = [
+            {"title": f"Artikel {i}", "url": f"https://news.example/{i}", "publishedAt": f"2030-01-0{i + 1}T10:00:00Z"}
+            for i in range(3)
+        ]
+        return DummyResp({"status": "ok", "totalResults": 3, "articles": articles})
+
+    monkeypatch.setenv("NEWSAPI_API_KEY", "dummy")
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    store = FetchStateStore(str(tmp_path / "state.sqlite"))
+
+    fetcher = NewsAPIFetcher(query="test", page_size=10, state_store=store)
+    fetched = fetcher.fetch_data()
+    # Die Zusammenfassung von Artikel 1 ist fehlgeschlagen
+    fetcher.commit_state([article_key(a.url) for a in fetched if a.title == "Artikel 1"])
+
+    rerun = NewsAPIFetcher(query="test", page_size=10, state_store=store)
+    assert [a.title for a in rerun.fetch_data()] == ["Artikel 1"]
+    assert requested[-1] == "2030-01-02T09:59:59"
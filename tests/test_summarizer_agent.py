@@ -0,0 +1,66 @@
+import asyncio
+
+from src.agents.llm_processors.summarizer_agent import SummarizerAgent, SummaryPrefetcher
+from src.models.data_models import RawArticle
+
+
+class DummyAsyncChain:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def ainvoke(self, inputs, *args, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            # Spätere Artikel antworten schneller, damit die Reihenfolge geprüft wird
+            await asyncio.sleep(0.05 if inputs["title"] == "T0" else 0.01)
+            if inputs["title"] == "T2":
+                raise RuntimeError("rate limited")
+            return f"Summary {inputs['title']} "
+        finally:
+            self.active -= 1
+
+
+def test_concurrent_batch_keeps_order_and_isolates_failures(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = SummarizerAgent(max_concurrency=2)
+    agent.chain = DummyAsyncChain()
+    articles = [
+        RawArticle(title=f"T{i}", description="Eine ausreichend lange Beschreibung des Artikels.")
+        for i in range(5)
+    ]
+
+    processed = agent.process_batch(articles)
+
+    assert [p.title for p in processed] == ["T0", "T1", "T2", "T3", "T4"]
+    assert processed[0].summary == "Summary T0"
+    assert processed[2].summary == "Zusammenfassung fehlgeschlagen (LLM-Fehler)."
+    assert agent.chain.max_active == 2
+
+
+class DummySyncChain:
+    def __init__(self):
+        self.calls = []
+
+    def invoke(self, inputs, *args, **kwargs):
+        self.calls.append(inputs["title"])
+        return f"Summary {inputs['title']}"
+
+
+def test_prefetcher_summarizes_each_article_once(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = SummarizerAgent(max_concurrency=2)
+    agent.chain = DummySyncChain()
+    first = RawArticle(title="T0", url="https://example.com/0", description="Eine ausreichend lange Beschreibung.")
+    second = RawArticle(title="T1", url="https://example.com/1", description="Noch eine ausreichend lange Beschreibung.")
+
+    prefetcher = SummaryPrefetcher(agent)
+    prefetcher.submit(first)
+    prefetcher.submit(first)
+    results = prefetcher.take([first, second])
+    prefetcher.close()
+
+    assert results[0].summary == "Summary T0"
+    assert results[1] is None
+    assert agent.chain.calls == ["T0"]
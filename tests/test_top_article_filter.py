@@ -23,9 +23,13 @@ class DummyWriter:
         self.received = []
         self.model_name = "dummy"
 
-    def process_batch(self, arts):
+    def process_batch(self, arts, on_article_done=None):
         self.received = arts
-        return [f"text{idx}" for idx, _ in enumerate(arts)]
+        texts = [f"text{idx}" for idx, _ in enumerate(arts)]
+        # Fertigstellung in umgekehrter Reihenfolge, wie bei parallel geschriebenen Artikeln möglich
+        for idx in reversed(range(len(arts))):
+            on_article_done(idx, arts[idx], texts[idx])
+        return texts
 
 def test_only_top_articles_written():
     orch = object.__new__(NewsletterOrchestrator)
@@ -33,14 +37,17 @@ def test_only_top_articles_written():
     orch.categorizer = DummyCategorizer([9, 2, 8])
     orch.article_writer = DummyWriter()
     orch.top_article_count = 2
+    orch.summary_prefetcher = None
 
     raws = [RawArticle(title=f"T{i}") for i in range(3)]
-    processed = orch._process_articles_with_llm(raws)
+    processed = orch._write_top_articles(orch._categorize_articles(orch._summarize_articles(raws)))
 
     assert len(orch.article_writer.received) == 2
     titles = [a.title for a in orch.article_writer.received]
     assert titles == ["T0", "T2"]
 
-    assert processed[0].article_text is not None
+    assert processed[0].article_text == "text0"
+    assert processed[2].article_text == "text1"
+    assert processed[1].article_text is None
     assert processed[2].article_text is not None
     assert processed[1].article_text is None
@@ -0,0 +1,94 @@
+import uuid
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from src.agents.llm_processors.base_processor import TokenUsageCallback
+from src.agents.llm_processors.event_filter_agent import EventFilterAgent
+from src.models.data_models import Event, ProcessedArticle
+from src.orchestrator import NewsletterOrchestrator
+from src.utils.event_prefilter import EventPrefilter
+from src.utils.usage_ledger import UsageLedger, parse_prices, record_llm_call
+
+
+def test_ledger_aggregates_per_agent_and_model():
+    ledger = UsageLedger(token_budget=1000, prices=parse_prices("gpt-a:1:2, kaputt"))
+    with ledger.activate():
+        record_llm_call("SummarizerAgent", "gpt-a", 300, 100, 0.5)
+        callback = TokenUsageCallback("CategorizerAgent", "gpt-b")
+        run_id = uuid.uuid4()
+        callback.on_chat_model_start({}, [], run_id=run_id)
+        callback.on_llm_end(
+            LLMResult(generations=[[ChatGeneration(message=AIMessage(
+                content="ok", usage_metadata={"input_tokens": 50, "output_tokens": 10, "total_tokens": 60}
+            ))]]),
+            run_id=run_id,
+        )
+    record_llm_call("Ignoriert", "gpt-a", 999, 999)  # kein aktiver Ledger
+
+    summary = ledger.summary()
+    assert summary["calls"] == 2
+    assert summary["total_tokens"] == 460
+    assert summary["by_agent"]["CategorizerAgent"]["prompt_tokens"] == 50
+    assert summary["by_agent"]["CategorizerAgent"]["latency_seconds"] >= 0
+    assert summary["by_model"]["gpt-a"]["cost_usd"] == (300 * 1 + 100 * 2) / 1_000_000
+    assert summary["by_model"]["gpt-b"]["cost_usd"] is None
+    assert ledger.remaining_tokens() == 540
+    assert ledger.can_afford(540) and not ledger.can_afford(541)
+
+
+class DummyWriter:
+    model_name = "dummy"
+    ESTIMATED_TOKENS_PER_ARTICLE = 200
+
+    def __init__(self):
+        self.received = []
+
+    def process_batch(self, arts, on_article_done=None):
+        self.received = arts
+        for idx, art in enumerate(arts):
+            on_article_done(idx, art, "text")
+        return ["text" for _ in arts]
+
+
+def test_budget_limits_written_articles():
+    orch = object.__new__(NewsletterOrchestrator)
+    orch.article_writer = DummyWriter()
+    orch.top_article_count = 3
+    articles = [ProcessedArticle(title=f"T{i}", summary="s", relevance_score=10 - i) for i in range(3)]
+
+    ledger = UsageLedger(token_budget=1000)
+    ledger.record("SummarizerAgent", "gpt-a", 500, 50)
+    with ledger.activate():
+        orch._write_top_articles(articles)
+
+    assert [a.title for a in orch.article_writer.received] == ["T0", "T1"]
+
+
+class FailingChain:
+    def invoke(self, *args, **kwargs):
+        raise AssertionError("Ohne Budget darf kein Termin bewertet werden")
+
+
+def test_spent_budget_keeps_only_events_that_need_no_llm_score(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    agent = EventFilterAgent(batch_size=10)
+    agent.chain = agent.batch_chain = FailingChain()
+    events = [
+        Event(summary="Python Meetup", source="x"),
+        Event(summary="Bekannt gut", source="x"),
+        Event(summary="Bekannt langweilig", source="x"),
+        Event(summary="Unbekannt", source="x"),
+    ]
+    agent._store_score(events[1], 8.0)
+    agent._store_score(events[2], 2.0)
+    orch = object.__new__(NewsletterOrchestrator)
+    orch.event_filter = agent
+    prefiltered = EventPrefilter(max_days_ahead=None, allow_keywords=["python"]).apply(events)
+
+    ledger = UsageLedger(token_budget=100)
+    ledger.record("SummarizerAgent", "gpt-a", 90, 5)
+    with ledger.activate():
+        kept = orch._filter_events(prefiltered)
+
+    assert [e.summary for e in kept] == ["Python Meetup", "Bekannt gut"]
@@ -12,9 +12,9 @@ class DummyResp:
         return self._data
 
 def test_fetch_quote(monkeypatch):
-    def fake_get(url, timeout=10):
+    def fake_get(self, url, timeout=10, **kwargs):
         return DummyResp([{"q": "Be yourself", "a": "Anon"}])
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
     fetcher = ZenQuotesFetcher()
     quotes = fetcher.fetch_data()
     assert len(quotes) == 1